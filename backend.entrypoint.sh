@@ -39,5 +39,8 @@ else:
 EOF
 
 python manage.py rqworker default &
+python manage.py rqworker emails --worker-class rq.worker.SimpleWorker --with-scheduler &
+python manage.py rqworker stats &
+python manage.py rqcron &
 
 exec gunicorn core.wsgi:application --bind 0.0.0.0:8000
@@ -0,0 +1,32 @@
+import fakeredis
+import pytest
+from unittest.mock import patch
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty shared and process-local caches."""
+    from user_auth_app.api.cache import local_user_cache, validated_token_cache
+
+    cache.clear()
+    local_user_cache.clear()
+    validated_token_cache.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def redis_connection():
+    """Serve raw Redis connections from a fresh in-memory fake per test."""
+    connection = fakeredis.FakeRedis()
+    with patch('django_redis.get_redis_connection', return_value=connection):
+        yield connection
+
+
+@pytest.fixture(autouse=True)
+def static_files_storage(settings):
+    """Resolve static files without the manifest that collectstatic writes in production."""
+    settings.STORAGES = {
+        **settings.STORAGES,
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
@@ -1,13 +1,29 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from .api.search import SEARCH_ORDERING, search_videos
 from .models import Video
 
 
+class VideoChangeList(ChangeList):
+    """Change list that keeps search results in relevance order."""
+    
+    def get_queryset(self, request, exclude_parameters=None):
+        """Order searches by rank, or by the clicked column header first."""
+        queryset = super().get_queryset(request, exclude_parameters)
+        if not self.query.strip():
+            return queryset
+        if ORDER_VAR in self.params:
+            return queryset.order_by(*self.get_ordering(request, queryset))
+        return queryset.order_by(*SEARCH_ORDERING, '-pk')
+
+
 @admin.register(Video)
 class VideoAdmin(admin.ModelAdmin):
     """Admin interface for the Video model with HLS streaming support."""
     
     list_display = ('title', 'genre', 'upload_date', 'has_thumbnail', 'hls_status')
-    search_fields = ('title', 'description', 'genre')
+    # Searched through the full-text index in get_search_results, not icontains.
+    search_fields = ('title', 'description')
     list_filter = ('genre', 'upload_date')
     ordering = ('-upload_date',)
     
@@ -35,12 +51,12 @@ class VideoAdmin(admin.ModelAdmin):
             'description': 'HLS manifest files for adaptive streaming (auto-generated)'
         }),
         ('Metadata', {
-            'fields': ('upload_date',),
+            'fields': ('upload_date', 'content_hash', 'media_info', 'popularity'),
             'classes': ('collapse',),
         }),
     )
     
-    readonly_fields = ('upload_date',)
+    readonly_fields = ('upload_date', 'content_hash', 'media_info', 'popularity')
 
     def thumbnail_preview(self, obj):
         """Show thumbnail preview in admin."""
@@ -84,6 +100,16 @@ class VideoAdmin(admin.ModelAdmin):
         else:
             return f"Partial ({processed_count}/3)"
     
+    def get_search_results(self, request, queryset, search_term):
+        """Use the same full-text search as the public search endpoint."""
+        if not search_term.strip():
+            return queryset, False
+        return search_videos(queryset, search_term), False
+    
+    def get_changelist(self, request, **kwargs):
+        """Use the change list that keeps the search ranking."""
+        return VideoChangeList
+    
     def get_queryset(self, request):
         """Optimize queryset for admin list view."""
         return super().get_queryset(request).select_related()
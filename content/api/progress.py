@@ -0,0 +1,290 @@
+import datetime
+import logging
+import time
+
+import django_redis
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from redis.exceptions import LockError, RedisError, ResponseError
+
+from ..models import Video, WatchProgress
+
+logger = logging.getLogger(__name__)
+
+VIDEO_EXISTS_TTL = 300
+FLUSH_LOCK_TIMEOUT = 600
+
+
+def _pending_key() -> str:
+    return cache.make_key('watch_progress:pending')
+
+
+def _flushing_key() -> str:
+    return cache.make_key('watch_progress:flushing')
+
+
+def _flush_lock_key() -> str:
+    return cache.make_key('watch_progress:flush_lock')
+
+
+def _continue_watching_keys(user_id) -> tuple:
+    key = cache.make_key(f'continue_watching:{user_id}')
+    return key, f'{key}:position'
+
+
+def _field(user_id, video_id) -> str:
+    return f'{user_id}:{video_id}'
+
+
+def _from_timestamp(timestamp: float) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+
+
+def _parse(value) -> tuple:
+    if isinstance(value, bytes):
+        value = value.decode()
+    position, timestamp = value.split(':')
+    return float(position), _from_timestamp(float(timestamp))
+
+
+def video_exists(video_id) -> bool:
+    """Check that a video exists, remembering positive answers so heartbeats skip the database."""
+    key = f'video_exists:{video_id}'
+    if cache.get(key):
+        return True
+    exists = Video.objects.filter(pk=video_id).exists()
+    if exists:
+        cache.set(key, True, VIDEO_EXISTS_TTL)
+    return exists
+
+
+def record_progress(user_id, video_id, position: float) -> tuple:
+    """
+    Buffer a playback heartbeat in Redis.
+
+    Only the latest position per user and video is kept; `flush_progress`
+    writes it to the database later. If Redis is unavailable the position
+    is written to the database directly.
+
+    Args:
+        user_id: Id of the watching user.
+        video_id: Id of the watched video.
+        position (float): Playback position in seconds.
+
+    Returns:
+        tuple: The stored (position, updated_at).
+    """
+    now = time.time()
+    try:
+        connection = django_redis.get_redis_connection('default')
+        connection.hset(_pending_key(), _field(user_id, video_id), f'{position}:{now}')
+    except RedisError:
+        logger.warning('Watch progress written directly, Redis is unavailable.', exc_info=True)
+        progress, _ = WatchProgress.objects.update_or_create(
+            user_id=user_id, video_id=video_id,
+            defaults={'position': position, 'updated_at': timezone.now()},
+        )
+        return progress.position, progress.updated_at
+    return position, _from_timestamp(now)
+
+
+def get_progress(user_id, video_id):
+    """
+    Return the latest (position, updated_at) of a user in a video, or None.
+
+    Buffered heartbeats take precedence over the database, including those
+    of a flush that is still running.
+    """
+    field = _field(user_id, video_id)
+    try:
+        connection = django_redis.get_redis_connection('default')
+        pipeline = connection.pipeline(transaction=False)
+        pipeline.hget(_pending_key(), field)
+        pipeline.hget(_flushing_key(), field)
+        buffered = [value for value in pipeline.execute() if value is not None]
+    except RedisError:
+        logger.warning('Watch progress read from the database, Redis is unavailable.', exc_info=True)
+        buffered = []
+    if buffered:
+        return _parse(buffered[0])
+
+    return (
+        WatchProgress.objects
+        .filter(user_id=user_id, video_id=video_id)
+        .values_list('position', 'updated_at')
+        .first()
+    )
+
+
+def flush_progress(batch_size: int) -> int:
+    """
+    Write buffered heartbeats to the database in batched upserts.
+
+    The pending hash is renamed first, so heartbeats arriving during the flush
+    start a new hash and are not lost when the flushed one is deleted. A hash
+    left behind by a failed flush is written before the pending one.
+
+    Only one flush runs at a time; an overlapping run would rename the
+    pending hash over, or delete, the hash the other one is still writing.
+    The lock expires after FLUSH_LOCK_TIMEOUT seconds if a worker dies.
+
+    Args:
+        batch_size (int): Rows per INSERT ... ON CONFLICT statement.
+
+    Returns:
+        int: Number of progress rows written, 0 if another flush is running.
+    """
+    connection = django_redis.get_redis_connection('default')
+    lock = connection.lock(_flush_lock_key(), timeout=FLUSH_LOCK_TIMEOUT, blocking=False)
+    if not lock.acquire():
+        logger.info('Watch progress flush skipped, another flush is running.')
+        return 0
+    try:
+        flushing = _flushing_key()
+        written = 0
+        if connection.exists(flushing):
+            written += _flush_hash(connection, flushing, batch_size)
+        try:
+            connection.rename(_pending_key(), flushing)
+        except ResponseError:
+            return written
+        return written + _flush_hash(connection, flushing, batch_size)
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            logger.warning('Watch progress flush outlived its lock.')
+
+
+def _flush_hash(connection, key: str, batch_size: int) -> int:
+    written = 0
+    # HSCAN may return a field twice; one upsert must not touch the same row twice.
+    batch = {}
+    for field, value in connection.hscan_iter(key, count=batch_size):
+        batch[field] = value
+        if len(batch) >= batch_size:
+            written += _write_batch(batch)
+            batch = {}
+    if batch:
+        written += _write_batch(batch)
+    connection.delete(key)
+    return written
+
+
+def _write_batch(batch) -> int:
+    rows = []
+    for field, value in batch.items():
+        if isinstance(field, bytes):
+            field = field.decode()
+        user_id, video_id = (int(part) for part in field.split(':'))
+        position, updated_at = _parse(value)
+        rows.append(WatchProgress(
+            user_id=user_id, video_id=video_id, position=position, updated_at=updated_at))
+
+    # Users or videos deleted since the heartbeat would violate the foreign keys.
+    user_ids = set(get_user_model().objects.filter(
+        pk__in={row.user_id for row in rows}).values_list('pk', flat=True))
+    media_info = dict(Video.objects.filter(
+        pk__in={row.video_id for row in rows}).values_list('pk', 'media_info'))
+    rows = [row for row in rows if row.user_id in user_ids and row.video_id in media_info]
+
+    WatchProgress.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=['user', 'video'],
+        update_fields=['position', 'updated_at'],
+    )
+    _update_continue_watching(rows, media_info)
+    return len(rows)
+
+
+def _is_finished(position: float, media_info) -> bool:
+    duration = (media_info or {}).get('duration')
+    return bool(duration) and position >= duration * settings.WATCH_PROGRESS['FINISHED_RATIO']
+
+
+def _update_continue_watching(rows, media_info: dict):
+    """
+    Apply flushed positions to the per-user continue-watching sorted sets.
+
+    Each set is scored by the time of the last heartbeat, with the position
+    kept in a companion hash. Finished videos are removed. Sets that do not
+    exist are left alone and rebuilt from the database on the next read.
+    """
+    connection = django_redis.get_redis_connection('default')
+    keys = {row.user_id: _continue_watching_keys(row.user_id) for row in rows}
+    existing = connection.pipeline(transaction=False)
+    for set_key, _ in keys.values():
+        existing.exists(set_key)
+    cached_users = {user_id for user_id, found in zip(keys, existing.execute()) if found}
+
+    pipeline = connection.pipeline(transaction=False)
+    for row in rows:
+        if row.user_id not in cached_users:
+            continue
+        set_key, position_key = keys[row.user_id]
+        if _is_finished(row.position, media_info.get(row.video_id)):
+            pipeline.zrem(set_key, row.video_id)
+            pipeline.hdel(position_key, row.video_id)
+        else:
+            pipeline.zadd(set_key, {row.video_id: row.updated_at.timestamp()})
+            pipeline.hset(position_key, row.video_id, row.position)
+    for user_id in cached_users:
+        for key in keys[user_id]:
+            pipeline.expire(key, settings.WATCH_PROGRESS['CONTINUE_WATCHING_TTL'])
+    pipeline.execute()
+
+
+def _load_continue_watching(user_id) -> list:
+    progress = (
+        WatchProgress.objects
+        .filter(user_id=user_id)
+        .values_list('video_id', 'position', 'updated_at', 'video__media_info')
+    )
+    return [
+        (video_id, position, updated_at)
+        for video_id, position, updated_at, media_info in progress
+        if not _is_finished(position, media_info)
+    ]
+
+
+def get_continue_watching(user_id, limit: int) -> list:
+    """
+    Return the videos a user has started but not finished, most recent first.
+
+    Served from the user's sorted set; a missing set is rebuilt from the
+    database once and then kept up to date by `flush_progress`.
+
+    Args:
+        user_id: Id of the user.
+        limit (int): Maximum number of entries.
+
+    Returns:
+        list: (video_id, position, updated_at) tuples.
+    """
+    set_key, position_key = _continue_watching_keys(user_id)
+    try:
+        connection = django_redis.get_redis_connection('default')
+        entries = connection.zrevrange(set_key, 0, limit - 1, withscores=True)
+        if entries:
+            positions = connection.hmget(position_key, [video_id for video_id, _ in entries])
+            return [
+                (int(video_id), float(position or 0), _from_timestamp(score))
+                for (video_id, score), position in zip(entries, positions)
+            ]
+    except RedisError:
+        logger.warning('Continue watching read from the database, Redis is unavailable.', exc_info=True)
+        connection = None
+
+    progress = _load_continue_watching(user_id)
+    if connection is not None and progress:
+        pipeline = connection.pipeline()
+        pipeline.zadd(set_key, {video_id: updated_at.timestamp() for video_id, _, updated_at in progress})
+        pipeline.hset(position_key, mapping={video_id: position for video_id, position, _ in progress})
+        pipeline.expire(set_key, settings.WATCH_PROGRESS['CONTINUE_WATCHING_TTL'])
+        pipeline.expire(position_key, settings.WATCH_PROGRESS['CONTINUE_WATCHING_TTL'])
+        pipeline.execute()
+    progress.sort(key=lambda entry: entry[2], reverse=True)
+    return progress[:limit]
@@ -0,0 +1,198 @@
+import re
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from scipy import sparse
+
+from ..models import Video, RelatedVideo
+
+TOKEN_PATTERN = re.compile(r'[^\W\d_]{2,}')
+
+STOP_WORDS = frozenset(
+    'about after all also and are but can for from has have her his how into its not '
+    'our out over she that the their them then there they this was were what when '
+    'where which who will with you your'.split()
+)
+
+
+def tokenize(text: str) -> list:
+    """Lowercase words of at least two letters, without common English stop words."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def build_tfidf(documents) -> sparse.csr_matrix:
+    """
+    Build the L2-normalised TF-IDF matrix of tokenised documents.
+
+    Args:
+        documents: One token list per document.
+
+    Returns:
+        sparse.csr_matrix: Documents x vocabulary, rows of unit length
+        (or zero for documents without tokens).
+    """
+    vocabulary = {}
+    indices, indptr = [], [0]
+    for tokens in documents:
+        indices.extend(vocabulary.setdefault(token, len(vocabulary)) for token in tokens)
+        indptr.append(len(indices))
+
+    counts = sparse.csr_matrix(
+        (np.ones(len(indices)), indices, indptr), shape=(len(indptr) - 1, len(vocabulary)))
+    counts.sum_duplicates()
+
+    document_frequency = np.bincount(counts.indices, minlength=counts.shape[1])
+    idf = np.log((1 + counts.shape[0]) / (1 + document_frequency)) + 1
+    tfidf = counts.multiply(idf).tocsr()
+
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags(1 / norms) @ tfidf
+
+
+class Corpus:
+    """TF-IDF vectors and genres of all processed videos, in primary key order."""
+
+    def __init__(self):
+        videos = list(
+            Video.objects.processed().order_by('pk').values_list('pk', 'title', 'description', 'genre'))
+        title_weight = settings.RELATED_VIDEOS['TITLE_WEIGHT']
+        self.ids = np.array([video[0] for video in videos], dtype=np.int64)
+        self.tfidf = build_tfidf(
+            tokenize(title) * title_weight + tokenize(description)
+            for _, title, description, _ in videos
+        )
+        _, self.genres = np.unique([video[3] for video in videos], return_inverse=True)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def position(self, video_id):
+        """Row of a video in the corpus, or None if it is not processed."""
+        position = np.searchsorted(self.ids, video_id)
+        if position < len(self.ids) and self.ids[position] == video_id:
+            return int(position)
+        return None
+
+    def similarity(self, rows) -> np.ndarray:
+        """
+        Similarity of the given rows to every video in the corpus.
+
+        Cosine similarity of the TF-IDF vectors plus GENRE_WEIGHT for the
+        same genre. A video's similarity to itself is -inf.
+        """
+        rows = np.asarray(rows)
+        scores = (self.tfidf[rows] @ self.tfidf.T).toarray()
+        scores += settings.RELATED_VIDEOS['GENRE_WEIGHT'] * (self.genres[rows, None] == self.genres[None, :])
+        scores[np.arange(len(rows)), rows] = -np.inf
+        return scores
+
+
+def top_k(scores: np.ndarray, k: int) -> tuple:
+    """
+    Column indices and scores of the k best entries per row, best first.
+
+    Entries without any similarity (score <= 0) are marked with index -1.
+    """
+    k = min(k, scores.shape[1] - 1)
+    if k <= 0:
+        empty = np.empty((scores.shape[0], 0))
+        return empty.astype(np.int64), empty
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind='stable')
+    indices = np.take_along_axis(candidates, order, axis=1)
+    best = np.take_along_axis(candidate_scores, order, axis=1)
+    indices[best <= 0] = -1
+    return indices, best
+
+
+def _rows_for(video_id, neighbours) -> list:
+    return [
+        RelatedVideo(video_id=int(video_id), related_id=int(related_id), rank=rank, score=round(float(score), 6))
+        for rank, (related_id, score) in enumerate(neighbours, start=1)
+    ]
+
+
+def rebuild_related_videos() -> int:
+    """
+    Recompute the neighbours of every processed video in one batch.
+
+    The similarity matrix is computed BATCH_SIZE rows at a time, so memory
+    stays bounded by BATCH_SIZE x number of videos. The table is replaced in
+    one transaction; readers keep seeing the old neighbours until it commits.
+
+    Returns:
+        int: Number of neighbour rows written.
+    """
+    options = settings.RELATED_VIDEOS
+    corpus = Corpus()
+    rows = []
+    for start in range(0, len(corpus), options['BATCH_SIZE']):
+        batch = np.arange(start, min(start + options['BATCH_SIZE'], len(corpus)))
+        indices, scores = top_k(corpus.similarity(batch), options['TOP_K'])
+        for row, video_id in enumerate(corpus.ids[batch]):
+            neighbours = [
+                (corpus.ids[index], score)
+                for index, score in zip(indices[row], scores[row]) if index >= 0
+            ]
+            rows.extend(_rows_for(video_id, neighbours))
+
+    with transaction.atomic():
+        RelatedVideo.objects.all().delete()
+        RelatedVideo.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def add_related_video(video_id) -> int:
+    """
+    Add a newly processed video to the precomputed neighbours.
+
+    Only the new video's row of the similarity matrix is computed. It gets
+    its own top-K list, and it is merged into the lists of the videos it is
+    similar to where it beats their current last entry. Scores of existing
+    entries keep the IDF of their last rebuild until the nightly rebuild.
+
+    The corpus is still loaded and vectorised in full on every call, since
+    the vocabulary and IDF are not persisted; that is one query over the
+    text columns of all processed videos plus a sparse matrix build, which
+    is cheap next to transcoding but grows linearly with the catalogue.
+
+    Returns:
+        int: Number of videos whose neighbours changed.
+    """
+    video_id = int(video_id)
+    corpus = Corpus()
+    position = corpus.position(video_id)
+    if position is None:
+        return 0
+
+    top = settings.RELATED_VIDEOS['TOP_K']
+    scores = corpus.similarity([position])[0]
+    indices, best = top_k(scores[None, :], top)
+    lists = {
+        video_id: [
+            (int(corpus.ids[index]), score) for index, score in zip(indices[0], best[0]) if index >= 0
+        ],
+    }
+
+    similar = {int(corpus.ids[index]): float(scores[index]) for index in np.flatnonzero(scores > 0)}
+    current = {}
+    for entry in RelatedVideo.objects.filter(video_id__in=list(similar)).order_by('video', 'rank'):
+        current.setdefault(entry.video_id, []).append((entry.related_id, entry.score))
+    for other_id, score in similar.items():
+        neighbours = [entry for entry in current.get(other_id, []) if entry[0] != video_id]
+        if len(neighbours) >= top and neighbours[-1][1] >= score:
+            continue
+        neighbours.append((video_id, score))
+        neighbours.sort(key=lambda entry: entry[1], reverse=True)
+        lists[other_id] = neighbours[:top]
+
+    with transaction.atomic():
+        RelatedVideo.objects.filter(video_id__in=list(lists)).delete()
+        RelatedVideo.objects.bulk_create(
+            [row for other_id, neighbours in lists.items() for row in _rows_for(other_id, neighbours)],
+            batch_size=1000,
+        )
+    return len(lists)
@@ -0,0 +1,30 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db.models import F, Q
+
+SEARCH_CONFIG = 'english'
+SEARCH_ORDERING = ('-rank', '-popularity', '-upload_date')
+
+
+def search_videos(queryset, term: str):
+    """
+    Filter and rank videos by a search term.
+
+    Matches the stored `search_vector` (websearch syntax: quotes, `or`, `-`)
+    and, for typos, trigram word similarity of the title. Both conditions
+    are served by GIN indexes. Results are ordered by relevance, then
+    popularity.
+
+    Args:
+        queryset: Video queryset to search in.
+        term (str): Search term entered by the user.
+
+    Returns:
+        QuerySet: Matching videos annotated with `rank`.
+    """
+    query = SearchQuery(term, search_type='websearch', config=SEARCH_CONFIG)
+    return (
+        queryset
+        .filter(Q(search_vector=query) | Q(title__trigram_word_similar=term))
+        .annotate(rank=SearchRank(F('search_vector'), query) + TrigramWordSimilarity(term, 'title'))
+        .order_by(*SEARCH_ORDERING)
+    )
@@ -1,6 +1,6 @@
 import logging
 from rest_framework import serializers
-from ..models import Video
+from ..models import Video, UploadSession, UploadPart
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +13,39 @@ class VideoUploadSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'description', 'original_file', 'genre']
 
 
+class UploadPartSerializer(serializers.ModelSerializer):
+    """Serializer for a received part of a chunked upload."""
+    
+    class Meta:
+        model = UploadPart
+        fields = ['part_number', 'size', 'checksum']
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """Serializer for starting a chunked upload and reporting its progress."""
+    
+    upload_id = serializers.UUIDField(source='id', read_only=True)
+    parts = UploadPartSerializer(many=True, read_only=True)
+    received_bytes = serializers.SerializerMethodField()
+    video_id = serializers.IntegerField(read_only=True, allow_null=True)
+    
+    class Meta:
+        model = UploadSession
+        fields = ['upload_id', 'title', 'description', 'genre', 'filename',
+                  'total_size', 'checksum', 'status', 'error', 'video_id', 'expires_at', 'parts', 'received_bytes']
+        read_only_fields = ['status', 'error', 'expires_at']
+    
+    def validate_filename(self, value):
+        """Only keep the base name of the client-side file name."""
+        filename = value.replace('\\', '/').rsplit('/', 1)[-1]
+        if not filename:
+            raise serializers.ValidationError('Invalid file name.')
+        return filename
+    
+    def get_received_bytes(self, obj):
+        return sum(part.size for part in obj.parts.all())
+
+
 class VideoListSerializer(serializers.ModelSerializer):
     """Serializer for listing videos according to API specification."""
     
@@ -40,3 +73,11 @@ class VideoListSerializer(serializers.ModelSerializer):
                 return None
         
         return None
+
+
+class WatchProgressSerializer(serializers.Serializer):
+    """Serializer for the playback position of the current user in a video."""
+    
+    video_id = serializers.IntegerField(read_only=True)
+    position = serializers.FloatField(min_value=0)
+    updated_at = serializers.DateTimeField(read_only=True, allow_null=True)
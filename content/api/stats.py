@@ -0,0 +1,120 @@
+import datetime
+import logging
+
+import django_redis
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from redis.exceptions import RedisError
+
+from ..models import Video, VideoDailyStats
+
+logger = logging.getLogger(__name__)
+
+KEY_TTL = 60 * 60 * 24 * 3
+
+# Count a play once per viewer and dedup window (players reload manifests when
+# switching resolution), and always add the viewer to the day's HyperLogLog.
+RECORD_PLAY_SCRIPT = """
+if redis.call('SET', KEYS[1], 1, 'NX', 'EX', ARGV[1]) then
+    redis.call('HINCRBY', KEYS[2], ARGV[2], 1)
+    redis.call('EXPIRE', KEYS[2], ARGV[4])
+end
+redis.call('PFADD', KEYS[3], ARGV[3])
+redis.call('EXPIRE', KEYS[3], ARGV[4])
+"""
+
+
+def _plays_key(day: datetime.date) -> str:
+    return cache.make_key(f'video_plays:{day.isoformat()}')
+
+
+def _viewers_key(day: datetime.date, video_id) -> str:
+    return cache.make_key(f'video_viewers:{day.isoformat()}:{video_id}')
+
+
+def record_play(video_id, user_id):
+    """
+    Count a playback start in Redis, atomically via Lua.
+
+    Failures are logged and ignored, so counting never breaks playback.
+
+    Args:
+        video_id: Id of the started video.
+        user_id: Id of the viewer.
+    """
+    day = timezone.localdate()
+    seen_key = cache.make_key(f'video_play_seen:{video_id}:{user_id}')
+    try:
+        connection = django_redis.get_redis_connection('default')
+        connection.eval(
+            RECORD_PLAY_SCRIPT, 3, seen_key, _plays_key(day), _viewers_key(day, video_id),
+            settings.PLAY_STATS['DEDUP_WINDOW'], video_id, user_id, KEY_TTL,
+        )
+    except RedisError:
+        logger.warning('Play of video %s not counted, Redis is unavailable.', video_id, exc_info=True)
+
+
+def rollup_day(day: datetime.date) -> int:
+    """
+    Copy the Redis counters of one day into VideoDailyStats.
+
+    Counters hold running totals for the day, so rows are overwritten and
+    repeated rollups are idempotent.
+
+    Returns:
+        int: Number of rows written.
+    """
+    connection = django_redis.get_redis_connection('default')
+    plays = {int(video_id): int(count) for video_id, count in connection.hgetall(_plays_key(day)).items()}
+    if not plays:
+        return 0
+
+    pipeline = connection.pipeline(transaction=False)
+    for video_id in plays:
+        pipeline.pfcount(_viewers_key(day, video_id))
+    viewers = dict(zip(plays, pipeline.execute()))
+
+    existing = set(Video.objects.filter(pk__in=list(plays)).values_list('pk', flat=True))
+    rows = [
+        VideoDailyStats(video_id=video_id, date=day, plays=count, unique_viewers=viewers[video_id])
+        for video_id, count in plays.items() if video_id in existing
+    ]
+    VideoDailyStats.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=['video', 'date'],
+        update_fields=['plays', 'unique_viewers'],
+    )
+    return len(rows)
+
+
+def update_popularity(today: datetime.date) -> int:
+    """
+    Recompute Video.popularity from the daily stats of the last POPULARITY_DAYS.
+
+    Each day's unique viewers are weighted by an exponential decay with
+    POPULARITY_HALF_LIFE_DAYS, so recent plays count more.
+
+    Returns:
+        int: Number of videos whose score changed.
+    """
+    options = settings.PLAY_STATS
+    since = today - datetime.timedelta(days=options['POPULARITY_DAYS'] - 1)
+    scores = {}
+    for video_id, date, unique_viewers in (
+        VideoDailyStats.objects.filter(date__gte=since).values_list('video_id', 'date', 'unique_viewers')
+    ):
+        age = (today - date).days
+        weight = 0.5 ** (age / options['POPULARITY_HALF_LIFE_DAYS'])
+        scores[video_id] = scores.get(video_id, 0) + unique_viewers * weight
+
+    changed = [
+        video for video in Video.objects.filter(pk__in=list(scores)).only('pk', 'popularity')
+        if video.popularity != round(scores[video.pk], 4)
+    ]
+    for video in changed:
+        video.popularity = round(scores[video.pk], 4)
+    Video.objects.bulk_update(changed, ['popularity'], batch_size=1000)
+    stale = Video.objects.exclude(pk__in=list(scores)).exclude(popularity=0).update(popularity=0)
+    return len(changed) + stale
@@ -1,9 +1,17 @@
+import datetime
 import os
+from content.models import Video, UploadSession
+from content.storage import local_file, output_directory
 from django.conf import settings
-from content.models import Video
+from django.db import transaction
+from django.utils import timezone
 from django_rq import job
 
-from .utils import convert_video_to_hls, generate_thumbnail
+from .progress import flush_progress
+from .related import add_related_video, rebuild_related_videos
+from .stats import rollup_day, update_popularity
+from .uploads import UploadError, complete_upload, delete_expired_sessions, find_processed_duplicate
+from .utils import convert_video_to_hls, generate_thumbnail, hash_file
 
 
 @job
@@ -20,34 +28,129 @@ def process_video(video_id):
         print(f"ERROR: Video {video_id} has no original_file. Task aborted.")
         return
     
-    input_path = video.original_file.path
-    base_filename = os.path.splitext(os.path.basename(input_path))[0]
-    media_root = settings.MEDIA_ROOT
+    base_filename = os.path.splitext(os.path.basename(video.original_file.name))[0]
     
-    _convert_hls_streams(video, input_path, base_filename, media_root)
-    _generate_video_thumbnail(video, input_path, base_filename, media_root)
+    with local_file(video.original_file) as input_path:
+        if not video.content_hash:
+            video.content_hash = hash_file(input_path)
+        
+        if not video.is_processed and _link_duplicate_outputs(video):
+            _queue_related_refresh(video)
+            return
+        
+        _convert_hls_streams(video, input_path, base_filename)
+        _generate_video_thumbnail(video, input_path, base_filename)
     
     video.save()
+    _queue_related_refresh(video)
+
+
+def _queue_related_refresh(video):
+    """Add a video that finished processing to the precomputed related-video lists."""
+    
+    if video.is_processed:
+        transaction.on_commit(lambda: refresh_related_videos.delay(video.id))
 
 
-def _convert_hls_streams(video, input_path: str, base_filename: str, media_root: str):
+def _link_duplicate_outputs(video) -> bool:
+    """Reuse the outputs of an already processed upload of the same file instead of transcoding."""
+    
+    duplicate = find_processed_duplicate(video.content_hash, exclude_id=video.id)
+    if duplicate is None:
+        return False
+    
+    outputs = duplicate.processed_outputs()
+    if video.original_file.name != outputs['original_file']:
+        video.original_file.delete(save=False)
+    for field, value in outputs.items():
+        setattr(video, field, value)
+    video.save()
+    return True
+
+
+def _convert_hls_streams(video, input_path: str, base_filename: str):
     """Convert video to HLS streams for adaptive streaming."""
     
     resolutions = [480, 720, 1080]
     for res in resolutions:
-        hls_dir = os.path.join(media_root, f'videos/hls/{res}p/{base_filename}')
-        os.makedirs(hls_dir, exist_ok=True)
+        hls_prefix = f'videos/hls/{res}p/{base_filename}'
         
-        manifest_path = convert_video_to_hls(input_path, hls_dir, res)
-        relative_manifest_path = os.path.relpath(manifest_path, media_root)
-        setattr(video, f'hls_{res}p_manifest', relative_manifest_path)
+        with output_directory(hls_prefix) as hls_dir:
+            manifest_path = convert_video_to_hls(input_path, hls_dir, res)
+        
+        manifest_name = f'{hls_prefix}/{os.path.basename(manifest_path)}'
+        setattr(video, f'hls_{res}p_manifest', manifest_name)
 
 
-def _generate_video_thumbnail(video, input_path: str, base_filename: str, media_root: str):
+def _generate_video_thumbnail(video, input_path: str, base_filename: str):
     """Generate thumbnail image for the video."""
     
-    thumbnail_path = os.path.join(
-        media_root, f'videos/thumbnails/{base_filename}.jpg')
-    os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
-    generate_thumbnail(input_path, thumbnail_path)
+    with output_directory('videos/thumbnails') as thumbnail_dir:
+        thumbnail_path = os.path.join(thumbnail_dir, f'{base_filename}.jpg')
+        generate_thumbnail(input_path, thumbnail_path)
     video.thumbnail = f'videos/thumbnails/{base_filename}.jpg'
+
+
+@job
+def complete_chunked_upload(upload_id):
+    """Background job that assembles a claimed chunked upload into its Video."""
+    
+    try:
+        session = UploadSession.objects.get(pk=upload_id, status=UploadSession.COMPLETING)
+    except UploadSession.DoesNotExist:
+        print(f"ERROR: Upload {upload_id} is not being completed. Task aborted.")
+        return None
+    
+    try:
+        video = complete_upload(session)
+    except UploadError as e:
+        print(f"ERROR: Upload {upload_id} failed: {e}")
+        return None
+    return video.id
+
+
+@job('stats')
+def flush_watch_progress() -> int:
+    """Scheduled job that writes buffered playback heartbeats to WatchProgress."""
+    written = flush_progress(settings.WATCH_PROGRESS['BATCH_SIZE'])
+    if written:
+        print(f"Flushed watch progress for {written} user/video pairs.")
+    return written
+
+
+@job('stats')
+def rollup_play_stats() -> int:
+    """
+    Scheduled job that copies the Redis play counters into VideoDailyStats
+    and refreshes Video.popularity.
+
+    Yesterday is rolled up again so plays counted just before midnight are kept.
+    """
+    today = timezone.localdate()
+    rows = rollup_day(today - datetime.timedelta(days=1)) + rollup_day(today)
+    update_popularity(today)
+    return rows
+
+
+@job
+def refresh_related_videos(video_id=None) -> int:
+    """
+    Update the precomputed "more like this" neighbours.
+
+    With a video id only that video is added incrementally; without one
+    (the nightly run) all neighbours are rebuilt with a fresh vocabulary.
+    """
+    if video_id is not None:
+        return add_related_video(video_id)
+    rows = rebuild_related_videos()
+    print(f"Rebuilt {rows} related-video entries.")
+    return rows
+
+
+@job
+def cleanup_upload_sessions() -> int:
+    """Scheduled job that deletes expired chunked uploads and their part files."""
+    deleted = sum(delete_expired_sessions())
+    if deleted:
+        print(f"Deleted {deleted} expired chunked uploads.")
+    return deleted
@@ -0,0 +1,82 @@
+import hashlib
+import logging
+from django.conf import settings
+from django.core.files.uploadhandler import TemporaryFileUploadHandler, SkipFile
+
+from .utils import probe_video
+
+logger = logging.getLogger(__name__)
+
+INVALID_VIDEO_MESSAGE = 'The uploaded file is not a supported video.'
+
+
+class VideoProbeUploadHandler(TemporaryFileUploadHandler):
+    """
+    Upload handler that hashes and probes a video while its bytes arrive.
+
+    The first VIDEO_PROBE_HEADER_BYTES are probed with ffprobe as soon as they
+    are received, so files that are clearly not videos are dropped before the
+    rest of the body is written to disk. MP4/MOV files may keep their index at
+    the end; those are probed again from the temporary file once complete.
+    The finished file carries `content_hash` and `media_info` attributes.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.error = None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.hash = hashlib.sha256()
+        self.header = bytearray()
+        self.header_probed = False
+        self.probe_available = True
+        self.media_info = None
+
+    def receive_data_chunk(self, raw_data, start):
+        self.hash.update(raw_data)
+        if not self.header_probed:
+            missing = settings.VIDEO_PROBE_HEADER_BYTES - len(self.header)
+            self.header += raw_data[:missing]
+            if len(self.header) >= settings.VIDEO_PROBE_HEADER_BYTES and not self._probe_header():
+                self.error = INVALID_VIDEO_MESSAGE
+                raise SkipFile(self.error)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        header_valid = self.header_probed or self._probe_header()
+        needs_full_probe = self.media_info is None or self.media_info.get('duration') is None
+        if header_valid and needs_full_probe:
+            self.media_info = self._probe(file.temporary_file_path()) or self.media_info
+
+        if self.probe_available and self.media_info is None:
+            self.error = INVALID_VIDEO_MESSAGE
+            file.close()
+            return None
+
+        file.content_hash = self.hash.hexdigest()
+        file.media_info = self.media_info
+        return file
+
+    def _probe_header(self) -> bool:
+        """Probe the buffered header bytes; return False if they cannot start a video."""
+        self.header_probed = True
+        header = bytes(self.header)
+        self.header = bytearray()
+        if not header:
+            return False
+
+        self.media_info = self._probe(data=header)
+        # MP4/MOV files without faststart keep the moov atom at the end of the file.
+        return not self.probe_available or self.media_info is not None or header[4:8] == b'ftyp'
+
+    def _probe(self, input_path='pipe:0', data=None):
+        if not self.probe_available:
+            return None
+        try:
+            return probe_video(input_path, data=data)
+        except FileNotFoundError:
+            logger.warning('ffprobe is not installed, uploads are accepted without probing.')
+            self.probe_available = False
+            return None
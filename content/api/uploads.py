@@ -0,0 +1,260 @@
+import hashlib
+import io
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import Video, UploadPart, UploadSession, upload_expiry
+from ..storage import MULTIPART_MIN_PART_SIZE
+
+
+class UploadError(Exception):
+    """Raised when a chunked upload cannot be stored or completed."""
+
+
+class UploadConflict(UploadError):
+    """Raised when a chunked upload is already being completed by another request."""
+
+
+class HashingReader(io.RawIOBase):
+    """Read-only stream wrapper that computes SHA-256 and size while data passes through."""
+
+    def __init__(self, stream, limit: int = None):
+        self.stream = stream
+        self.limit = limit
+        self.size = 0
+        self.hash = hashlib.sha256()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.stream.read(len(buffer)) if self.stream else b''
+        if not data:
+            return 0
+        self.size += len(data)
+        if self.limit is not None and self.size > self.limit:
+            raise UploadError('Part exceeds the maximum part size.')
+        self.hash.update(data)
+        buffer[:len(data)] = data
+        return len(data)
+
+    def hexdigest(self) -> str:
+        return self.hash.hexdigest()
+
+
+class ConcatenatedReader(io.RawIOBase):
+    """Read-only stream over stored files, opened one at a time in order."""
+
+    def __init__(self, names, storage=None):
+        self.names = list(names)
+        self.storage = storage or default_storage
+        self.current = None
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while True:
+            if self.current is None:
+                if not self.names:
+                    return 0
+                self.current = self.storage.open(self.names.pop(0), 'rb')
+            data = self.current.read(len(buffer))
+            if data:
+                buffer[:len(data)] = data
+                return len(data)
+            self.current.close()
+            self.current = None
+
+    def close(self):
+        if self.current is not None:
+            self.current.close()
+            self.current = None
+        super().close()
+
+
+def find_processed_duplicate(content_hash: str, exclude_id=None):
+    """Return an already processed Video with the same original content, if any."""
+    if not content_hash:
+        return None
+    duplicates = Video.objects.processed().filter(content_hash=content_hash)
+    if exclude_id is not None:
+        duplicates = duplicates.exclude(pk=exclude_id)
+    return duplicates.order_by('upload_date').first()
+
+
+def store_part(session, part_number: int, stream, max_size: int, checksum: str = '') -> UploadPart:
+    """
+    Stream one part of a chunked upload into the media storage.
+
+    Args:
+        session: UploadSession the part belongs to.
+        part_number (int): 1-based position of the part.
+        stream: File-like request body.
+        max_size (int): Maximum accepted part size in bytes.
+        checksum (str): Optional SHA-256 hex digest sent by the client.
+
+    Returns:
+        UploadPart: The recorded part.
+    """
+    if session.status not in UploadSession.RESUMABLE:
+        raise UploadConflict('Upload is already being completed.')
+    name = session.part_name(part_number)
+    reader = HashingReader(stream, limit=max_size)
+
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    try:
+        default_storage.save(name, File(reader, name=name))
+    except UploadError:
+        default_storage.delete(name)
+        raise
+
+    digest = reader.hexdigest()
+    if checksum and checksum.lower() != digest:
+        default_storage.delete(name)
+        raise UploadError('Part checksum mismatch.')
+
+    part, _ = UploadPart.objects.update_or_create(
+        session=session, part_number=part_number,
+        defaults={'size': reader.size, 'checksum': digest},
+    )
+    UploadSession.objects.filter(pk=session.pk).update(expires_at=upload_expiry())
+    return part
+
+
+def delete_session_files(session_id, storage=None):
+    """Delete every stored part of a chunked upload, including ones without an UploadPart row."""
+    storage = storage or default_storage
+    directory = f'uploads/{session_id}'
+    try:
+        _, files = storage.listdir(directory)
+    except FileNotFoundError:
+        return
+    for filename in files:
+        storage.delete(f'{directory}/{filename}')
+
+
+def delete_expired_sessions(batch_size: int = 100, max_batches: int = None):
+    """
+    Delete expired chunked uploads and their part files in batches.
+
+    Sessions still marked completing are included: their expiry was pushed
+    back when the job claimed them, so the job has died.
+
+    Args:
+        batch_size (int): Sessions deleted per batch.
+        max_batches (int): Stop after this many batches; None deletes all.
+
+    Yields:
+        int: Number of sessions deleted in each batch.
+    """
+    expired = UploadSession.objects.filter(expires_at__lte=timezone.now())
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        ids = list(expired.values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            break
+        for session_id in ids:
+            delete_session_files(session_id)
+        UploadSession.objects.filter(pk__in=ids).delete()
+        batches += 1
+        yield len(ids)
+
+
+def start_completion(session):
+    """
+    Check that all parts arrived and claim the session for the completion job.
+
+    Raises:
+        UploadError: Parts are missing or do not add up to the announced size.
+        UploadConflict: The upload is already being completed or was completed.
+    """
+    _check_parts(session)
+    if not session.claim(UploadSession.RESUMABLE, UploadSession.COMPLETING):
+        raise UploadConflict('Upload is already being completed.')
+
+
+def complete_upload(session) -> Video:
+    """
+    Assemble the parts of a claimed chunked upload into the original file and create the Video.
+
+    Runs in the completion job, not in the request. On S3 the parts are
+    joined server-side with a multipart UploadPartCopy, so no byte passes
+    through the worker; the content hash is then left to process_video,
+    which hashes the original while it has it on local disk anyway, unless
+    the client announced a whole-file checksum that has to be verified
+    here. On other storages the parts are streamed into the target file
+    and hashed on the way.
+
+    Processing is queued by the Video post_save signal, unless the same
+    content was processed before and its outputs are reused; then the
+    signal only adds the video to the related-video lists. The session is
+    marked completed with the video, or failed with the error.
+    """
+    try:
+        video = _assemble(session)
+    except UploadError as e:
+        session.status = UploadSession.FAILED
+        session.error = str(e)
+        session.expires_at = upload_expiry()
+        session.save(update_fields=['status', 'error', 'expires_at'])
+        raise
+    return video
+
+
+def _check_parts(session) -> list:
+    parts = list(session.parts.all())
+    numbers = [part.part_number for part in parts]
+    if numbers != list(range(1, len(parts) + 1)):
+        raise UploadError('Upload is missing parts.')
+    if sum(part.size for part in parts) != session.total_size:
+        raise UploadError('Uploaded size does not match the announced size.')
+    return parts
+
+
+def _assemble(session) -> Video:
+    parts = _check_parts(session)
+    part_names = [session.part_name(part.part_number) for part in parts]
+
+    video = Video(title=session.title, description=session.description, genre=session.genre)
+    storage = video.original_file.storage
+    if hasattr(storage, 'concatenate') and all(part.size >= MULTIPART_MIN_PART_SIZE for part in parts[:-1]):
+        name = video.original_file.field.generate_filename(video, session.filename)
+        video.original_file.name = storage.concatenate(part_names, name)
+        if session.checksum:
+            with storage.open(video.original_file.name, 'rb') as f:
+                reader = HashingReader(f)
+                while reader.read(1024 * 1024):
+                    pass
+            video.content_hash = reader.hexdigest()
+    else:
+        reader = HashingReader(ConcatenatedReader(part_names, storage))
+        video.original_file.save(session.filename, File(reader, name=session.filename), save=False)
+        video.content_hash = reader.hexdigest()
+
+    if session.checksum and session.checksum.lower() != video.content_hash:
+        video.original_file.delete(save=False)
+        raise UploadError('File checksum mismatch.')
+
+    duplicate = find_processed_duplicate(video.content_hash)
+    if duplicate:
+        video.original_file.delete(save=False)
+        for field, value in duplicate.processed_outputs().items():
+            setattr(video, field, value)
+
+    with transaction.atomic():
+        video.save()
+        session.status = UploadSession.COMPLETED
+        session.error = ''
+        session.video = video
+        session.expires_at = upload_expiry()
+        session.save(update_fields=['status', 'error', 'video', 'expires_at'])
+        session.parts.all().delete()
+
+    for name in part_names:
+        storage.delete(name)
+    return video
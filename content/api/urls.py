@@ -2,14 +2,33 @@ from django.urls import path
 
 from .views import (
     VideoUploadView, 
+    ChunkedUploadView,
+    ChunkedUploadDetailView,
+    ChunkedUploadPartView,
+    ChunkedUploadCompleteView,
     VideoListView, 
     HLSManifestView,
-    HLSSegmentView
+    HLSSegmentView,
+    WatchProgressView,
+    ContinueWatchingView,
+    VideoSearchView,
+    RelatedVideosView
 )
 
 urlpatterns = [
     path('upload/', VideoUploadView.as_view(), name='video-upload'),
+    path('upload/chunked/', ChunkedUploadView.as_view(), name='chunked-upload'),
+    path('upload/chunked/<uuid:upload_id>/', 
+         ChunkedUploadDetailView.as_view(), name='chunked-upload-detail'),
+    path('upload/chunked/<uuid:upload_id>/parts/<int:part_number>/', 
+         ChunkedUploadPartView.as_view(), name='chunked-upload-part'),
+    path('upload/chunked/<uuid:upload_id>/complete/', 
+         ChunkedUploadCompleteView.as_view(), name='chunked-upload-complete'),
     path('video/', VideoListView.as_view(), name='video-list'),
+    path('video/search/', VideoSearchView.as_view(), name='video-search'),
+    path('video/continue/', ContinueWatchingView.as_view(), name='continue-watching'),
+    path('video/<int:movie_id>/progress/', WatchProgressView.as_view(), name='watch-progress'),
+    path('video/<int:movie_id>/related/', RelatedVideosView.as_view(), name='related-videos'),
     path('video/<int:movie_id>/<str:resolution>/index.m3u8', 
          HLSManifestView.as_view(), name='hls-manifest'),
     path('video/<int:movie_id>/<str:resolution>/<str:segment>/', 
@@ -1,4 +1,7 @@
 import os
+import json
+import hashlib
+import posixpath
 import subprocess
 from PIL import Image
 from moviepy import VideoFileClip
@@ -60,6 +63,66 @@ def convert_video_to_hls(input_path: str, output_dir: str, resolution: int) -> s
     return playlist_path
 
 
+def probe_video(input_path: str = "pipe:0", data: bytes = None) -> dict:
+    """
+    Read container and stream information of a video using ffprobe.
+
+    Args:
+        input_path (str): Path to the video file, or 'pipe:0' to read from data.
+        data (bytes): Raw bytes to probe when reading from stdin.
+
+    Returns:
+        dict: Container, codecs, dimensions and duration, or None if the
+        input is not a readable video.
+    """
+    command = [
+        "ffprobe",
+        "-v", "error",
+        "-print_format", "json",
+        "-show_format",
+        "-show_streams",
+        input_path,
+    ]
+    try:
+        result = subprocess.run(command, input=data, capture_output=True, check=True, timeout=30)
+        info = json.loads(result.stdout)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, ValueError):
+        return None
+
+    streams = info.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    if video is None:
+        return None
+
+    duration = info.get("format", {}).get("duration")
+    return {
+        "container": info.get("format", {}).get("format_name"),
+        "duration": float(duration) if duration else None,
+        "video_codec": video.get("codec_name"),
+        "width": video.get("width"),
+        "height": video.get("height"),
+        "audio_codec": audio.get("codec_name") if audio else None,
+    }
+
+
+def hash_file(path: str) -> str:
+    """
+    Compute the SHA-256 hex digest of a file without loading it into memory.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def generate_thumbnail(input_path: str, output_path: str) -> None:
     """
     Generate a thumbnail image from the first second of a video.
@@ -93,9 +156,25 @@ def get_hls_manifest_by_resolution(video, resolution: str):
     return manifest_map.get(resolution)
 
 
+def get_hls_file_name(video, resolution: str, filename: str) -> str:
+    """
+    Build the storage name of a file inside a video's HLS output directory.
+
+    Args:
+        video: Video model instance.
+        resolution (str): Resolution key ('480p', '720p', '1080p').
+        filename (str): Name of the file (e.g., 'index.m3u8' or '000.ts').
+
+    Returns:
+        str: Storage name relative to the media storage root.
+    """
+    basename = os.path.splitext(os.path.basename(video.original_file.name))[0]
+    return f'videos/hls/{resolution}/{basename}/{filename}'
+
+
 def get_hls_segment_path(video, resolution: str, segment_filename: str) -> str:
     """
-    Get the file system path for an HLS segment.
+    Get the storage name for an HLS segment.
 
     Args:
         video: Video model instance.
@@ -103,15 +182,15 @@ def get_hls_segment_path(video, resolution: str, segment_filename: str) -> str:
         segment_filename (str): Name of the segment file (e.g., '000.ts').
 
     Returns:
-        str: Full path to the segment file or None if not found.
+        str: Storage name of the segment file or None if not found.
     """
     manifest = get_hls_manifest_by_resolution(video, resolution)
     if not manifest:
         return None
     
-    manifest_dir = os.path.dirname(manifest.path)
-    segment_path = os.path.join(manifest_dir, segment_filename)
+    manifest_dir = posixpath.dirname(manifest.name)
+    segment_name = posixpath.join(manifest_dir, segment_filename)
     
-    if os.path.exists(segment_path):
-        return segment_path
-    return None
\ No newline at end of file
+    if manifest.storage.exists(segment_name):
+        return segment_name
+    return None
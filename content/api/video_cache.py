@@ -0,0 +1,86 @@
+import json
+import logging
+
+import django_redis
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from redis.exceptions import RedisError
+
+from .serializers import VideoListSerializer
+from ..models import Video
+
+logger = logging.getLogger(__name__)
+
+
+def _cards_key() -> str:
+    return cache.make_key('video_cards')
+
+
+def _serialize(videos) -> dict:
+    cards = {}
+    for video in videos:
+        card = dict(VideoListSerializer(video).data)
+        card['thumbnail_url'] = video.thumbnail.name or None
+        cards[video.id] = card
+    return cards
+
+
+def _with_thumbnail_url(card: dict) -> dict:
+    """Replace the stored thumbnail name by its storage URL."""
+    name = card['thumbnail_url']
+    if name:
+        try:
+            card['thumbnail_url'] = Video._meta.get_field('thumbnail').storage.url(name)
+        except (ValueError, OSError):
+            logger.debug(f"Thumbnail URL unavailable for video {card['id']}")
+            card['thumbnail_url'] = None
+    return card
+
+
+def get_video_cards(video_ids) -> dict:
+    """
+    Return the serialized list representation of videos by id.
+
+    Cards are read from a Redis hash in one round trip; missing ones are
+    serialized from the database and stored. Cards store the thumbnail's
+    storage name and the URL is built on every read, so signed storage
+    URLs never outlive their expiry in the cache.
+
+    Args:
+        video_ids: Ids of the videos.
+
+    Returns:
+        dict: Card per id; ids of deleted videos are left out.
+    """
+    video_ids = list(video_ids)
+    if not video_ids:
+        return {}
+    try:
+        connection = django_redis.get_redis_connection('default')
+        cached = connection.hmget(_cards_key(), video_ids)
+    except RedisError:
+        logger.warning('Video cards loaded from the database, Redis is unavailable.', exc_info=True)
+        cards = _serialize(Video.objects.filter(pk__in=video_ids))
+        return {video_id: _with_thumbnail_url(card) for video_id, card in cards.items()}
+
+    cards = {
+        video_id: json.loads(card)
+        for video_id, card in zip(video_ids, cached) if card is not None
+    }
+    missing = [video_id for video_id in video_ids if video_id not in cards]
+    if missing:
+        fresh = _serialize(Video.objects.filter(pk__in=missing))
+        if fresh:
+            connection.hset(_cards_key(), mapping={
+                video_id: json.dumps(card, cls=DjangoJSONEncoder) for video_id, card in fresh.items()
+            })
+        cards.update(fresh)
+    return {video_id: _with_thumbnail_url(card) for video_id, card in cards.items()}
+
+
+def invalidate_video_card(video_id):
+    """Drop the cached card of a changed or deleted video."""
+    try:
+        django_redis.get_redis_connection('default').hdel(_cards_key(), video_id)
+    except RedisError:
+        logger.warning('Card of video %s not invalidated, Redis is unavailable.', video_id, exc_info=True)
@@ -1,4 +1,3 @@
-import os
 import logging
 from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser
@@ -6,11 +5,27 @@ from rest_framework.response import Response
 from rest_framework.renderers import BaseRenderer
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from django.http import Http404, FileResponse
+from django.http import Http404, FileResponse, HttpResponseRedirect
+from django.core.files.storage import default_storage
 from django.conf import settings
+from django.db import transaction
+from django.shortcuts import get_object_or_404
 
-from .serializers import VideoUploadSerializer, VideoListSerializer
-from ..models import Video
+from .serializers import (
+    VideoUploadSerializer, VideoListSerializer, UploadSessionSerializer, WatchProgressSerializer,
+)
+from .progress import video_exists, get_progress, record_progress, get_continue_watching
+from .video_cache import get_video_cards
+from .stats import record_play
+from .search import search_videos
+from .uploads import (
+    UploadConflict, UploadError, delete_session_files, find_processed_duplicate, start_completion, store_part,
+)
+from .tasks import complete_chunked_upload
+from .upload_handlers import VideoProbeUploadHandler
+from .utils import get_hls_file_name
+from ..models import Video, UploadSession, RelatedVideo
+from ..storage import storage_has_local_path
 
 logger = logging.getLogger(__name__)
 
@@ -39,27 +54,156 @@ class VideoUploadView(APIView):
     """API endpoint to upload videos and trigger asynchronous processing."""
     
     permission_classes = [IsAdminUser]
-    authentication_classes = []
     parser_classes = [MultiPartParser, FormParser]
 
+    def initialize_request(self, request, *args, **kwargs):
+        self.probe_handler = VideoProbeUploadHandler(request)
+        request.upload_handlers = [self.probe_handler]
+        return super().initialize_request(request, *args, **kwargs)
+
     def post(self, request):
         serializer = VideoUploadSerializer(data=request.data)
+        if self.probe_handler.error:
+            return Response(
+                {"original_file": [self.probe_handler.error]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
         if serializer.is_valid():
-            video = serializer.save()
+            original_file = serializer.validated_data['original_file']
+            content_hash = getattr(original_file, 'content_hash', '')
+            duplicate = find_processed_duplicate(content_hash)
+            if duplicate:
+                serializer.save(content_hash=content_hash, **duplicate.processed_outputs())
+                return Response(
+                    {"detail": "Video uploaded successfully. Existing processed files were reused."},
+                    status=status.HTTP_201_CREATED,
+                )
+            
+            video = serializer.save(
+                content_hash=content_hash,
+                media_info=getattr(original_file, 'media_info', None),
+            )
             return Response(
                 {"detail": "Video uploaded successfully. Processing started in background."},
                 status=status.HTTP_201_CREATED,
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+class ChunkedUploadView(APIView):
+    """API endpoint to start a resumable chunked upload."""
+    
+    permission_classes = [IsAdminUser]
+    
+    def post(self, request):
+        serializer = UploadSessionSerializer(data=request.data)
+        if serializer.is_valid():
+            session = serializer.save(created_by_id=request.user.id)
+            data = UploadSessionSerializer(session).data
+            data['part_size'] = settings.CHUNKED_UPLOAD_MAX_PART_SIZE
+            return Response(data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class ChunkedUploadDetailView(APIView):
+    """API endpoint to inspect the progress of a chunked upload or abort it."""
+    
+    permission_classes = [IsAdminUser]
+    
+    def get(self, request, upload_id):
+        session = get_object_or_404(UploadSession, pk=upload_id)
+        return Response(UploadSessionSerializer(session).data, status=status.HTTP_200_OK)
+    
+    def delete(self, request, upload_id):
+        session = get_object_or_404(UploadSession, pk=upload_id)
+        if session.status == UploadSession.COMPLETING:
+            return Response({"detail": "Upload is already being completed."}, status=status.HTTP_409_CONFLICT)
+        delete_session_files(session.pk)
+        session.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ChunkedUploadPartView(APIView):
+    """API endpoint to store one part of a chunked upload from the raw request body."""
+    
+    permission_classes = [IsAdminUser]
+    
+    def put(self, request, upload_id, part_number):
+        session = get_object_or_404(UploadSession, pk=upload_id)
+        if part_number < 1:
+            return Response({"detail": "Part numbers start at 1."}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            part = store_part(
+                session, part_number, request.stream,
+                max_size=settings.CHUNKED_UPLOAD_MAX_PART_SIZE,
+                checksum=request.headers.get('X-Checksum-Sha256', ''),
+            )
+        except UploadConflict as e:
+            return Response({"detail": str(e)}, status=status.HTTP_409_CONFLICT)
+        except UploadError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response(
+            {"part_number": part.part_number, "size": part.size, "checksum": part.checksum},
+            status=status.HTTP_200_OK,
+        )
+
+
+class ChunkedUploadCompleteView(APIView):
+    """
+    API endpoint to assemble a chunked upload and trigger asynchronous processing.
+    
+    Assembly runs in a background job; the client polls the upload status
+    until it is `completed` (with `video_id`) or `failed` (with `error`).
+    """
+    
+    permission_classes = [IsAdminUser]
+    
+    def post(self, request, upload_id):
+        session = get_object_or_404(UploadSession, pk=upload_id)
+        try:
+            start_completion(session)
+        except UploadConflict as e:
+            return Response({"detail": str(e)}, status=status.HTTP_409_CONFLICT)
+        except UploadError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        transaction.on_commit(lambda: complete_chunked_upload.delay(session.id))
+        return Response(
+            {"upload_id": session.id, "status": session.status,
+             "detail": "Upload is being assembled. Poll the upload status for the video."},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
 class VideoListView(APIView):
-    """API endpoint to list all videos."""
+    """
+    API endpoint to list all videos.
+    
+    Supports `?sort=newest` (default) or `?sort=popular`, ordered by the
+    precomputed popularity score, and an optional `?genre=` filter.
+    """
     
     permission_classes = [IsAuthenticated]
     
+    SORT_ORDERS = {
+        'newest': ('-upload_date',),
+        'popular': ('-popularity', '-upload_date'),
+    }
+    
     def get(self, request):
+        ordering = self.SORT_ORDERS.get(request.query_params.get('sort', 'newest'))
+        if ordering is None:
+            return Response(
+                {"detail": f"Unknown sort. Use one of: {', '.join(self.SORT_ORDERS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        
         try:
-            videos = Video.objects.all().order_by('-upload_date')
+            videos = Video.objects.all().order_by(*ordering)
+            genre = request.query_params.get('genre')
+            if genre:
+                videos = videos.filter(genre=genre)
             serializer = VideoListSerializer(videos, many=True, context={"request": request})
             return Response(serializer.data, status=status.HTTP_200_OK)
         
@@ -82,15 +226,13 @@ class HLSManifestView(APIView):
         except Video.DoesNotExist:
             raise Http404("Video not found.")
         
-        media_root = settings.MEDIA_ROOT
-        basename, _ = os.path.splitext(os.path.basename(video.original_file.name))
-        hls_dir = os.path.join(media_root, f'videos/hls/{resolution}/{basename}')
-        manifest_path = os.path.join(hls_dir, "index.m3u8")
+        manifest_name = get_hls_file_name(video, resolution, "index.m3u8")
         
-        if not os.path.isfile(manifest_path):
+        if not default_storage.exists(manifest_name):
             raise Http404("HLS manifest not found.")
         
-        return FileResponse(open(manifest_path, "rb"), content_type="application/vnd.apple.mpegurl")
+        record_play(video.id, request.user.id)
+        return FileResponse(default_storage.open(manifest_name, "rb"), content_type="application/vnd.apple.mpegurl")
 
 
 class HLSSegmentView(APIView):
@@ -105,12 +247,111 @@ class HLSSegmentView(APIView):
         except Video.DoesNotExist:
             raise Http404("Video not found.")
         
-        media_root = settings.MEDIA_ROOT
-        basename, _ = os.path.splitext(os.path.basename(video.original_file.name))
-        hls_dir = os.path.join(media_root, f'videos/hls/{resolution}/{basename}')
-        segment_path = os.path.join(hls_dir, segment)
+        segment_name = get_hls_file_name(video, resolution, segment)
         
-        if not os.path.isfile(segment_path):
+        if not default_storage.exists(segment_name):
             raise Http404("HLS segment not found.")
         
-        return FileResponse(open(segment_path, "rb"), content_type="video/MP2T")
+        if not storage_has_local_path():
+            # Object stores hand out short-lived signed URLs, so segment bytes bypass the web nodes.
+            return HttpResponseRedirect(default_storage.url(segment_name))
+        
+        return FileResponse(default_storage.open(segment_name, "rb"), content_type="video/MP2T")
+
+
+class WatchProgressView(APIView):
+    """
+    API endpoint for the playback position of the current user in a video.
+    
+    Players send a heartbeat every few seconds. Positions are buffered in
+    Redis and written to the database by the `flush_watch_progress` job.
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, movie_id):
+        if not video_exists(movie_id):
+            raise Http404("Video not found.")
+        
+        position, updated_at = get_progress(request.user.id, movie_id) or (0, None)
+        data = {"video_id": movie_id, "position": position, "updated_at": updated_at}
+        return Response(WatchProgressSerializer(data).data, status=status.HTTP_200_OK)
+    
+    def put(self, request, movie_id):
+        if not video_exists(movie_id):
+            raise Http404("Video not found.")
+        
+        serializer = WatchProgressSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        position, updated_at = record_progress(
+            request.user.id, movie_id, serializer.validated_data['position'])
+        data = {"video_id": movie_id, "position": position, "updated_at": updated_at}
+        return Response(WatchProgressSerializer(data).data, status=status.HTTP_200_OK)
+
+
+class ContinueWatchingView(APIView):
+    """
+    API endpoint for the videos the current user has started but not finished.
+    
+    Entries come from the user's Redis sorted set and are hydrated from
+    cached video cards, so no join over progress and videos is needed.
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        entries = get_continue_watching(
+            request.user.id, settings.WATCH_PROGRESS['CONTINUE_WATCHING_LIMIT'])
+        cards = get_video_cards(video_id for video_id, _, _ in entries)
+        
+        results = []
+        for video_id, position, updated_at in entries:
+            card = cards.get(video_id)
+            if card is None:
+                continue
+            if card['thumbnail_url']:
+                card['thumbnail_url'] = request.build_absolute_uri(card['thumbnail_url'])
+            progress = WatchProgressSerializer(
+                {"video_id": video_id, "position": position, "updated_at": updated_at}).data
+            results.append({**card, "position": progress["position"], "last_watched_at": progress["updated_at"]})
+        return Response(results, status=status.HTTP_200_OK)
+
+
+class VideoSearchView(APIView):
+    """API endpoint for ranked full-text search over video titles and descriptions."""
+    
+    permission_classes = [IsAuthenticated]
+    max_results = 50
+    
+    def get(self, request):
+        term = request.query_params.get('q', '').strip()
+        if not term:
+            return Response({"detail": "Query parameter 'q' is required."}, status=status.HTTP_400_BAD_REQUEST)
+        
+        videos = search_videos(Video.objects.all(), term)[:self.max_results]
+        serializer = VideoListSerializer(videos, many=True, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class RelatedVideosView(APIView):
+    """
+    API endpoint for "more like this" suggestions for a video.
+    
+    Neighbours are precomputed by the `refresh_related_videos` job, so this
+    is a single indexed read of the video's ranked RelatedVideo rows.
+    """
+    
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, movie_id):
+        if not video_exists(movie_id):
+            raise Http404("Video not found.")
+        
+        related = [
+            entry.related
+            for entry in RelatedVideo.objects.filter(video_id=movie_id).select_related('related')
+        ]
+        serializer = VideoListSerializer(related, many=True, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_200_OK)
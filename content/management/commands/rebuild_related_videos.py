@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from content.api.related import rebuild_related_videos
+
+
+class Command(BaseCommand):
+    help = 'Recompute the "more like this" neighbours of all processed videos.'
+
+    def handle(self, *args, **options):
+        rows = rebuild_related_videos()
+
+        self.stdout.write(self.style.SUCCESS(f'Stored {rows} related-video entries.'))
@@ -1,4 +1,27 @@
+import uuid
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.utils import timezone
+
+
+HLS_MANIFEST_FIELDS = ('hls_480p_manifest', 'hls_720p_manifest', 'hls_1080p_manifest')
+
+PROCESSED_OUTPUT_FIELDS = (
+    'original_file', 'thumbnail', 'video_480p', 'video_720p', 'video_1080p',
+    *HLS_MANIFEST_FIELDS, 'media_info',
+)
+
+
+class VideoQuerySet(models.QuerySet):
+    def processed(self):
+        """Videos whose HLS outputs have been generated."""
+        queryset = self
+        for field in HLS_MANIFEST_FIELDS:
+            queryset = queryset.exclude(**{f'{field}__isnull': True}).exclude(**{field: ''})
+        return queryset
 
 
 class Video(models.Model):
@@ -23,7 +46,21 @@ class Video(models.Model):
     hls_1080p_manifest = models.FileField(
         upload_to='videos/hls/1080p/', null=True, blank=True, max_length=255)
 
+    media_info = models.JSONField(null=True, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+
     upload_date = models.DateTimeField(auto_now_add=True)
+    # Decayed unique viewers of recent days, maintained by the play stats rollup.
+    popularity = models.FloatField(default=0)
+    # Weighted title/description tsvector, kept up to date by PostgreSQL itself.
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config='english')
+            + SearchVector('description', weight='B', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     GENRE_CHOICES = [
         ('action', 'Action'),
@@ -39,9 +76,24 @@ class Video(models.Model):
     ]
     genre = models.CharField(max_length=50, choices=GENRE_CHOICES)
 
+    objects = VideoQuerySet.as_manager()
+
     def __str__(self):
         return self.title
 
+    @property
+    def is_processed(self):
+        """True once all HLS manifests exist."""
+        return all(getattr(self, field) for field in HLS_MANIFEST_FIELDS)
+
+    def processed_outputs(self) -> dict:
+        """Stored original and generated files, for linking a duplicate upload to them."""
+        outputs = {}
+        for field in PROCESSED_OUTPUT_FIELDS:
+            value = getattr(self, field)
+            outputs[field] = value.name if hasattr(value, 'name') else value
+        return outputs
+
     @property
     def category(self):
         """Map genre to category for API compatibility."""
@@ -49,3 +101,144 @@ class Video(models.Model):
 
     class Meta:
         ordering = ['-upload_date']
+        indexes = [
+            models.Index(fields=['-popularity', '-upload_date'], name='video_popularity_idx'),
+            models.Index(fields=['genre', '-popularity'], name='video_genre_popularity_idx'),
+            GinIndex(fields=['search_vector'], name='video_search_vector_idx'),
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='video_title_trgm_idx'),
+        ]
+
+
+def upload_expiry():
+    """Time until which an idle chunked upload is kept."""
+    return timezone.now() + timedelta(hours=settings.CHUNKED_UPLOAD_EXPIRY_HOURS)
+
+
+class UploadSession(models.Model):
+    """Resumable chunked upload of a source file that becomes a Video on completion."""
+
+    OPEN = 'open'
+    COMPLETING = 'completing'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (OPEN, 'Open'),
+        (COMPLETING, 'Completing'),
+        (COMPLETED, 'Completed'),
+        (FAILED, 'Failed'),
+    ]
+    # Sessions that still accept parts and can be completed
+    RESUMABLE = (OPEN, FAILED)
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    title = models.CharField(max_length=255)
+    description = models.TextField()
+    genre = models.CharField(max_length=50, choices=Video.GENRE_CHOICES)
+    filename = models.CharField(max_length=255)
+    total_size = models.PositiveBigIntegerField()
+    checksum = models.CharField(max_length=64, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=OPEN)
+    error = models.TextField(blank=True)
+    video = models.ForeignKey(
+        Video, null=True, blank=True, related_name='+', on_delete=models.SET_NULL)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Pushed back by every part and status change; expired sessions are deleted with their parts.
+    expires_at = models.DateTimeField(default=upload_expiry, db_index=True)
+
+    def __str__(self):
+        return f'{self.filename} ({self.id})'
+
+    def claim(self, from_statuses, to_status: str) -> bool:
+        """
+        Move the session to another status unless a concurrent request did so first.
+
+        The conditional UPDATE is atomic, so exactly one of several
+        concurrent callers gets True.
+        """
+        expires_at = upload_expiry()
+        claimed = UploadSession.objects.filter(pk=self.pk, status__in=from_statuses).update(
+            status=to_status, expires_at=expires_at)
+        if claimed:
+            self.status = to_status
+            self.expires_at = expires_at
+        return bool(claimed)
+
+    def part_name(self, part_number: int) -> str:
+        """Storage name of a single uploaded part."""
+        return f'uploads/{self.id}/{part_number:05d}.part'
+
+
+class UploadPart(models.Model):
+    """A received and checksum-verified part of an UploadSession."""
+
+    session = models.ForeignKey(UploadSession, related_name='parts', on_delete=models.CASCADE)
+    part_number = models.PositiveIntegerField()
+    size = models.PositiveBigIntegerField()
+    checksum = models.CharField(max_length=64)
+
+    class Meta:
+        ordering = ['part_number']
+        constraints = [
+            models.UniqueConstraint(fields=['session', 'part_number'], name='unique_upload_part'),
+        ]
+
+
+class WatchProgress(models.Model):
+    """Last playback position of a user in a video."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, related_name='watch_progress', on_delete=models.CASCADE)
+    video = models.ForeignKey(Video, related_name='watch_progress', on_delete=models.CASCADE)
+    position = models.FloatField(default=0)
+    # Time of the heartbeat, not of the buffered write reaching the database.
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-updated_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'video'], name='unique_watch_progress'),
+        ]
+
+    def __str__(self):
+        return f'{self.user_id} @ {self.video_id}: {self.position:.0f}s'
+
+
+class VideoDailyStats(models.Model):
+    """Playback starts and unique viewers of a video on one day."""
+
+    video = models.ForeignKey(Video, related_name='daily_stats', on_delete=models.CASCADE)
+    date = models.DateField()
+    plays = models.PositiveIntegerField(default=0)
+    unique_viewers = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-date']
+        constraints = [
+            models.UniqueConstraint(fields=['video', 'date'], name='unique_video_daily_stats'),
+        ]
+        indexes = [
+            models.Index(fields=['date'], name='video_daily_stats_date_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.video_id} on {self.date}: {self.plays} plays'
+
+
+class RelatedVideo(models.Model):
+    """Precomputed "more like this" neighbour of a video, ranked by similarity."""
+
+    video = models.ForeignKey(Video, related_name='related_videos', on_delete=models.CASCADE)
+    related = models.ForeignKey(Video, related_name='+', on_delete=models.CASCADE)
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        ordering = ['video', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['video', 'rank'], name='unique_related_video_rank'),
+        ]
+
+    def __str__(self):
+        return f'{self.video_id} -> {self.related_id} (#{self.rank})'
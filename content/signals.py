@@ -1,12 +1,40 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete, pre_migrate
 from django.dispatch import receiver
-from django.db import transaction
+from django.db import connections, transaction
 from .models import Video
-from .api.tasks import process_video
+from .api.tasks import process_video, refresh_related_videos
+from .api.video_cache import invalidate_video_card
 
 @receiver(post_save, sender=Video)
 def trigger_processing(sender, instance, created, **kwargs):
-    """Trigger video processing after Video creation."""
+    """
+    Trigger video processing after Video creation.
     
-    if created:
+    Uploads that reuse the outputs of a processed duplicate are created
+    processed, so they go straight into the related-video lists instead.
+    """
+    
+    if not created:
+        return
+    if instance.is_processed:
+        transaction.on_commit(lambda: refresh_related_videos.delay(instance.id))
+    else:
         transaction.on_commit(lambda: process_video.delay(instance.id))
+
+
+@receiver(post_save, sender=Video)
+@receiver(post_delete, sender=Video)
+def invalidate_cached_video(sender, instance, **kwargs):
+    """Drop the cached list card so it is serialized again on the next read."""
+    
+    transaction.on_commit(lambda: invalidate_video_card(instance.id))
+
+
+@receiver(pre_migrate)
+def create_search_extensions(sender, using, **kwargs):
+    """Install pg_trgm before the content tables and their trigram index are created."""
+    
+    connection = connections[using]
+    if sender.name == 'content' and connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
@@ -0,0 +1,205 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from boto3.s3.transfer import TransferConfig
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from storages.backends.s3 import S3Storage
+from storages.utils import clean_name
+
+
+MANIFEST_EXTENSION = '.m3u8'
+
+# S3 rejects multipart parts below 5 MiB, except for the last one
+MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+
+HLS_CONTENT_TYPES = {
+    '.m3u8': 'application/vnd.apple.mpegurl',
+    '.ts': 'video/MP2T',
+    '.jpg': 'image/jpeg',
+    '.mp4': 'video/mp4',
+}
+
+
+class S3MediaStorage(S3Storage):
+    """S3-compatible media storage (AWS S3, MinIO, ...) with parallel bulk uploads."""
+
+    def upload_files(self, files) -> list:
+        """
+        Upload many local files in parallel using multipart transfers.
+
+        Args:
+            files: Iterable of (local_path, name) tuples.
+
+        Returns:
+            list: Storage names of the uploaded files.
+        """
+        client = self.connection.meta.client
+        config = TransferConfig(
+            multipart_threshold=settings.MEDIA_MULTIPART_THRESHOLD,
+            max_concurrency=settings.MEDIA_UPLOAD_WORKERS,
+        )
+
+        def upload(item):
+            local_path, name = item
+            key = self._normalize_name(clean_name(name))
+            extension = os.path.splitext(name)[1].lower()
+            extra_args = {}
+            if extension in HLS_CONTENT_TYPES:
+                extra_args['ContentType'] = HLS_CONTENT_TYPES[extension]
+            client.upload_file(local_path, self.bucket_name, key, ExtraArgs=extra_args, Config=config)
+            return name
+
+        with ThreadPoolExecutor(max_workers=settings.MEDIA_UPLOAD_WORKERS) as executor:
+            return list(executor.map(upload, files))
+
+    def concatenate(self, names, name: str) -> str:
+        """
+        Join stored files into one object with a server-side multipart copy.
+
+        Every file but the last must be at least MULTIPART_MIN_PART_SIZE.
+
+        Args:
+            names: Storage names of the files, in order.
+            name (str): Storage name of the joined file.
+
+        Returns:
+            str: Storage name the joined file was saved under.
+        """
+        client = self.connection.meta.client
+        name = self.get_available_name(name)
+        key = self._normalize_name(clean_name(name))
+        content_type = HLS_CONTENT_TYPES.get(os.path.splitext(name)[1].lower(), 'application/octet-stream')
+        upload_id = client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=key, ContentType=content_type)['UploadId']
+        try:
+            parts = []
+            for number, source in enumerate(names, start=1):
+                result = client.upload_part_copy(
+                    Bucket=self.bucket_name, Key=key, UploadId=upload_id, PartNumber=number,
+                    CopySource={'Bucket': self.bucket_name, 'Key': self._normalize_name(clean_name(source))},
+                )
+                parts.append({'ETag': result['CopyPartResult']['ETag'], 'PartNumber': number})
+            client.complete_multipart_upload(
+                Bucket=self.bucket_name, Key=key, UploadId=upload_id, MultipartUpload={'Parts': parts})
+        except Exception:
+            client.abort_multipart_upload(Bucket=self.bucket_name, Key=key, UploadId=upload_id)
+            raise
+        return name
+
+
+def storage_has_local_path(storage=None) -> bool:
+    """Return True if the storage keeps its files on the local file system."""
+    storage = storage or default_storage
+    try:
+        storage.path('')
+    except NotImplementedError:
+        return False
+    return True
+
+
+def upload_directory(local_dir: str, prefix: str, storage=None) -> list:
+    """
+    Publish every file below a local directory into the media storage.
+
+    Segments and other payload files are published first and playlists
+    last, so readers never see a manifest that references missing segments.
+    Each file replaces its previous version atomically.
+
+    Args:
+        local_dir (str): Local directory whose contents are uploaded.
+        prefix (str): Storage name prefix the relative file paths are placed under.
+        storage: Target storage, defaults to the default media storage.
+
+    Returns:
+        list: Storage names of the uploaded files.
+    """
+    storage = storage or default_storage
+    payload, manifests = [], []
+    for root, _, filenames in os.walk(local_dir):
+        for filename in sorted(filenames):
+            local_path = os.path.join(root, filename)
+            relative_path = os.path.relpath(local_path, local_dir).replace(os.sep, '/')
+            batch = manifests if filename.endswith(MANIFEST_EXTENSION) else payload
+            batch.append((local_path, f'{prefix}/{relative_path}'))
+
+    names = []
+    for files in (payload, manifests):
+        if files:
+            names.extend(_publish_files(files, storage))
+    return names
+
+
+def _publish_files(files, storage) -> list:
+    """Copy (local_path, name) pairs into the storage, replacing existing files."""
+    if hasattr(storage, 'upload_files'):
+        return storage.upload_files(files)
+
+    names = []
+    for local_path, name in files:
+        if storage_has_local_path(storage):
+            target_path = storage.path(name)
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            partial_path = f'{target_path}.part'
+            shutil.copyfile(local_path, partial_path)
+            os.replace(partial_path, target_path)
+            names.append(name)
+            continue
+
+        if storage.exists(name):
+            storage.delete(name)
+        with open(local_path, 'rb') as f:
+            names.append(storage.save(name, File(f)))
+    return names
+
+
+def scratch_directory() -> str:
+    """Create a fresh working directory on the local scratch disk."""
+    os.makedirs(settings.TRANSCODE_SCRATCH_DIR, exist_ok=True)
+    return tempfile.mkdtemp(dir=settings.TRANSCODE_SCRATCH_DIR)
+
+
+@contextmanager
+def local_file(field_file):
+    """
+    Provide a local file system path for a stored file.
+
+    Local storages hand out the real path; remote storages download the
+    file into a temporary file that is removed afterwards.
+    """
+    storage = field_file.storage
+    if storage_has_local_path(storage):
+        yield field_file.path
+        return
+
+    extension = os.path.splitext(field_file.name)[1]
+    temp_dir = scratch_directory()
+    temp_path = os.path.join(temp_dir, f'original{extension}')
+    try:
+        with open(temp_path, 'wb') as target, storage.open(field_file.name, 'rb') as source:
+            shutil.copyfileobj(source, target, length=1024 * 1024)
+        yield temp_path
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@contextmanager
+def output_directory(prefix: str, storage=None):
+    """
+    Provide a scratch directory for generated files that end up under prefix.
+
+    Files are written to the local scratch disk and published to the storage
+    only when the block exits successfully. The scratch directory is removed
+    in every case, so failed transcodes leave nothing behind.
+    """
+    storage = storage or default_storage
+    temp_dir = scratch_directory()
+    try:
+        yield temp_dir
+        upload_directory(temp_dir, prefix, storage)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,69 @@
+import pytest
+from unittest.mock import patch
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from content.models import Video
+from user_auth_app.models import User
+
+SAMPLE_MEDIA_INFO = {
+    'container': 'mov,mp4,m4a,3gp,3g2,mj2',
+    'duration': 12.5,
+    'video_codec': 'h264',
+    'width': 1920,
+    'height': 1080,
+    'audio_codec': 'aac',
+}
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """Store uploaded and generated files in a per-test directory instead of MEDIA_ROOT."""
+    settings.MEDIA_ROOT = str(tmp_path / 'media')
+
+
+@pytest.fixture
+def video_probe():
+    """Make ffprobe accept uploaded test files as valid videos."""
+    with patch('content.api.upload_handlers.probe_video', return_value=SAMPLE_MEDIA_INFO) as mock_probe:
+        yield mock_probe
+
+
+@pytest.fixture
+def make_user(db):
+    """Provide a factory for active users with the test password."""
+    def make_user(email='viewer@test.com', **extra_fields):
+        return User.objects.create_user(
+            email=email,
+            password='TestPassword123!',
+            username=email,
+            is_active=True,
+            **extra_fields
+        )
+    return make_user
+
+
+@pytest.fixture
+def user(make_user):
+    """Create a regular user."""
+    return make_user()
+
+
+@pytest.fixture
+def authenticated_client(user):
+    """Provide an APIClient with the access token cookie of `user`."""
+    api_client = APIClient()
+    api_client.cookies['access_token'] = str(RefreshToken.for_user(user).access_token)
+    return api_client
+
+
+@pytest.fixture
+def make_video(db):
+    """Provide a factory for videos; processed ones get all HLS manifests."""
+    def make_video(title='Test Video', description='Test Description', genre='action', processed=False, **fields):
+        if processed:
+            fields.update({
+                f'hls_{resolution}_manifest': f'videos/hls/{resolution}/{title}/index.m3u8'
+                for resolution in ('480p', '720p', '1080p')
+            })
+        return Video.objects.create(title=title, description=description, genre=genre, **fields)
+    return make_video
@@ -0,0 +1,189 @@
+import pytest
+import hashlib
+import tempfile
+from datetime import timedelta
+from unittest.mock import patch
+from uuid import UUID
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from django.utils import timezone
+from django.test import override_settings
+from rest_framework.test import APIClient
+from user_auth_app.models import User
+from content.api.tasks import cleanup_upload_sessions, complete_chunked_upload
+from content.models import Video, UploadSession
+
+PART_1 = b'a' * 1024
+PART_2 = b'b' * 512
+
+
+@pytest.fixture
+def admin_client():
+    """Provide an APIClient authenticated as admin."""
+    admin_user = User.objects.create_superuser(
+        email='admin@test.com',
+        password='AdminPassword123!',
+        username='admin@test.com'
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=admin_user)
+    return api_client
+
+
+def _start_upload(api_client, **overrides):
+    data = {
+        'title': 'Chunked Video',
+        'description': 'Uploaded in parts',
+        'genre': 'drama',
+        'filename': 'master.mp4',
+        'total_size': len(PART_1) + len(PART_2),
+        'checksum': hashlib.sha256(PART_1 + PART_2).hexdigest(),
+    }
+    data.update(overrides)
+    return api_client.post(reverse('chunked-upload'), data, format='json')
+
+
+def _put_part(api_client, upload_id, part_number, content, **headers):
+    url = reverse('chunked-upload-part', kwargs={'upload_id': upload_id, 'part_number': part_number})
+    return api_client.put(url, data=content, content_type='application/octet-stream', headers=headers)
+
+
+@pytest.mark.django_db
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+def test_chunked_upload_complete_flow(admin_client, django_capture_on_commit_callbacks):
+    """Test uploading a file in parts and assembling it into a video."""
+    response = _start_upload(admin_client)
+    assert response.status_code == 201
+    upload_id = response.data['upload_id']
+    assert not Video.objects.exists()
+
+    assert _put_part(admin_client, upload_id, 2, PART_2).status_code == 200
+    response = _put_part(
+        admin_client, upload_id, 1, PART_1,
+        **{'X-Checksum-SHA256': hashlib.sha256(PART_1).hexdigest()}
+    )
+    assert response.status_code == 200
+    assert response.data['size'] == len(PART_1)
+
+    status_response = admin_client.get(reverse('chunked-upload-detail', kwargs={'upload_id': upload_id}))
+    assert [part['part_number'] for part in status_response.data['parts']] == [1, 2]
+    assert status_response.data['received_bytes'] == len(PART_1) + len(PART_2)
+
+    with patch('content.api.views.complete_chunked_upload') as mock_job:
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_client.post(reverse('chunked-upload-complete', kwargs={'upload_id': upload_id}))
+    assert response.status_code == 202
+    assert response.data['status'] == UploadSession.COMPLETING
+    mock_job.delay.assert_called_once_with(UploadSession.objects.get().pk)
+    assert not Video.objects.exists()
+
+    video_id = complete_chunked_upload(upload_id)
+
+    status_response = admin_client.get(reverse('chunked-upload-detail', kwargs={'upload_id': upload_id}))
+    assert status_response.data['status'] == UploadSession.COMPLETED
+    assert status_response.data['video_id'] == video_id
+    assert status_response.data['parts'] == []
+    video = Video.objects.get(pk=video_id)
+    assert video.title == 'Chunked Video'
+    assert video.content_hash == hashlib.sha256(PART_1 + PART_2).hexdigest()
+    assert video.original_file.name.startswith('videos/original/master')
+    with video.original_file.open('rb') as f:
+        assert f.read() == PART_1 + PART_2
+
+
+@pytest.mark.django_db
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+def test_chunked_upload_part_checksum_mismatch(admin_client):
+    """Test that a part with a wrong checksum is rejected."""
+    upload_id = _start_upload(admin_client).data['upload_id']
+
+    response = _put_part(admin_client, upload_id, 1, PART_1, **{'X-Checksum-SHA256': '0' * 64})
+
+    assert response.status_code == 400
+    assert response.data['detail'] == 'Part checksum mismatch.'
+    assert not UploadSession.objects.get(pk=upload_id).parts.exists()
+
+
+@pytest.mark.django_db
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+def test_chunked_upload_complete_missing_part(admin_client):
+    """Test that completing an upload with gaps fails without creating a video."""
+    upload_id = _start_upload(admin_client).data['upload_id']
+    _put_part(admin_client, upload_id, 2, PART_2)
+
+    response = admin_client.post(reverse('chunked-upload-complete', kwargs={'upload_id': upload_id}))
+
+    assert response.status_code == 400
+    assert not Video.objects.exists()
+    assert UploadSession.objects.get(pk=upload_id).status == UploadSession.OPEN
+
+
+@pytest.mark.django_db
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+def test_chunked_upload_file_checksum_mismatch(admin_client):
+    """Test that the assembled file is verified against the announced checksum."""
+    upload_id = _start_upload(admin_client, checksum='f' * 64).data['upload_id']
+    _put_part(admin_client, upload_id, 1, PART_1)
+    _put_part(admin_client, upload_id, 2, PART_2)
+
+    with patch('content.api.views.complete_chunked_upload'):
+        response = admin_client.post(reverse('chunked-upload-complete', kwargs={'upload_id': upload_id}))
+    assert response.status_code == 202
+
+    assert complete_chunked_upload(upload_id) is None
+
+    session = UploadSession.objects.get(pk=upload_id)
+    assert session.status == UploadSession.FAILED
+    assert session.error == 'File checksum mismatch.'
+    assert not Video.objects.exists()
+    assert _put_part(admin_client, upload_id, 2, PART_2).status_code == 200
+
+
+@pytest.mark.django_db
+def test_chunked_upload_completed_only_once(admin_client):
+    """Test that a second completion of the same upload gets 409 and creates no second video."""
+    upload_id = _start_upload(admin_client).data['upload_id']
+    _put_part(admin_client, upload_id, 1, PART_1)
+    _put_part(admin_client, upload_id, 2, PART_2)
+    first, second = UploadSession.objects.get(pk=upload_id), UploadSession.objects.get(pk=upload_id)
+
+    assert first.claim(UploadSession.RESUMABLE, UploadSession.COMPLETING)
+    assert not second.claim(UploadSession.RESUMABLE, UploadSession.COMPLETING)
+
+    response = admin_client.post(reverse('chunked-upload-complete', kwargs={'upload_id': upload_id}))
+    assert response.status_code == 409
+    assert _put_part(admin_client, upload_id, 2, PART_2).status_code == 409
+    assert not Video.objects.exists()
+
+
+@pytest.mark.django_db
+def test_expired_uploads_are_deleted_with_their_parts(admin_client):
+    """Test that the cleanup job removes abandoned uploads and their stored parts only."""
+    stale_id = _start_upload(admin_client).data['upload_id']
+    _put_part(admin_client, stale_id, 1, PART_1)
+    active_id = _start_upload(admin_client).data['upload_id']
+    _put_part(admin_client, active_id, 1, PART_1)
+    UploadSession.objects.filter(pk=stale_id).update(expires_at=timezone.now() - timedelta(minutes=1))
+
+    assert cleanup_upload_sessions() == 1
+
+    assert list(UploadSession.objects.values_list('pk', flat=True)) == [UUID(active_id)]
+    assert not default_storage.exists(f'uploads/{stale_id}/00001.part')
+    assert default_storage.exists(f'uploads/{active_id}/00001.part')
+
+
+@pytest.mark.django_db
+def test_chunked_upload_regular_user_forbidden():
+    """Test that regular users cannot start chunked uploads."""
+    user = User.objects.create_user(
+        email='user@test.com',
+        password='UserPassword123!',
+        username='user@test.com',
+        is_active=True
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+
+    response = _start_upload(api_client)
+
+    assert response.status_code == 403
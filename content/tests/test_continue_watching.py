@@ -0,0 +1,113 @@
+import functools
+import json
+import pytest
+from unittest.mock import patch
+from django.urls import reverse
+from rest_framework.test import APIClient
+from content.api.progress import flush_progress, get_continue_watching, record_progress
+from content.api.video_cache import get_video_cards
+from content.models import Video, WatchProgress
+
+
+@pytest.fixture
+def make_video(make_video):
+    """Create videos with a known duration, so finished ones can be told apart."""
+    return functools.partial(make_video, media_info={'duration': 100})
+
+
+@pytest.mark.django_db
+def test_continue_watching_lists_unfinished_videos_most_recent_first(user, authenticated_client, make_video):
+    """Test that started videos are listed newest first and finished ones are left out."""
+    first = make_video('First')
+    second = make_video('Second')
+    finished = make_video('Finished')
+    record_progress(user.id, first.id, 10)
+    record_progress(user.id, finished.id, 99)
+    record_progress(user.id, second.id, 20)
+    flush_progress(batch_size=100)
+
+    response = authenticated_client.get(reverse('continue-watching'))
+
+    assert response.status_code == 200
+    assert [entry['title'] for entry in response.data] == ['Second', 'First']
+    assert response.data[0]['position'] == 20
+    assert response.data[0]['last_watched_at'] is not None
+
+
+@pytest.mark.django_db
+def test_continue_watching_served_from_redis(django_assert_num_queries, user, authenticated_client, make_video):
+    """Test that a warm row needs no database queries besides authentication."""
+    video = make_video()
+    record_progress(user.id, video.id, 10)
+    flush_progress(batch_size=100)
+    authenticated_client.get(reverse('continue-watching'))
+
+    record_progress(user.id, video.id, 50)
+    flush_progress(batch_size=100)
+
+    with django_assert_num_queries(0):
+        response = authenticated_client.get(reverse('continue-watching'))
+
+    assert response.data[0]['position'] == 50
+
+
+@pytest.mark.django_db
+def test_flush_removes_finished_videos_from_row(user, make_video):
+    """Test that finishing a video removes it from an existing row."""
+    video = make_video()
+    record_progress(user.id, video.id, 10)
+    flush_progress(batch_size=100)
+    assert [entry[0] for entry in get_continue_watching(user.id, 10)] == [video.id]
+
+    record_progress(user.id, video.id, 96)
+    flush_progress(batch_size=100)
+
+    assert get_continue_watching(user.id, 10) == []
+
+
+@pytest.mark.django_db
+def test_continue_watching_rebuilt_from_database(redis_connection, user, make_video):
+    """Test that a missing sorted set is rebuilt from stored progress."""
+    video = make_video()
+    WatchProgress.objects.create(user=user, video=video, position=30)
+
+    entries = get_continue_watching(user.id, 10)
+
+    assert [(video_id, position) for video_id, position, _ in entries] == [(video.id, 30)]
+    assert redis_connection.zcard(redis_connection.keys('*continue_watching:*')[0]) == 1
+
+
+@pytest.mark.django_db
+def test_video_card_invalidated_on_change(django_capture_on_commit_callbacks, make_video):
+    """Test that cached cards are serialized again after the video changes."""
+    video = make_video('Old Title')
+    assert get_video_cards([video.id])[video.id]['title'] == 'Old Title'
+
+    with django_capture_on_commit_callbacks(execute=True):
+        video.title = 'New Title'
+        video.save()
+
+    assert get_video_cards([video.id])[video.id]['title'] == 'New Title'
+
+
+@pytest.mark.django_db
+def test_video_card_builds_thumbnail_url_on_read(redis_connection, make_video):
+    """Test that cached cards keep the storage name, so signed thumbnail URLs are fresh on every read."""
+    video = make_video()
+    Video.objects.filter(pk=video.pk).update(thumbnail='videos/thumbnails/test.jpg')
+    storage = Video._meta.get_field('thumbnail').storage
+
+    with patch.object(storage, 'url', side_effect=lambda name: f'https://s3.test/{name}?signature=1'):
+        assert get_video_cards([video.id])[video.id]['thumbnail_url'].endswith('?signature=1')
+    with patch.object(storage, 'url', side_effect=lambda name: f'https://s3.test/{name}?signature=2'):
+        assert get_video_cards([video.id])[video.id]['thumbnail_url'].endswith('?signature=2')
+
+    cached = json.loads(redis_connection.hget(redis_connection.keys('*video_cards')[0], video.id))
+    assert cached['thumbnail_url'] == 'videos/thumbnails/test.jpg'
+
+
+@pytest.mark.django_db
+def test_continue_watching_requires_authentication():
+    """Test that anonymous users cannot read the row."""
+    response = APIClient().get(reverse('continue-watching'))
+    assert response.status_code == 401
@@ -0,0 +1,129 @@
+import pytest
+import hashlib
+import os
+import tempfile
+from unittest.mock import patch
+from django.urls import reverse
+from django.test import override_settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.test import APIClient
+from user_auth_app.models import User
+from content.models import Video
+from content.api.tasks import process_video
+
+CONTENT = b"fake video content"
+CONTENT_HASH = hashlib.sha256(CONTENT).hexdigest()
+
+
+def _create_processed_video(**kwargs):
+    return Video.objects.create(
+        title='Original Upload',
+        description='Processed before',
+        genre='action',
+        original_file='videos/original/master.mp4',
+        thumbnail='videos/thumbnails/master.jpg',
+        hls_480p_manifest='videos/hls/480p/master/index.m3u8',
+        hls_720p_manifest='videos/hls/720p/master/index.m3u8',
+        hls_1080p_manifest='videos/hls/1080p/master/index.m3u8',
+        content_hash=CONTENT_HASH,
+        **kwargs
+    )
+
+
+@pytest.mark.django_db
+def test_processed_queryset_and_property():
+    """Test that only videos with all HLS manifests count as processed."""
+    processed = _create_processed_video()
+    pending = Video.objects.create(title='Pending', description='Pending', genre='drama')
+
+    assert processed.is_processed
+    assert not pending.is_processed
+    assert list(Video.objects.processed()) == [processed]
+
+
+@pytest.mark.django_db
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+def test_upload_of_known_content_reuses_outputs(video_probe, django_capture_on_commit_callbacks):
+    """Test that re-uploading processed content links to the existing outputs."""
+    existing = _create_processed_video()
+    admin_user = User.objects.create_superuser(
+        email='admin@test.com',
+        password='AdminPassword123!',
+        username='admin@test.com'
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=admin_user)
+
+    data = {
+        'title': 'Re-upload',
+        'description': 'Same master again',
+        'genre': 'action',
+        'original_file': SimpleUploadedFile("master.mp4", CONTENT, content_type="video/mp4"),
+    }
+    with patch('content.signals.process_video') as mock_process, \
+            patch('content.signals.refresh_related_videos') as mock_refresh:
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(reverse('video-upload'), data, format='multipart')
+
+    assert response.status_code == 201
+    assert response.data['detail'] == 'Video uploaded successfully. Existing processed files were reused.'
+    mock_process.delay.assert_not_called()
+
+    video = Video.objects.get(title='Re-upload')
+    mock_refresh.delay.assert_called_once_with(video.id)
+    assert video.content_hash == CONTENT_HASH
+    assert video.original_file.name == existing.original_file.name
+    assert video.hls_720p_manifest.name == existing.hls_720p_manifest.name
+    assert video.thumbnail.name == existing.thumbnail.name
+
+
+@pytest.mark.django_db
+def test_upload_of_new_content_stores_hash(video_probe, django_capture_on_commit_callbacks):
+    """Test that new content is stored with its hash and queued for processing."""
+    admin_user = User.objects.create_superuser(
+        email='admin@test.com',
+        password='AdminPassword123!',
+        username='admin@test.com'
+    )
+    api_client = APIClient()
+    api_client.force_authenticate(user=admin_user)
+
+    data = {
+        'title': 'New Upload',
+        'description': 'Never seen before',
+        'genre': 'drama',
+        'original_file': SimpleUploadedFile("new.mp4", b"other content", content_type="video/mp4"),
+    }
+    with patch('content.signals.process_video') as mock_process:
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(reverse('video-upload'), data, format='multipart')
+
+    assert response.status_code == 201
+    video = Video.objects.get(title='New Upload')
+    assert video.content_hash == hashlib.sha256(b"other content").hexdigest()
+    mock_process.delay.assert_called_once_with(video.id)
+
+
+@pytest.mark.django_db
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+def test_process_video_links_duplicate_instead_of_transcoding(settings):
+    """Test that the processing job reuses outputs for content uploaded through other paths."""
+    existing = _create_processed_video()
+    original_path = os.path.join(settings.MEDIA_ROOT, 'videos/original/copy.mp4')
+    os.makedirs(os.path.dirname(original_path), exist_ok=True)
+    with open(original_path, 'wb') as f:
+        f.write(CONTENT)
+    video = Video.objects.create(
+        title='Admin Upload', description='Uploaded in admin', genre='action',
+        original_file='videos/original/copy.mp4',
+    )
+
+    with patch('content.api.tasks.convert_video_to_hls') as mock_convert:
+        process_video(video.id)
+
+    mock_convert.assert_not_called()
+    video.refresh_from_db()
+    assert video.content_hash == CONTENT_HASH
+    assert video.original_file.name == existing.original_file.name
+    assert video.is_processed
+    assert not os.path.exists(original_path)
@@ -0,0 +1,80 @@
+import datetime
+import io
+import pytest
+from unittest.mock import patch
+from django.urls import reverse
+from django.utils import timezone
+from content.api.stats import record_play, rollup_day, update_popularity
+from content.api.tasks import rollup_play_stats
+from content.models import Video, VideoDailyStats
+
+
+@pytest.mark.django_db
+def test_manifest_request_counts_play_without_database_write(authenticated_client, make_video):
+    """Test that loading a manifest counts one play per viewer and dedup window."""
+    video = make_video()
+
+    with patch('content.api.views.default_storage') as storage:
+        storage.exists.return_value = True
+        storage.open.side_effect = lambda *args: io.BytesIO(b'#EXTM3U\n')
+        for resolution in ('480p', '720p'):
+            url = reverse('hls-manifest', kwargs={'movie_id': video.id, 'resolution': resolution})
+            assert authenticated_client.get(url).status_code == 200
+
+    assert not VideoDailyStats.objects.exists()
+    assert rollup_play_stats() == 1
+
+    stats = VideoDailyStats.objects.get(video=video, date=timezone.localdate())
+    assert stats.plays == 1
+    assert stats.unique_viewers == 1
+
+
+@pytest.mark.django_db
+def test_rollup_counts_unique_viewers_and_is_idempotent(make_video):
+    """Test that plays and unique viewers are rolled up and repeated rollups overwrite."""
+    video = make_video()
+    for user_id in (1, 2, 3):
+        record_play(video.id, user_id)
+    today = timezone.localdate()
+
+    assert rollup_day(today) == 1
+    record_play(video.id, 4)
+    assert rollup_day(today) == 1
+
+    stats = VideoDailyStats.objects.get(video=video, date=today)
+    assert (stats.plays, stats.unique_viewers) == (4, 4)
+
+
+@pytest.mark.django_db
+def test_popularity_decays_with_age(make_video):
+    """Test that recent viewers weigh more than older ones and stale scores are reset."""
+    today = timezone.localdate()
+    recent = make_video('Recent')
+    older = make_video('Older')
+    stale = make_video('Stale')
+    Video.objects.filter(pk=stale.pk).update(popularity=5)
+    VideoDailyStats.objects.create(video=recent, date=today, plays=10, unique_viewers=10)
+    VideoDailyStats.objects.create(
+        video=older, date=today - datetime.timedelta(days=2), plays=10, unique_viewers=10)
+
+    update_popularity(today)
+
+    scores = dict(Video.objects.values_list('title', 'popularity'))
+    assert scores == {'Recent': 10, 'Older': 5, 'Stale': 0}
+
+
+@pytest.mark.django_db
+def test_video_list_sorted_by_popularity(authenticated_client, make_video):
+    """Test that sort=popular orders by score and can be limited to a genre."""
+    make_video('Quiet', genre='action')
+    Video.objects.filter(pk=make_video('Hit', genre='action').pk).update(popularity=9)
+    Video.objects.filter(pk=make_video('Funny', genre='comedy').pk).update(popularity=20)
+
+    response = authenticated_client.get(reverse('video-list'), {'sort': 'popular'})
+    assert [video['title'] for video in response.data] == ['Funny', 'Hit', 'Quiet']
+
+    response = authenticated_client.get(reverse('video-list'), {'sort': 'popular', 'genre': 'action'})
+    assert [video['title'] for video in response.data] == ['Hit', 'Quiet']
+
+    response = authenticated_client.get(reverse('video-list'), {'sort': 'random'})
+    assert response.status_code == 400
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from content.api.related import add_related_video, build_tfidf, rebuild_related_videos, tokenize
+from content.api.tasks import refresh_related_videos
+from content.models import RelatedVideo
+
+
+def _related_titles(video):
+    return list(
+        RelatedVideo.objects.filter(video=video).order_by('rank').values_list('related__title', flat=True))
+
+
+def test_tfidf_rows_are_normalised_and_weight_rare_terms():
+    """Test that rows have unit length and shared rare terms outweigh common ones."""
+    tfidf = build_tfidf([
+        tokenize('Space pirates in space'),
+        tokenize('Pirates of the ocean'),
+        tokenize('Space station'),
+        tokenize(''),
+    ])
+
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    assert np.allclose(norms, [1, 1, 1, 0])
+    similarity = (tfidf @ tfidf.T).toarray()
+    assert similarity[0, 2] > similarity[0, 1] > 0
+    assert similarity[1, 2] == 0
+
+
+@pytest.mark.django_db
+def test_rebuild_ranks_by_text_and_genre(make_video):
+    """Test that neighbours are ordered by text similarity plus genre and unprocessed videos are left out."""
+    heist = make_video('Bank Heist', 'A crew plans a daring bank robbery.', processed=True)
+    sequel = make_video('Bank Heist Returns', 'The crew robs another bank.', processed=True)
+    drama = make_video('Bank Holiday', 'A family drama during the holiday.', genre='drama', processed=True)
+    make_video('Zombie Night', 'Survivors hide from zombies.', genre='horror', processed=True)
+    make_video('Bank Job', 'A crew and a bank vault.')
+
+    assert rebuild_related_videos() > 0
+
+    assert _related_titles(heist) == ['Bank Heist Returns', 'Bank Holiday']
+    assert _related_titles(sequel)[0] == 'Bank Heist'
+    assert 'Zombie Night' not in _related_titles(drama)
+
+
+@pytest.mark.django_db
+@override_settings(RELATED_VIDEOS={'TOP_K': 1, 'TITLE_WEIGHT': 2, 'GENRE_WEIGHT': 0.2, 'BATCH_SIZE': 2})
+def test_incremental_add_updates_neighbour_lists(make_video):
+    """Test that a new video gets neighbours and replaces weaker entries of similar videos."""
+    heist = make_video('Bank Heist', 'A crew plans a daring bank robbery.', processed=True)
+    make_video('Car Chase', 'A crew races across town.', processed=True)
+    rebuild_related_videos()
+    assert _related_titles(heist) == ['Car Chase']
+
+    sequel = make_video('Bank Heist Returns', 'The crew robs another bank.', processed=True)
+    assert refresh_related_videos(sequel.id) >= 2
+
+    assert _related_titles(sequel) == ['Bank Heist']
+    assert _related_titles(heist) == ['Bank Heist Returns']
+
+
+@pytest.mark.django_db
+def test_incremental_add_ignores_unprocessed_video(make_video):
+    """Test that videos still being processed are not added."""
+    video = make_video('Bank Heist', 'A crew plans a daring bank robbery.')
+
+    assert add_related_video(video.id) == 0
+    assert not RelatedVideo.objects.exists()
+
+
+@pytest.mark.django_db
+def test_related_endpoint_is_single_query(django_assert_num_queries, authenticated_client, make_video):
+    """Test that the endpoint serves precomputed neighbours with one query."""
+    heist = make_video('Bank Heist', 'A crew plans a daring bank robbery.', processed=True)
+    make_video('Bank Heist Returns', 'The crew robs another bank.', processed=True)
+    rebuild_related_videos()
+    url = reverse('related-videos', kwargs={'movie_id': heist.id})
+    authenticated_client.get(url)
+
+    with django_assert_num_queries(1):
+        response = authenticated_client.get(url)
+
+    assert response.status_code == 200
+    assert [video['title'] for video in response.data] == ['Bank Heist Returns']
+    assert authenticated_client.get(reverse('related-videos', kwargs={'movie_id': 99999})).status_code == 404
@@ -0,0 +1,149 @@
+import pytest
+import os
+import tempfile
+import boto3
+from moto import mock_aws
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from content.storage import (
+    MULTIPART_MIN_PART_SIZE, S3MediaStorage, storage_has_local_path, upload_directory, local_file, output_directory
+)
+from content.models import Video
+
+
+@pytest.fixture
+def s3_storage():
+    """Provide an S3MediaStorage backed by a moto bucket."""
+    with mock_aws():
+        boto3.client('s3', region_name='us-east-1').create_bucket(Bucket='test-media')
+        yield S3MediaStorage(
+            bucket_name='test-media',
+            access_key='testing',
+            secret_key='testing',
+            region_name='us-east-1',
+        )
+
+
+def _write_hls_files(directory):
+    with open(os.path.join(directory, 'index.m3u8'), 'w') as f:
+        f.write('#EXTM3U\n')
+    for index in range(3):
+        with open(os.path.join(directory, f'{index:03d}.ts'), 'wb') as f:
+            f.write(b'segment')
+
+
+def test_storage_has_local_path():
+    """Test local path detection for file system and object storages."""
+    assert storage_has_local_path(FileSystemStorage(location=tempfile.gettempdir()))
+
+
+def test_s3_storage_has_no_local_path(s3_storage):
+    """Test that the S3 storage is treated as remote."""
+    assert not storage_has_local_path(s3_storage)
+
+
+def test_upload_directory_to_s3(s3_storage):
+    """Test parallel upload of an HLS directory into the bucket."""
+    with tempfile.TemporaryDirectory() as local_dir:
+        _write_hls_files(local_dir)
+        names = upload_directory(local_dir, 'videos/hls/480p/movie', s3_storage)
+
+    assert sorted(names) == [
+        'videos/hls/480p/movie/000.ts',
+        'videos/hls/480p/movie/001.ts',
+        'videos/hls/480p/movie/002.ts',
+        'videos/hls/480p/movie/index.m3u8',
+    ]
+    assert s3_storage.exists('videos/hls/480p/movie/index.m3u8')
+
+    head = s3_storage.connection.meta.client.head_object(
+        Bucket='test-media', Key='videos/hls/480p/movie/000.ts')
+    assert head['ContentType'] == 'video/MP2T'
+
+
+def test_s3_concatenate_copies_parts_server_side(s3_storage):
+    """Test that stored parts are joined into one object with a multipart copy."""
+    first = b'a' * MULTIPART_MIN_PART_SIZE
+    s3_storage.save('uploads/test/00001.part', ContentFile(first))
+    s3_storage.save('uploads/test/00002.part', ContentFile(b'tail'))
+
+    name = s3_storage.concatenate(
+        ['uploads/test/00001.part', 'uploads/test/00002.part'], 'videos/original/movie.mp4')
+
+    assert name == 'videos/original/movie.mp4'
+    with s3_storage.open(name, 'rb') as f:
+        assert f.read() == first + b'tail'
+
+
+def test_upload_directory_to_file_system_overwrites():
+    """Test that uploads to a file system storage keep their exact names."""
+    with tempfile.TemporaryDirectory() as media_root, tempfile.TemporaryDirectory() as local_dir:
+        storage = FileSystemStorage(location=media_root)
+        storage.save('videos/hls/480p/movie/index.m3u8', ContentFile(b'old'))
+        _write_hls_files(local_dir)
+
+        names = upload_directory(local_dir, 'videos/hls/480p/movie', storage)
+
+        assert 'videos/hls/480p/movie/index.m3u8' in names
+        with storage.open('videos/hls/480p/movie/index.m3u8') as f:
+            assert f.read() == b'#EXTM3U\n'
+
+
+def test_output_directory_uploads_to_s3(s3_storage):
+    """Test that generated files are uploaded when the block exits."""
+    with output_directory('videos/thumbnails', s3_storage) as directory:
+        with open(os.path.join(directory, 'movie.jpg'), 'wb') as f:
+            f.write(b'jpeg')
+
+    assert not os.path.exists(directory)
+    assert s3_storage.exists('videos/thumbnails/movie.jpg')
+
+
+def test_local_file_downloads_remote_original(s3_storage):
+    """Test that remote originals are downloaded to a temporary file."""
+    s3_storage.save('videos/original/movie.mp4', ContentFile(b'video bytes'))
+    video = Video(title='Test', description='Test', genre='action')
+    video.original_file.storage = s3_storage
+    video.original_file.name = 'videos/original/movie.mp4'
+
+    with local_file(video.original_file) as path:
+        with open(path, 'rb') as f:
+            assert f.read() == b'video bytes'
+
+    assert not os.path.exists(path)
+
+
+def test_upload_directory_publishes_manifest_last(s3_storage):
+    """Test that playlists are uploaded after all segments."""
+    calls = []
+    original_upload_files = s3_storage.upload_files
+
+    def record(files):
+        files = list(files)
+        calls.append([name for _, name in files])
+        return original_upload_files(files)
+
+    s3_storage.upload_files = record
+    with tempfile.TemporaryDirectory() as local_dir:
+        _write_hls_files(local_dir)
+        upload_directory(local_dir, 'videos/hls/720p/movie', s3_storage)
+
+    assert len(calls) == 2
+    assert all(name.endswith('.ts') for name in calls[0])
+    assert calls[1] == ['videos/hls/720p/movie/index.m3u8']
+
+
+def test_output_directory_uses_scratch_dir_and_cleans_up_on_failure(settings):
+    """Test that failed transcodes publish nothing and remove their scratch files."""
+    with tempfile.TemporaryDirectory() as media_root, tempfile.TemporaryDirectory() as scratch:
+        settings.TRANSCODE_SCRATCH_DIR = scratch
+        storage = FileSystemStorage(location=media_root)
+
+        with pytest.raises(RuntimeError):
+            with output_directory('videos/hls/480p/movie', storage) as directory:
+                assert directory.startswith(scratch)
+                _write_hls_files(directory)
+                raise RuntimeError('ffmpeg failed')
+
+        assert os.listdir(scratch) == []
+        assert not storage.exists('videos/hls/480p/movie/index.m3u8')
@@ -1,5 +1,6 @@
 import pytest
 import os
+from unittest.mock import patch
 from django.urls import reverse
 from django.core.files.uploadedfile import SimpleUploadedFile, InMemoryUploadedFile
 from rest_framework.test import APIClient
@@ -7,6 +8,8 @@ from user_auth_app.models import User
 from content.models import Video
 import io
 
+pytestmark = pytest.mark.usefixtures('video_probe')
+
 @pytest.mark.django_db
 class TestVideoUploadEdgeCases:
     """Test video upload with various edge cases."""
@@ -110,10 +113,13 @@ class TestVideoUploadEdgeCases:
             'original_file': fake_video
         }
         
-        response = self.api_client.post(self.url, data, format='multipart')
+        with patch('content.api.upload_handlers.probe_video', return_value=None):
+            response = self.api_client.post(self.url, data, format='multipart')
         
-        # Should succeed at upload level (content validation would happen during processing)
-        assert response.status_code == 201
+        # Rejected while uploading because ffprobe finds no video stream
+        assert response.status_code == 400
+        assert 'original_file' in response.data
+        assert not Video.objects.filter(title='Fake Video').exists()
     
     def test_upload_file_with_special_characters(self):
         """Test uploading file with special characters in filename."""
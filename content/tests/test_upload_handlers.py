@@ -0,0 +1,88 @@
+import pytest
+import hashlib
+from unittest.mock import patch
+from django.core.files.uploadhandler import SkipFile
+from content.api.upload_handlers import VideoProbeUploadHandler, INVALID_VIDEO_MESSAGE
+from .conftest import SAMPLE_MEDIA_INFO
+
+MP4_HEADER = b'\x00\x00\x00\x18ftypmp42' + b'\x00' * 52
+
+
+def _start(handler):
+    handler.new_file('original_file', 'movie.mp4', 'video/mp4', None)
+
+
+@pytest.fixture
+def small_header(settings):
+    settings.VIDEO_PROBE_HEADER_BYTES = 64
+
+
+def test_handler_hashes_and_probes_while_receiving(small_header):
+    """Test that the header is probed before the upload finishes."""
+    handler = VideoProbeUploadHandler()
+    _start(handler)
+
+    with patch('content.api.upload_handlers.probe_video', return_value=SAMPLE_MEDIA_INFO) as mock_probe:
+        handler.receive_data_chunk(MP4_HEADER + b'a' * 100, 0)
+        assert mock_probe.call_count == 1
+        assert mock_probe.call_args.kwargs['data'] == MP4_HEADER[:64]
+        handler.receive_data_chunk(b'b' * 100, 164)
+        file = handler.file_complete(264)
+
+    assert mock_probe.call_count == 1
+    assert file.content_hash == hashlib.sha256(MP4_HEADER + b'a' * 100 + b'b' * 100).hexdigest()
+    assert file.media_info == SAMPLE_MEDIA_INFO
+    file.close()
+
+
+def test_handler_rejects_non_video_early(small_header):
+    """Test that files without a video stream are skipped after the header."""
+    handler = VideoProbeUploadHandler()
+    _start(handler)
+
+    with patch('content.api.upload_handlers.probe_video', return_value=None):
+        with pytest.raises(SkipFile):
+            handler.receive_data_chunk(b'This is not a video file' * 10, 0)
+
+    assert handler.error == INVALID_VIDEO_MESSAGE
+
+
+def test_handler_defers_mp4_with_index_at_end(small_header):
+    """Test that MP4 headers without moov are probed again from the complete file."""
+    handler = VideoProbeUploadHandler()
+    _start(handler)
+
+    with patch('content.api.upload_handlers.probe_video', side_effect=[None, SAMPLE_MEDIA_INFO]) as mock_probe:
+        handler.receive_data_chunk(MP4_HEADER + b'a' * 100, 0)
+        file = handler.file_complete(len(MP4_HEADER) + 100)
+
+    assert mock_probe.call_args.args[0] == file.temporary_file_path()
+    assert file.media_info == SAMPLE_MEDIA_INFO
+    file.close()
+
+
+def test_handler_rejects_invalid_file_on_complete(small_header):
+    """Test that files smaller than the probe header are validated on completion."""
+    handler = VideoProbeUploadHandler()
+    _start(handler)
+
+    with patch('content.api.upload_handlers.probe_video', return_value=None):
+        handler.receive_data_chunk(b'tiny', 0)
+        file = handler.file_complete(4)
+
+    assert file is None
+    assert handler.error == INVALID_VIDEO_MESSAGE
+
+
+def test_handler_accepts_without_ffprobe(small_header):
+    """Test that uploads still work when ffprobe is not installed."""
+    handler = VideoProbeUploadHandler()
+    _start(handler)
+
+    with patch('content.api.upload_handlers.probe_video', side_effect=FileNotFoundError):
+        handler.receive_data_chunk(b'fake video content' * 10, 0)
+        file = handler.file_complete(180)
+
+    assert file.media_info is None
+    assert file.content_hash == hashlib.sha256(b'fake video content' * 10).hexdigest()
+    file.close()
@@ -0,0 +1,75 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+from content.models import Video
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != 'postgresql', reason='Full-text search requires PostgreSQL.')
+
+
+@pytest.fixture
+def videos(db):
+    return [
+        Video.objects.create(title='Ocean Planet', description='Whales migrating across the sea.', genre='documentary'),
+        Video.objects.create(title='Night Shift', description='A detective hunts a killer by the ocean.', genre='thriller'),
+        Video.objects.create(title='Baking Club', description='Friends open a small bakery.', genre='comedy'),
+    ]
+
+
+@pytest.mark.django_db
+def test_search_ranks_title_matches_first(videos, authenticated_client):
+    """Test that title matches rank above description matches."""
+    response = authenticated_client.get(reverse('video-search'), {'q': 'ocean'})
+
+    assert response.status_code == 200
+    assert [video['title'] for video in response.data] == ['Ocean Planet', 'Night Shift']
+
+
+@pytest.mark.django_db
+def test_search_matches_word_stems(videos, authenticated_client):
+    """Test that English stemming matches other forms of a word."""
+    response = authenticated_client.get(reverse('video-search'), {'q': 'migrate'})
+
+    assert [video['title'] for video in response.data] == ['Ocean Planet']
+
+
+@pytest.mark.django_db
+def test_search_tolerates_title_typos(videos, authenticated_client):
+    """Test that misspelled titles are found through trigram similarity."""
+    response = authenticated_client.get(reverse('video-search'), {'q': 'Bakng Club'})
+
+    assert [video['title'] for video in response.data] == ['Baking Club']
+
+
+@pytest.mark.django_db
+def test_search_requires_term(authenticated_client):
+    """Test that an empty search term is rejected."""
+    response = authenticated_client.get(reverse('video-search'), {'q': ' '})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_admin_changelist_uses_full_text_search(videos, make_user):
+    """Test that the admin search box goes through the same search."""
+    admin = make_user('admin@test.com', is_staff=True, is_superuser=True)
+    client = APIClient()
+    client.force_login(admin)
+
+    response = client.get(reverse('admin:content_video_changelist'), {'q': 'whale'})
+
+    assert response.status_code == 200
+    assert list(response.context['cl'].result_list) == [videos[0]]
+
+
+@pytest.mark.django_db
+def test_admin_changelist_orders_search_results_by_rank(videos, make_user):
+    """Test that admin search results keep the relevance order instead of the newest-first default."""
+    admin = make_user('admin@test.com', is_staff=True, is_superuser=True)
+    client = APIClient()
+    client.force_login(admin)
+
+    response = client.get(reverse('admin:content_video_changelist'), {'q': 'ocean'})
+
+    assert list(response.context['cl'].result_list) == [videos[0], videos[1]]
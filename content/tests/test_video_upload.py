@@ -6,6 +6,8 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from user_auth_app.models import User
 from content.models import Video
 
+pytestmark = pytest.mark.usefixtures('video_probe')
+
 @pytest.mark.django_db
 def test_video_upload_success_admin(client):
     """Test successful video upload by admin user."""
@@ -40,6 +42,7 @@ def test_video_upload_success_admin(client):
     video = Video.objects.get(title='Test Video')
     assert video.description == 'Test Description'
     assert video.genre == 'action'
+    assert video.media_info['video_codec'] == 'h264'
 
 @pytest.mark.django_db
 def test_video_upload_unauthorized_regular_user(client):
@@ -93,7 +96,7 @@ def test_video_upload_unauthenticated(client):
     
     response = api_client.post(url, data, format='multipart')
     
-    assert response.status_code == 403
+    assert response.status_code == 401
 
 @pytest.mark.django_db
 def test_video_upload_missing_fields(client):
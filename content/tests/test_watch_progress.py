@@ -0,0 +1,133 @@
+import pytest
+from unittest.mock import patch
+from django.core.cache import cache
+from django.urls import reverse
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework.test import APIClient
+from content.api.progress import flush_progress, get_progress, record_progress
+from content.api.tasks import flush_watch_progress
+from content.models import WatchProgress
+
+
+@pytest.mark.django_db
+def test_heartbeat_is_buffered_without_database_write(authenticated_client, make_video):
+    """Test that a heartbeat is stored in Redis and only the latest position is kept."""
+    video = make_video()
+    url = reverse('watch-progress', kwargs={'movie_id': video.id})
+
+    authenticated_client.put(url, {'position': 10}, format='json')
+    response = authenticated_client.put(url, {'position': 20.5}, format='json')
+
+    assert response.status_code == 200
+    assert response.data['position'] == 20.5
+    assert response.data['updated_at'] is not None
+    assert not WatchProgress.objects.exists()
+
+    response = authenticated_client.get(url)
+    assert response.status_code == 200
+    assert response.data['position'] == 20.5
+
+
+@pytest.mark.django_db
+def test_flush_upserts_buffered_progress(user, make_video):
+    """Test that the flush job inserts new rows and updates existing ones."""
+    video1 = make_video('Video 1')
+    video2 = make_video('Video 2')
+    WatchProgress.objects.create(user=user, video=video1, position=5)
+
+    record_progress(user.id, video1.id, 42)
+    record_progress(user.id, video2.id, 7)
+
+    assert flush_watch_progress() == 2
+
+    positions = dict(WatchProgress.objects.values_list('video_id', 'position'))
+    assert positions == {video1.id: 42, video2.id: 7}
+    assert flush_progress(batch_size=100) == 0
+
+
+@pytest.mark.django_db
+def test_flush_writes_in_batches(django_assert_max_num_queries, make_user, make_video):
+    """Test that many heartbeats are written with a few statements per batch."""
+    users = [make_user(f'viewer{i}@test.com') for i in range(5)]
+    video = make_video()
+    for user in users:
+        record_progress(user.id, video.id, 30)
+
+    with django_assert_max_num_queries(6):
+        assert flush_progress(batch_size=3) == 5
+
+    assert WatchProgress.objects.filter(video=video, position=30).count() == 5
+
+
+@pytest.mark.django_db
+def test_flush_skips_deleted_videos(user, make_video):
+    """Test that heartbeats for videos deleted before the flush are dropped."""
+    video = make_video()
+    deleted = make_video('Deleted')
+    record_progress(user.id, video.id, 12)
+    record_progress(user.id, deleted.id, 99)
+    deleted.delete()
+
+    assert flush_progress(batch_size=100) == 1
+    assert list(WatchProgress.objects.values_list('video_id', flat=True)) == [video.id]
+
+
+@pytest.mark.django_db
+def test_overlapping_flush_is_skipped(redis_connection, user, make_video):
+    """Test that a flush leaves the buffer alone while another flush holds the lock."""
+    video = make_video()
+    record_progress(user.id, video.id, 12)
+    lock = redis_connection.lock(cache.make_key('watch_progress:flush_lock'))
+
+    with lock:
+        assert flush_progress(batch_size=100) == 0
+    assert not WatchProgress.objects.exists()
+
+    assert flush_progress(batch_size=100) == 1
+
+
+@pytest.mark.django_db
+def test_buffer_takes_precedence_over_database(user, make_video):
+    """Test that a buffered heartbeat is newer than the flushed position."""
+    video = make_video()
+    record_progress(user.id, video.id, 12)
+    flush_progress(batch_size=100)
+
+    assert get_progress(user.id, video.id)[0] == 12
+
+    record_progress(user.id, video.id, 60)
+    assert get_progress(user.id, video.id)[0] == 60
+    assert WatchProgress.objects.get(user=user, video=video).position == 12
+
+
+@pytest.mark.django_db
+def test_heartbeat_falls_back_to_database_without_redis(redis_connection, user, make_video):
+    """Test that progress is written directly when Redis is unavailable."""
+    video = make_video()
+
+    with patch.object(redis_connection, 'hset', side_effect=RedisConnectionError):
+        record_progress(user.id, video.id, 33)
+
+    assert WatchProgress.objects.get(user=user, video=video).position == 33
+
+
+@pytest.mark.django_db
+def test_progress_validation_and_unknown_video(authenticated_client, make_video):
+    """Test that negative positions and unknown videos are rejected."""
+    video = make_video()
+
+    response = authenticated_client.put(
+        reverse('watch-progress', kwargs={'movie_id': video.id}), {'position': -1}, format='json')
+    assert response.status_code == 400
+
+    response = authenticated_client.put(
+        reverse('watch-progress', kwargs={'movie_id': 99999}), {'position': 1}, format='json')
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_progress_requires_authentication(make_video):
+    """Test that anonymous users cannot read or write progress."""
+    video = make_video()
+    response = APIClient().get(reverse('watch-progress', kwargs={'movie_id': video.id}))
+    assert response.status_code == 401
@@ -58,6 +58,9 @@ EMAIL_PORT = int(os.getenv('EMAIL_PORT', 587))
 EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'True') == 'True'
 EMAIL_USE_SSL = os.getenv('EMAIL_USE_SSL', 'False') == 'True'
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', EMAIL_HOST_USER)
+EMAIL_TIMEOUT = int(os.getenv('EMAIL_TIMEOUT', 30))
+# Messages sent per SMTP transaction by the pooled email connection
+EMAIL_BATCH_SIZE = int(os.getenv('EMAIL_BATCH_SIZE', 50))
 
 # ----------------------------------------
 # Simple JWT Settings
@@ -77,6 +80,27 @@ SIMPLE_JWT = {
     'AUTH_COOKIE_DOMAIN': 'None',
 }
 
+# Validity of the one-time tokens in activation and password reset links
+ACTIVATION_TOKEN_LIFETIME = timedelta(hours=24)
+PASSWORD_RESET_TOKEN_LIFETIME = timedelta(hours=24)
+
+# Embed id/is_active/is_staff in access tokens and authenticate without a user lookup.
+# Claims are re-read from the database on every token refresh.
+AUTH_TOKEN_USER_CLAIMS = os.getenv('AUTH_TOKEN_USER_CLAIMS', 'False') == 'True'
+
+# Resolved users of authenticated requests, cached per process and in Redis
+AUTH_USER_CACHE = {
+    'TTL': int(os.getenv('AUTH_USER_CACHE_TTL', 60)),
+    'LOCAL_TTL': int(os.getenv('AUTH_USER_CACHE_LOCAL_TTL', 5)),
+    'LOCAL_SIZE': int(os.getenv('AUTH_USER_CACHE_LOCAL_SIZE', 1024)),
+}
+
+# Seconds a rotated refresh token keeps returning its replacement (concurrent tabs)
+AUTH_REFRESH_REUSE_GRACE = int(os.getenv('AUTH_REFRESH_REUSE_GRACE', 30))
+
+# Verified access tokens kept in memory per process (bounded, honours exp)
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv('AUTH_TOKEN_CACHE_SIZE', 4096))
+
 # Application definition
 INSTALLED_APPS = [
     'django.contrib.admin',
@@ -85,6 +109,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'django_rq',
     'corsheaders',
     'rest_framework',
@@ -161,8 +186,102 @@ RQ_QUEUES = {
         'DEFAULT_TIMEOUT': 900,
         'REDIS_CLIENT_KWARGS': {},
     },
+    'emails': {
+        'HOST': os.environ.get("REDIS_HOST", default="redis"),
+        'PORT': os.environ.get("REDIS_PORT", default=6379),
+        'DB': os.environ.get("REDIS_DB", default=0),
+        'DEFAULT_TIMEOUT': 60,
+        'REDIS_CLIENT_KWARGS': {},
+    },
+    # Short periodic flush and rollup jobs, kept from waiting behind transcodes
+    'stats': {
+        'HOST': os.environ.get("REDIS_HOST", default="redis"),
+        'PORT': os.environ.get("REDIS_PORT", default=6379),
+        'DB': os.environ.get("REDIS_DB", default=0),
+        'DEFAULT_TIMEOUT': 300,
+        'REDIS_CLIENT_KWARGS': {},
+    },
+}
+
+# Playback heartbeats are buffered in a Redis hash and upserted into WatchProgress in batches
+WATCH_PROGRESS = {
+    'FLUSH_INTERVAL': int(os.getenv('WATCH_PROGRESS_FLUSH_INTERVAL', 60)),
+    'BATCH_SIZE': 1000,
+    # Videos watched past this share of their duration drop out of "continue watching"
+    'FINISHED_RATIO': 0.95,
+    'CONTINUE_WATCHING_LIMIT': 20,
+    # Idle per-user sets expire and are rebuilt from the database on the next request
+    'CONTINUE_WATCHING_TTL': 60 * 60 * 24 * 7,
+}
+
+# Playback starts are counted in Redis and rolled up into VideoDailyStats and Video.popularity
+PLAY_STATS = {
+    'ROLLUP_INTERVAL': int(os.getenv('PLAY_STATS_ROLLUP_INTERVAL', 300)),
+    # Manifest loads of the same viewer within this many seconds count as one play
+    'DEDUP_WINDOW': 60 * 30,
+    'POPULARITY_DAYS': 7,
+    'POPULARITY_HALF_LIFE_DAYS': 2,
+}
+
+# "More like this": top-K neighbours by TF-IDF similarity of title and description
+RELATED_VIDEOS = {
+    'TOP_K': 12,
+    # Title terms count this many times as often as description terms
+    'TITLE_WEIGHT': 2,
+    # Added to the cosine similarity of videos in the same genre
+    'GENRE_WEIGHT': 0.2,
+    # Rows of the similarity matrix computed at once during a rebuild
+    'BATCH_SIZE': 256,
 }
 
+# Periodic jobs enqueued by `manage.py rqcron` (cron syntax or interval in seconds)
+RQ_CRON_JOBS = [
+    {'func': 'user_auth_app.api.tasks.cleanup_auth_data', 'queue': 'default', 'cron': '15 3 * * *'},
+    {'func': 'content.api.tasks.flush_watch_progress', 'queue': 'stats',
+     'interval': WATCH_PROGRESS['FLUSH_INTERVAL']},
+    {'func': 'content.api.tasks.rollup_play_stats', 'queue': 'stats',
+     'interval': PLAY_STATS['ROLLUP_INTERVAL']},
+    {'func': 'content.api.tasks.refresh_related_videos', 'queue': 'default', 'cron': '45 3 * * *'},
+    {'func': 'content.api.tasks.cleanup_upload_sessions', 'queue': 'default', 'cron': '30 * * * *'},
+]
+
+# Nightly removal of never-activated accounts and expired token rows, in bounded batches
+AUTH_CLEANUP = {
+    'INACTIVE_USER_DAYS': int(os.getenv('AUTH_CLEANUP_INACTIVE_USER_DAYS', 30)),
+    'BATCH_SIZE': 1000,
+    'MAX_BATCHES': 50,
+}
+
+# Transactional emails are sent by the 'emails' worker, retried with growing backoff (seconds)
+EMAIL_QUEUE_ASYNC = os.getenv('EMAIL_QUEUE_ASYNC', 'True') == 'True'
+EMAIL_RETRY_INTERVALS = [10, 60, 300, 900]
+
+
+# Password hashing
+# New hashes use PASSWORD_HASHER (argon2, scrypt or pbkdf2); older hashes are
+# upgraded on the next login. Tune the costs with `manage.py benchmark_password_hashers`.
+
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2')
+
+PASSWORD_HASHER_PARAMS = {
+    'ARGON2_TIME_COST': int(os.getenv('ARGON2_TIME_COST', 2)),
+    'ARGON2_MEMORY_COST': int(os.getenv('ARGON2_MEMORY_COST', 102400)),
+    'ARGON2_PARALLELISM': int(os.getenv('ARGON2_PARALLELISM', 8)),
+    'SCRYPT_WORK_FACTOR': int(os.getenv('SCRYPT_WORK_FACTOR', 2 ** 14)),
+    'SCRYPT_BLOCK_SIZE': int(os.getenv('SCRYPT_BLOCK_SIZE', 8)),
+    'SCRYPT_PARALLELISM': int(os.getenv('SCRYPT_PARALLELISM', 1)),
+    'PBKDF2_ITERATIONS': int(os.getenv('PBKDF2_ITERATIONS', 870000)),
+}
+
+PASSWORD_HASHER_CLASSES = {
+    'argon2': 'user_auth_app.hashers.ConfigurableArgon2PasswordHasher',
+    'scrypt': 'user_auth_app.hashers.ConfigurableScryptPasswordHasher',
+    'pbkdf2': 'user_auth_app.hashers.ConfigurablePBKDF2PasswordHasher',
+}
+
+PASSWORD_HASHERS = [PASSWORD_HASHER_CLASSES[PASSWORD_HASHER]] + [
+    hasher for name, hasher in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER
+]
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -204,7 +323,45 @@ STATIC_ROOT = BASE_DIR / "static"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# ----------------------------------------
+# Media Storage (local volume or S3-compatible object store)
+# ----------------------------------------
+MEDIA_STORAGE_BACKEND = os.getenv('MEDIA_STORAGE_BACKEND', 'local')
+
+STORAGES = {
+    'default': {
+        'BACKEND': (
+            'content.storage.S3MediaStorage' if MEDIA_STORAGE_BACKEND == 's3'
+            else 'django.core.files.storage.FileSystemStorage'
+        ),
+    },
+    # Hashed, compressed files served by WhiteNoise; needs collectstatic (run by the entrypoint)
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+AWS_STORAGE_BUCKET_NAME = os.getenv('AWS_STORAGE_BUCKET_NAME', 'videoflix-media')
+AWS_S3_ENDPOINT_URL = os.getenv('AWS_S3_ENDPOINT_URL')
+AWS_S3_REGION_NAME = os.getenv('AWS_S3_REGION_NAME', 'us-east-1')
+AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID')
+AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
+AWS_QUERYSTRING_EXPIRE = int(os.getenv('AWS_QUERYSTRING_EXPIRE', 300))
+AWS_DEFAULT_ACL = None
+
+MEDIA_UPLOAD_WORKERS = int(os.getenv('MEDIA_UPLOAD_WORKERS', 8))
+MEDIA_MULTIPART_THRESHOLD = int(os.getenv('MEDIA_MULTIPART_THRESHOLD', 8 * 1024 * 1024))
+
+# Local disk used by ffmpeg before outputs are published to the media storage
+TRANSCODE_SCRATCH_DIR = os.getenv('TRANSCODE_SCRATCH_DIR', '/tmp/videoflix-transcode')
+
+# Largest accepted part of a resumable chunked upload
+CHUNKED_UPLOAD_MAX_PART_SIZE = int(os.getenv('CHUNKED_UPLOAD_MAX_PART_SIZE', 64 * 1024 * 1024))
+# Idle chunked uploads (and finished ones, for status polling) are deleted after this many hours
+CHUNKED_UPLOAD_EXPIRY_HOURS = int(os.getenv('CHUNKED_UPLOAD_EXPIRY_HOURS', 24))
+
+# Bytes of an incoming upload that are probed before the rest is accepted
+VIDEO_PROBE_HEADER_BYTES = int(os.getenv('VIDEO_PROBE_HEADER_BYTES', 1024 * 1024))
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
@@ -219,4 +376,19 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+
+    # Number of trusted reverse proxies in front of the app. Throttles key on
+    # REMOTE_ADDR when 0, otherwise on the client address those proxies appended
+    # to X-Forwarded-For, so clients cannot pick their own throttle key.
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', '0')),
+
+    # Sliding-window limits per endpoint (throttle_scope) and per IP / submitted email
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': os.getenv('THROTTLE_LOGIN_IP', '20/min'),
+        'login_email': os.getenv('THROTTLE_LOGIN_EMAIL', '5/min'),
+        'register_ip': os.getenv('THROTTLE_REGISTER_IP', '10/hour'),
+        'register_email': os.getenv('THROTTLE_REGISTER_EMAIL', '3/hour'),
+        'password_reset_ip': os.getenv('THROTTLE_PASSWORD_RESET_IP', '10/hour'),
+        'password_reset_email': os.getenv('THROTTLE_PASSWORD_RESET_EMAIL', '3/hour'),
+    },
 }
@@ -4,6 +4,7 @@ from django.utils.http import urlsafe_base64_encode
 from django.utils.encoding import force_bytes
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
+from user_auth_app.api.tokens import password_reset_token_generator
 from user_auth_app.models import User
 from content.models import Video
 
@@ -24,8 +25,7 @@ def test_full_user_registration_flow(client):
     user = User.objects.get(email='testuser@test.com')
     assert user.is_active is False
     
-    refresh = RefreshToken.for_user(user)
-    token = str(refresh.access_token)
+    token = register_response.data['token']
     uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
     
     activate_url = reverse('activate', kwargs={'uidb64': uidb64, 'token': token})
@@ -103,8 +103,7 @@ def test_password_reset_flow(client):
     reset_response = client.post(reset_url, reset_data, content_type='application/json')
     assert reset_response.status_code == 200
     
-    refresh = RefreshToken.for_user(user)
-    token = str(refresh.access_token)
+    token = password_reset_token_generator.make_token(user)
     uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
     
     confirm_url = reverse('password_confirm', kwargs={'uidb64': uidb64, 'token': token})
@@ -1,6 +1,11 @@
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
 from django.conf import settings
 
+from .cache import get_cached_user, cache_user, get_cached_token, cache_token
+
 class CookieJWTAuthentication(JWTAuthentication):
     """
     JWT Authentication with cookie support.
@@ -25,3 +30,40 @@ class CookieJWTAuthentication(JWTAuthentication):
             return self.get_user(validated_token), validated_token
             
         return super().authenticate(request)
+
+    def get_validated_token(self, raw_token):
+        """
+        Verify a raw token once and serve repeated presentations of the
+        same token from a bounded in-process cache until it expires.
+        """
+        validated_token = get_cached_token(raw_token)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            cache_token(raw_token, validated_token)
+        return validated_token
+
+    def get_user(self, validated_token):
+        """
+        Resolve the token's user from the user cache and fall back to the
+        database on a miss. Cached users are dropped when they are saved.
+        Tokens carrying user claims (AUTH_TOKEN_USER_CLAIMS) resolve to a
+        TokenUser without any lookup.
+        """
+        if settings.AUTH_TOKEN_USER_CLAIMS and 'is_staff' in validated_token:
+            if not validated_token.get('is_active', False):
+                raise AuthenticationFailed('User is inactive', code='user_inactive')
+            return TokenUser(validated_token)
+        
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        if user_id is None or jti is None:
+            return super().get_user(validated_token)
+        
+        user = get_cached_user(user_id, jti)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache_user(user, jti)
+        elif api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+        
+        return user
@@ -0,0 +1,90 @@
+from django.contrib.auth import get_user_model
+from django.db import connections
+
+from .cache import invalidate_user
+
+User = get_user_model()
+
+
+def iter_batches(queryset, batch_size: int):
+    """
+    Stream a queryset in lists of at most batch_size objects.
+
+    Rows are fetched with `.iterator(chunk_size=batch_size)`, so only one
+    batch is held in memory at a time.
+    """
+    batch = []
+    for obj in queryset.iterator(chunk_size=batch_size):
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def deactivate_users(queryset, batch_size: int = 1000):
+    """
+    Deactivate users with one bulk_update per batch.
+
+    Args:
+        queryset: Users to deactivate.
+        batch_size (int): Rows loaded and updated per batch.
+
+    Yields:
+        int: Number of users deactivated in each batch.
+    """
+    for users in iter_batches(queryset.filter(is_active=True).only('pk', 'is_active'), batch_size):
+        for user in users:
+            user.is_active = False
+        User.objects.bulk_update(users, ['is_active'], batch_size=batch_size)
+        for user in users:
+            invalidate_user(user.pk)
+        yield len(users)
+
+
+def delete_in_batches(queryset, batch_size: int = 1000, max_batches: int = None):
+    """
+    Delete the rows of a queryset with one DELETE per batch of primary keys.
+
+    Each batch re-runs the filtered query with a LIMIT, so an index on the
+    filter keeps every round cheap no matter how large the table is.
+
+    Args:
+        queryset: Rows to delete.
+        batch_size (int): Rows deleted per batch.
+        max_batches (int): Stop after this many batches; None deletes all.
+
+    Yields:
+        int: Number of rows deleted in each batch.
+    """
+    manager = queryset.model._default_manager
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        ids = list(queryset.values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            break
+        manager.filter(pk__in=ids).delete()
+        batches += 1
+        yield len(ids)
+
+
+
+def duplicate_emails(using: str = 'default') -> list:
+    """
+    Return the lower-cased e-mail addresses that belong to more than one user.
+
+    The query is plain SQL on the user table, so it also runs before the
+    migration that adds the case-insensitive unique constraint.
+
+    Args:
+        using (str): Database alias to query.
+
+    Returns:
+        list: Sorted lower-cased addresses.
+    """
+    connection = connections[using]
+    table = connection.ops.quote_name(User._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT LOWER(email) FROM {table} GROUP BY LOWER(email) HAVING COUNT(*) > 1 ORDER BY 1')
+        return [row[0] for row in cursor.fetchall()]
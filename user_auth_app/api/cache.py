@@ -0,0 +1,132 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+
+
+class LocalTTLCache:
+    """
+    Thread-safe, size-bounded LRU cache whose entries expire after a TTL.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, predicate):
+        """Remove all entries whose key matches the predicate."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+local_user_cache = LocalTTLCache(maxsize=settings.AUTH_USER_CACHE['LOCAL_SIZE'])
+validated_token_cache = LocalTTLCache(maxsize=settings.AUTH_TOKEN_CACHE_SIZE)
+
+
+# Columns kept for cached users: what authentication, permissions and the
+# profile view read. The password hash and the rest stay in the database.
+CACHED_USER_FIELDS = ('id', 'email', 'username', 'first_name', 'last_name', 'is_active', 'is_staff', 'is_superuser', 'date_joined')
+
+
+def _redis_key(user_id) -> str:
+    return f'auth_user_fields:{user_id}'
+
+
+def _user_values(user) -> dict:
+    return {field: getattr(user, field) for field in CACHED_USER_FIELDS}
+
+
+def _user_from_values(values: dict):
+    """
+    Build a fresh user from cached column values.
+
+    The other columns are deferred, so they load on access and save() only
+    writes the columns that were loaded or assigned.
+    """
+    User = get_user_model()
+    fields = [f.attname for f in User._meta.concrete_fields if f.attname in values]
+    return User.from_db(router.db_for_read(User), fields, [values[field] for field in fields])
+
+
+def get_cached_user(user_id, jti):
+    """
+    Return the cached user for a token, checking the process-local LRU
+    first and the shared Redis cache second.
+
+    Every hit builds a new instance, so changes a request makes to its
+    user never leak into the cache.
+    """
+    values = local_user_cache.get((str(user_id), jti))
+    if values is None:
+        values = cache.get(_redis_key(user_id))
+        if values is None:
+            return None
+        local_user_cache.set((str(user_id), jti), values, settings.AUTH_USER_CACHE['LOCAL_TTL'])
+    return _user_from_values(values)
+
+
+def cache_user(user, jti):
+    """Store the cached columns of a resolved user in both cache levels."""
+    values = _user_values(user)
+    local_user_cache.set((str(user.pk), jti), values, settings.AUTH_USER_CACHE['LOCAL_TTL'])
+    cache.set(_redis_key(user.pk), values, settings.AUTH_USER_CACHE['TTL'])
+
+
+def invalidate_user(user_id):
+    """
+    Drop a user from both cache levels.
+
+    Other processes keep their local copy for at most LOCAL_TTL seconds.
+    """
+    cache.delete(_redis_key(user_id))
+    local_user_cache.discard(lambda key: key[0] == str(user_id))
+
+
+def _token_digest(raw_token) -> str:
+    if isinstance(raw_token, str):
+        raw_token = raw_token.encode()
+    return hashlib.sha256(raw_token).hexdigest()
+
+
+def get_cached_token(raw_token):
+    """Return the validated token for an already verified raw token."""
+    return validated_token_cache.get(_token_digest(raw_token))
+
+
+def cache_token(raw_token, validated_token):
+    """Remember a verified token until its exp claim is reached."""
+    ttl = validated_token['exp'] - time.time()
+    if ttl > 0:
+        validated_token_cache.set(_token_digest(raw_token), validated_token, ttl)
@@ -1,66 +1,168 @@
-import os
-from django.core.mail import EmailMultiAlternatives
+import smtplib
+from functools import lru_cache
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.contrib.staticfiles import finders
+from django.utils.html import escape
 from email.mime.image import MIMEImage
 
-
-def send_verification_email(email: str, uidb64: str, token: str) -> None:
-    """Send account verification email with activation link."""
-    
-    subject = 'Confirm your email'
-    from_email = settings.DEFAULT_FROM_EMAIL
-    recipient_list = [email]
-
-    link = f'{settings.FRONTEND_ACTIVATION_URL}?uid={uidb64}&token={token}'
-
-    plain_message = (
-        'Hello!\n\n'
-        'Please confirm your email address by copying the following link into your browser:\n\n'
-        f'{link}\n\n'
-        'This link is valid for 24 hours.\n\n'
-        'Thanks,\nYour Videoflix Team'
-    )
-
+# Context values the email templates output with |safe; all others are escaped.
+SAFE_TEMPLATE_FIELDS = {'link'}
+
+_pooled_connection = None
+
+
+def get_pooled_connection():
+    """
+    Return the email connection shared by all messages sent from this process.
+
+    The connection is opened on first use and kept open, so a worker pays
+    for the SMTP/TLS handshake once instead of once per message.
+    """
+    global _pooled_connection
+    if _pooled_connection is None:
+        _pooled_connection = get_connection()
+    return _pooled_connection
+
+
+def send_emails(messages, connection=None) -> int:
+    """
+    Send messages over one connection in batches of EMAIL_BATCH_SIZE.
+
+    A connection dropped by the mail server (e.g. after an idle timeout)
+    is reopened once per batch.
+
+    Args:
+        messages (list): EmailMessage instances to send.
+        connection: Email backend to use, defaults to the pooled connection.
+
+    Returns:
+        int: Number of messages sent.
+    """
+    connection = connection or get_pooled_connection()
+    batch_size = settings.EMAIL_BATCH_SIZE
+    sent = 0
+    for start in range(0, len(messages), batch_size):
+        batch = messages[start:start + batch_size]
+        try:
+            connection.open()
+            sent += connection.send_messages(batch) or 0
+        except smtplib.SMTPServerDisconnected:
+            connection.close()
+            connection.open()
+            sent += connection.send_messages(batch) or 0
+    return sent
+
+
+def _placeholder(field: str) -> str:
+    return f'@@{field}@@'
+
+
+@lru_cache(maxsize=None)
+def get_template_skeleton(template_name: str, fields: tuple) -> str:
+    """
+    Render an email template once with placeholders instead of context values.
+
+    Args:
+        template_name (str): Template to render.
+        fields (tuple): Names of the context values used by the template.
+
+    Returns:
+        str: Rendered HTML containing one placeholder per field.
+    """
+    return render_to_string(template_name, {field: _placeholder(field) for field in fields})
+
+
+def render_email_template(template_name: str, **context) -> str:
+    """Render an email template by substituting the context into its cached skeleton."""
+    html_message = get_template_skeleton(template_name, tuple(sorted(context)))
+    for field, value in context.items():
+        value = str(value) if field in SAFE_TEMPLATE_FIELDS else escape(value)
+        html_message = html_message.replace(_placeholder(field), value)
+    return html_message
+
+
+@lru_cache(maxsize=None)
+def get_logo_image():
+    """
+    Return the inline logo part, built once per process.
+
+    Returns:
+        MIMEImage: Logo with Content-ID <videoflix_logo>, or None if it cannot be loaded.
+    """
+    logo_path = finders.find('logo.png')
+    if not logo_path:
+        return None
+    with open(logo_path, 'rb') as f:
+        img = MIMEImage(f.read())
+    img.add_header('Content-ID', '<videoflix_logo>')
+    img.add_header('Content-Disposition', 'inline; filename="logo.png"')
+    return img
+
+
+def build_email(email: str, subject: str, plain_message: str, template_name: str, link: str) -> EmailMultiAlternatives:
+    """
+    Build a transactional email with plain text, HTML alternative and inline logo.
+
+    Args:
+        email (str): Recipient address.
+        subject (str): Email subject.
+        plain_message (str): Plain text body.
+        template_name (str): HTML template rendered with link and user_email.
+        link (str): Link the email asks the user to open.
+
+    Returns:
+        EmailMultiAlternatives: The message, ready to send.
+    """
     msg = EmailMultiAlternatives(
         subject=subject,
         body=plain_message,
-        from_email=from_email,
-        to=recipient_list
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[email]
     )
 
     try:
-        html_message = render_to_string('email/activation.html', {
-            'link': link,
-            'user_email': email
-        })
+        html_message = render_email_template(template_name, link=link, user_email=email)
         msg.attach_alternative(html_message, "text/html")
     except Exception as e:
         print(f"Warning: Could not render HTML template: {e}")
 
     try:
-        logo_path = finders.find('logo.png')
-        print(logo_path)
-        if logo_path and os.path.exists(logo_path):
-            with open(logo_path, 'rb') as f:
-                img = MIMEImage(f.read())
-                img.add_header('Content-ID', '<videoflix_logo>')
-                img.add_header('Content-Disposition', 'inline; filename="logo.png"')
-                msg.attach(img)
+        logo = get_logo_image()
+        if logo is not None:
+            msg.attach(logo)
     except Exception as e:
         print(f"Warning: Could not attach logo: {e}")
 
-    msg.send(fail_silently=False)
+    return msg
 
 
-def send_password_reset_email(email: str, uidb64: str, token: str) -> None:
-    """Send password reset email with reset link."""
+def build_verification_email(email: str, uidb64: str, token: str) -> EmailMultiAlternatives:
+    """Build account verification email with activation link."""
     
-    subject = 'Reset your password'
-    from_email = settings.DEFAULT_FROM_EMAIL
-    recipient_list = [email]
+    link = f'{settings.FRONTEND_ACTIVATION_URL}?uid={uidb64}&token={token}'
 
+    plain_message = (
+        'Hello!\n\n'
+        'Please confirm your email address by copying the following link into your browser:\n\n'
+        f'{link}\n\n'
+        'This link is valid for 24 hours.\n\n'
+        'Thanks,\nYour Videoflix Team'
+    )
+
+    return build_email(email, 'Confirm your email', plain_message, 'email/activation.html', link)
+
+
+def send_verification_email(email: str, uidb64: str, token: str) -> None:
+    """Send account verification email with activation link."""
+    
+    build_verification_email(email, uidb64, token).send(fail_silently=False)
+
+
+def build_password_reset_email(email: str, uidb64: str, token: str) -> EmailMultiAlternatives:
+    """Build password reset email with reset link."""
+    
     link = f'{settings.FRONTEND_CONFIRM_PASSWORD_URL}?uid={uidb64}&token={token}'
 
     plain_message = (
@@ -72,31 +174,10 @@ def send_password_reset_email(email: str, uidb64: str, token: str) -> None:
         'Thanks,\nYour Videoflix Team'
     )
 
-    msg = EmailMultiAlternatives(
-        subject=subject,
-        body=plain_message,
-        from_email=from_email,
-        to=recipient_list
-    )
-
-    try:
-        html_message = render_to_string('email/password_reset.html', {
-            'link': link,
-            'user_email': email
-        })
-        msg.attach_alternative(html_message, "text/html")
-    except Exception as e:
-        print(f"Warning: Could not render HTML template: {e}")
+    return build_email(email, 'Reset your password', plain_message, 'email/password_reset.html', link)
 
-    try:
-        logo_path = finders.find('logo.png')
-        if logo_path and os.path.exists(logo_path):
-            with open(logo_path, 'rb') as f:
-                img = MIMEImage(f.read())
-                img.add_header('Content-ID', '<videoflix_logo>')
-                img.add_header('Content-Disposition', 'inline; filename="logo.png"')
-                msg.attach(img)
-    except Exception as e:
-        print(f"Warning: Could not attach logo: {e}")
 
-    msg.send(fail_silently=False)
+def send_password_reset_email(email: str, uidb64: str, token: str) -> None:
+    """Send password reset email with reset link."""
+    
+    build_password_reset_email(email, uidb64, token).send(fail_silently=False)
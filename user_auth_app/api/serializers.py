@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from django.db import IntegrityError, transaction
 from django.contrib.auth import get_user_model, authenticate
 from django.contrib.auth.password_validation import validate_password
 
@@ -9,6 +10,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for user registration according to API specification.
     """
+    email = serializers.EmailField(max_length=254)
     password = serializers.CharField(write_only=True, validators=[validate_password])
     confirmed_password = serializers.CharField(write_only=True)
 
@@ -21,23 +23,25 @@ class UserCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Passwords do not match")
         return attrs
     
-    def validate_email(self, value):
-        """
-        Check if email already exists.
+    def create(self, validated_data):
         """
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError('Email already exists')
-        return value
+        Insert the user in a single statement.
 
-    def create(self, validated_data):
+        Duplicate emails (case-insensitive) are rejected by the unique
+        constraints, so concurrent sign-ups cannot both succeed.
+        """
         validated_data.pop('confirmed_password')
         validated_data['username'] = validated_data['email']
-        user = User.objects.create_user(
-            email=validated_data['email'],
-            password=validated_data['password'],
-            username=validated_data['username'],
-            is_active=False
-        )
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    email=validated_data['email'],
+                    password=validated_data['password'],
+                    username=validated_data['username'],
+                    is_active=False
+                )
+        except IntegrityError:
+            raise serializers.ValidationError({'email': ['Email already exists']})
         return user
 
 
@@ -101,4 +105,22 @@ class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('id', 'email', 'username', 'first_name', 'last_name', 'date_joined')
-        read_only_fields = ('id', 'date_joined', 'username')
\ No newline at end of file
+        read_only_fields = ('id', 'date_joined', 'username')
+
+    def update(self, instance, validated_data):
+        """
+        Write only the submitted fields.
+
+        The instance may come from the authentication cache, so saving all
+        columns could overwrite newer values such as is_active. Emails that
+        differ from an existing one only in case are rejected by the
+        user_email_lower_unique constraint.
+        """
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        try:
+            with transaction.atomic():
+                instance.save(update_fields=list(validated_data))
+        except IntegrityError:
+            raise serializers.ValidationError({'email': ['Email already exists']})
+        return instance
\ No newline at end of file
@@ -0,0 +1,79 @@
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from django_rq import job
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rq import Retry
+
+from .bulk import delete_in_batches
+from .emails import build_verification_email, build_password_reset_email, send_emails
+
+User = get_user_model()
+
+EMAIL_RETRY = Retry(max=len(settings.EMAIL_RETRY_INTERVALS), interval=settings.EMAIL_RETRY_INTERVALS)
+
+
+@job('emails', retry=EMAIL_RETRY)
+def send_verification_email_job(email: str, uidb64: str, token: str) -> None:
+    """Background job that sends the account verification email."""
+    
+    send_emails([build_verification_email(email, uidb64, token)])
+
+
+@job('emails', retry=EMAIL_RETRY)
+def send_password_reset_email_job(email: str, uidb64: str, token: str) -> None:
+    """Background job that sends the password reset email."""
+    
+    send_emails([build_password_reset_email(email, uidb64, token)])
+
+
+@job('emails', retry=EMAIL_RETRY)
+def send_email_batch_job(messages) -> int:
+    """Background job that sends many prepared messages over one connection."""
+    
+    return send_emails(messages)
+
+
+def enqueue_email(email_job, *args) -> None:
+    """
+    Queue an email job on the 'emails' queue once the current transaction commits.
+
+    With EMAIL_QUEUE_ASYNC disabled the email is sent inline instead,
+    e.g. for local development without a worker.
+
+    Args:
+        email_job: Job function decorated with @job('emails').
+        *args: Arguments passed to the job.
+    """
+    if not settings.EMAIL_QUEUE_ASYNC:
+        email_job(*args)
+        return
+    transaction.on_commit(lambda: email_job.delay(*args))
+
+
+@job
+def cleanup_auth_data() -> dict:
+    """
+    Scheduled job that deletes never-activated accounts and expired token rows.
+
+    Each kind of row is deleted in at most AUTH_CLEANUP['MAX_BATCHES'] batches
+    per run, so a large backlog is worked off over several runs instead of
+    holding long transactions.
+    """
+    cleanup = settings.AUTH_CLEANUP
+    now = timezone.now()
+    users = User.objects.filter(
+        is_active=False,
+        last_login__isnull=True,
+        date_joined__lt=now - timedelta(days=cleanup['INACTIVE_USER_DAYS']),
+    )
+    tokens = OutstandingToken.objects.filter(expires_at__lte=now)
+
+    deleted = {
+        'users': sum(delete_in_batches(users, cleanup['BATCH_SIZE'], cleanup['MAX_BATCHES'])),
+        'tokens': sum(delete_in_batches(tokens, cleanup['BATCH_SIZE'], cleanup['MAX_BATCHES'])),
+    }
+    print(f"Auth cleanup deleted {deleted['users']} unactivated users and {deleted['tokens']} expired tokens.")
+    return deleted
@@ -0,0 +1,174 @@
+import hashlib
+import time
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.http import base36_to_int, int_to_base36
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken as BaseRefreshToken, TokenError
+
+
+def _blacklist_key(jti) -> str:
+    return f'token_blacklist:{jti}'
+
+
+def blacklist_jti(jti, exp) -> bool:
+    """
+    Blacklist a token id until the token expires.
+
+    Args:
+        jti: Token id (jti claim).
+        exp: Expiry of the token as epoch timestamp.
+
+    Returns:
+        bool: False if the token is already expired and needs no entry.
+    """
+    ttl = int(exp - time.time()) + 1
+    if ttl <= 0:
+        return False
+    cache.set(_blacklist_key(jti), 1, timeout=ttl)
+    return True
+
+
+def is_blacklisted(jti) -> bool:
+    """Return True if the token id has been blacklisted."""
+    return cache.get(_blacklist_key(jti)) is not None
+
+
+# Permission claims (AUTH_TOKEN_USER_CLAIMS) belong on access tokens only.
+USER_CLAIMS = ('is_active', 'is_staff')
+
+
+class RefreshToken(BaseRefreshToken):
+    """
+    Refresh token whose blacklist lives in Redis instead of the
+    token_blacklist tables.
+
+    Entries are keyed by jti and expire together with the token, so
+    issuing, checking and blacklisting tokens never touches the database.
+    """
+
+    no_copy_claims = BaseRefreshToken.no_copy_claims + USER_CLAIMS
+
+    def verify(self, *args, **kwargs) -> None:
+        self.check_blacklist()
+        super(BlacklistMixin, self).verify(*args, **kwargs)
+
+    def check_blacklist(self) -> None:
+        if is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self) -> bool:
+        return blacklist_jti(self.payload[api_settings.JTI_CLAIM], self.payload['exp'])
+
+    @classmethod
+    def for_user(cls, user):
+        return super(BlacklistMixin, cls).for_user(user)
+
+
+def _rotation_key(raw_token: str) -> str:
+    return f'token_rotation:{hashlib.sha256(raw_token.encode()).hexdigest()}'
+
+
+def get_active_token_user(refresh):
+    """
+    Load the current state of a refresh token's user.
+
+    Raises:
+        TokenError: If the user no longer exists or is inactive.
+    """
+    user = (
+        get_user_model().objects
+        .filter(**{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]})
+        .only('pk', 'is_active', 'is_staff')
+        .first()
+    )
+    if user is None or not user.is_active:
+        raise TokenError(_('User is inactive or does not exist'))
+    return user
+
+
+def rotate_refresh_token(raw_token: str) -> tuple:
+    """
+    Exchange a refresh token for a new one and blacklist the old jti.
+
+    Concurrent refreshes with the same token (e.g. several open tabs) receive
+    the replacement issued by the first request during AUTH_REFRESH_REUSE_GRACE
+    seconds instead of rotating again. Reusing the token after that window
+    fails because its jti is blacklisted. The user is read once per refresh,
+    so deactivated users cannot refresh and access token claims reflect the
+    current user.
+
+    Args:
+        raw_token (str): Refresh token presented by the client.
+
+    Returns:
+        tuple: The RefreshToken to hand out to the client and its user.
+
+    Raises:
+        TokenError: If the token is invalid, expired or already rotated,
+            or its user is inactive.
+    """
+    key = _rotation_key(raw_token)
+    replacement = cache.get(key)
+    if replacement is not None:
+        refresh = RefreshToken(replacement)
+        return refresh, get_active_token_user(refresh)
+
+    refresh = RefreshToken(raw_token)
+    user = get_active_token_user(refresh)
+    for claim in USER_CLAIMS:
+        refresh.payload.pop(claim, None)
+    if not api_settings.ROTATE_REFRESH_TOKENS:
+        return refresh, user
+
+    old_jti, old_exp = refresh[api_settings.JTI_CLAIM], refresh['exp']
+    refresh.set_jti()
+    refresh.set_exp()
+    refresh.set_iat()
+
+    if not cache.add(key, str(refresh), timeout=settings.AUTH_REFRESH_REUSE_GRACE):
+        return RefreshToken(cache.get(key)), user
+    if api_settings.BLACKLIST_AFTER_ROTATION:
+        blacklist_jti(old_jti, old_exp)
+    return refresh, user
+
+
+class OneTimeTokenGenerator:
+    """
+    Stateless single-purpose token for email links.
+
+    The token is `<expiry in base36>-<HMAC>` where the HMAC covers the user id,
+    purpose, expiry and the user's password hash and activation state. Issuing
+    needs no database access; a token stops working when it expires or once the
+    password or activation state it was issued for has changed.
+    """
+
+    def __init__(self, purpose: str, lifetime_setting: str):
+        self.purpose = purpose
+        self.lifetime_setting = lifetime_setting
+
+    def make_token(self, user) -> str:
+        lifetime = getattr(settings, self.lifetime_setting)
+        expires = int(time.time() + lifetime.total_seconds())
+        return f'{int_to_base36(expires)}-{self._signature(user, expires)}'
+
+    def check_token(self, user, token: str) -> bool:
+        try:
+            expires_b36, signature = token.split('-', 1)
+            expires = base36_to_int(expires_b36)
+        except ValueError:
+            return False
+        if expires < time.time():
+            return False
+        return constant_time_compare(signature, self._signature(user, expires))
+
+    def _signature(self, user, expires: int) -> str:
+        value = f'{user.pk}:{self.purpose}:{expires}:{user.password}:{user.is_active}'
+        return salted_hmac(f'user_auth_app.{self.purpose}', value, algorithm='sha256').hexdigest()[::2]
+
+
+activation_token_generator = OneTimeTokenGenerator('activation', 'ACTIVATION_TOKEN_LIFETIME')
+password_reset_token_generator = OneTimeTokenGenerator('password_reset', 'PASSWORD_RESET_TOKEN_LIFETIME')
@@ -1,13 +1,8 @@
-
-from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from django.urls import path
 from .views import (
-    UserProfileViewSet,
+    UserProfileView,
 )
 
-router = DefaultRouter()
-router.register(r'users/me', UserProfileViewSet, basename='user-profile')
-
 urlpatterns = [
-    path('', include(router.urls)),
+    path('users/me/', UserProfileView.as_view(), name='user-profile'),
 ]
\ No newline at end of file
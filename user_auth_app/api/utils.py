@@ -1,4 +1,5 @@
 from django.conf import settings
+from .tokens import RefreshToken
 
 def set_jwt_cookies(response, access_token, refresh_token=None):
     """Set JWT cookies based on SIMPLE_JWT settings."""
@@ -52,3 +53,24 @@ def get_refresh_token_from_request(request):
     return request.COOKIES.get(
         jwt_settings.get('AUTH_COOKIE_REFRESH', 'refresh_token')
     )
+
+
+def get_access_token(refresh, user):
+    """
+    Create the access token for a refresh token.
+    With AUTH_TOKEN_USER_CLAIMS enabled, the claims needed for permission
+    checks are embedded so authenticated requests need no user lookup.
+    They are taken from the given user and never copied from the refresh
+    token, so they are current as of login or the last refresh.
+    """
+    access_token = refresh.access_token
+    if settings.AUTH_TOKEN_USER_CLAIMS:
+        access_token['is_active'] = user.is_active
+        access_token['is_staff'] = user.is_staff
+    return access_token
+
+
+def get_tokens_for_user(user):
+    """Create a refresh token and its access token for the user."""
+    refresh = RefreshToken.for_user(user)
+    return refresh, get_access_token(refresh, user)
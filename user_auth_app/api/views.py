@@ -1,47 +1,66 @@
 from django.contrib.auth import get_user_model
+from django.shortcuts import get_object_or_404
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from django.utils.encoding import force_bytes
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework import viewsets, status
+from rest_framework import generics, status
 from rest_framework.permissions import AllowAny
-from rest_framework_simplejwt.tokens import RefreshToken, AccessToken, TokenError
+from rest_framework.exceptions import ValidationError
+from rest_framework_simplejwt.tokens import TokenError
 from core import settings
 from .serializers import (
     UserSerializer, UserCreateSerializer, 
     LoginSerializer, PasswordResetSerializer, PasswordChangeSerializer
 )
-from .emails import send_verification_email, send_password_reset_email
-from .utils import set_jwt_cookies, clear_jwt_cookies, get_refresh_token_from_request
+from .throttling import IPSlidingWindowThrottle, EmailSlidingWindowThrottle
+from .tasks import send_verification_email_job, send_password_reset_email_job, enqueue_email
+from .tokens import (
+    RefreshToken, rotate_refresh_token, activation_token_generator, password_reset_token_generator
+)
+from .utils import (
+    set_jwt_cookies, clear_jwt_cookies, get_refresh_token_from_request,
+    get_tokens_for_user, get_access_token
+)
 
 User = get_user_model()
 
 
-class UserProfileViewSet(viewsets.ModelViewSet):
-    """Retrieve and update the authenticated user's profile."""
+class UserProfileView(generics.RetrieveUpdateAPIView):
+    """Retrieve and update the authenticated user's own profile."""
     
-    queryset = User.objects.all()
     serializer_class = UserSerializer
 
-    def get_queryset(self):
-        return User.objects.filter(id=self.request.user.id)
+    def get_object(self):
+        user = self.request.user
+        if isinstance(user, User):
+            return user
+        # Claims-only authentication (AUTH_TOKEN_USER_CLAIMS) provides no model instance.
+        return get_object_or_404(User, pk=user.id)
 
 
 class RegisterView(APIView):
     """Handle user registration and send activation email."""
     
     permission_classes = [AllowAny]
+    throttle_classes = [IPSlidingWindowThrottle, EmailSlidingWindowThrottle]
+    throttle_scope = 'register'
 
     def post(self, request):
         serializer = UserCreateSerializer(data=request.data)
         if serializer.is_valid():
-            user = serializer.save()
+            try:
+                user = serializer.save()
+            except ValidationError:
+                return Response(
+                    {"detail": "Please check your entries and try again."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
             
-            refresh = RefreshToken.for_user(user)
-            activation_token = str(refresh.access_token)
+            activation_token = activation_token_generator.make_token(user)
             uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
             
-            send_verification_email(user.email, uidb64, activation_token)
+            enqueue_email(send_verification_email_job, user.email, uidb64, activation_token)
             
             return Response({
                 "user": {
@@ -66,14 +85,13 @@ class ActivateView(APIView):
         try:
             uid = urlsafe_base64_decode(uidb64).decode()
             user = User.objects.get(pk=uid)
-            access_token = AccessToken(token)
 
-            if str(user.pk) != str(access_token['user_id']):
+            if not activation_token_generator.check_token(user, token):
                 raise Exception
 
             if not user.is_active:
                 user.is_active = True
-                user.save()
+                user.save(update_fields=['is_active'])
                 return Response(
                     {"message": "Account successfully activated."},
                     status=status.HTTP_200_OK
@@ -94,6 +112,8 @@ class LoginView(APIView):
     """Handle user login and set JWT tokens in cookies."""
     
     permission_classes = [AllowAny]
+    throttle_classes = [IPSlidingWindowThrottle, EmailSlidingWindowThrottle]
+    throttle_scope = 'login'
 
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
@@ -104,8 +124,7 @@ class LoginView(APIView):
             )
         
         user = serializer.validated_data['user']
-        refresh = RefreshToken.for_user(user)
-        access_token = refresh.access_token
+        refresh, access_token = get_tokens_for_user(user)
         
         response = Response({
             "detail": "Login successful",
@@ -120,7 +139,7 @@ class LoginView(APIView):
         return response
         
 class TokenRefreshView(APIView):
-    """Refresh JWT access token using refresh token from cookies."""
+    """Refresh JWT access token and rotate the refresh token from cookies."""
     
     permission_classes = [AllowAny]
 
@@ -134,8 +153,8 @@ class TokenRefreshView(APIView):
             )
         
         try:
-            refresh = RefreshToken(refresh_token)
-            new_access_token = refresh.access_token
+            refresh, user = rotate_refresh_token(refresh_token)
+            new_access_token = get_access_token(refresh, user)
         except TokenError:
             return Response(
                 {"detail": "Invalid refresh token"},
@@ -147,7 +166,7 @@ class TokenRefreshView(APIView):
             "access": str(new_access_token)
         }, status=status.HTTP_200_OK)
         
-        set_jwt_cookies(response, new_access_token)
+        set_jwt_cookies(response, new_access_token, refresh)
         
         return response
                 
@@ -182,19 +201,20 @@ class PasswordResetView(APIView):
     """Handle password reset requests by sending email with reset link."""
     
     permission_classes = [AllowAny]
+    throttle_classes = [IPSlidingWindowThrottle, EmailSlidingWindowThrottle]
+    throttle_scope = 'password_reset'
 
     def post(self, request):
         serializer = PasswordResetSerializer(data=request.data)
         if serializer.is_valid():
             email = serializer.validated_data['email']
             try:
-                user = User.objects.get(email=email)
+                user = User.objects.get_by_natural_key(email)
                 
-                refresh = RefreshToken.for_user(user)
-                token = str(refresh.access_token)
+                token = password_reset_token_generator.make_token(user)
                 uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
                 
-                send_password_reset_email(user.email, uidb64, token)
+                enqueue_email(send_password_reset_email_job, user.email, uidb64, token)
                 
             except User.DoesNotExist:
                 pass
@@ -226,9 +246,8 @@ class PasswordConfirmView(APIView):
         try:
             uid = urlsafe_base64_decode(uidb64).decode()
             user = User.objects.get(pk=uid)
-            access_token = AccessToken(token)
             
-            if str(user.pk) != str(access_token['user_id']):
+            if not password_reset_token_generator.check_token(user, token):
                 raise Exception
                 
         except Exception:
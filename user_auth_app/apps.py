@@ -5,3 +5,6 @@ class UserAuthAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'user_auth_app'
 
+    def ready(self):
+        from . import signals
+
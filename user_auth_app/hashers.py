@@ -0,0 +1,71 @@
+import base64
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher, PBKDF2PasswordHasher, ScryptPasswordHasher
+)
+
+
+def scrypt_maxmem(n: int, r: int, p: int) -> int:
+    """Memory limit for scrypt with the given cost; it needs about 128 * n * r * p bytes."""
+    return 2 * 128 * n * r * p
+
+
+class ConfigurableArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id hasher whose cost parameters come from PASSWORD_HASHER_PARAMS."""
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_HASHER_PARAMS['ARGON2_TIME_COST']
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_HASHER_PARAMS['ARGON2_MEMORY_COST']
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_HASHER_PARAMS['ARGON2_PARALLELISM']
+
+
+class ConfigurableScryptPasswordHasher(ScryptPasswordHasher):
+    """Scrypt hasher whose cost parameters come from PASSWORD_HASHER_PARAMS."""
+
+    @property
+    def work_factor(self):
+        return settings.PASSWORD_HASHER_PARAMS['SCRYPT_WORK_FACTOR']
+
+    @property
+    def block_size(self):
+        return settings.PASSWORD_HASHER_PARAMS['SCRYPT_BLOCK_SIZE']
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_HASHER_PARAMS['SCRYPT_PARALLELISM']
+
+    def encode(self, password, salt, n=None, r=None, p=None):
+        """
+        Hash with the given cost, or the configured one for new hashes.
+
+        The memory limit follows the parameters being used, so hashes created
+        with a higher cost still verify after the settings were lowered.
+        """
+        self._check_encode_args(password, salt)
+        n = n or self.work_factor
+        r = r or self.block_size
+        p = p or self.parallelism
+        hash_ = hashlib.scrypt(
+            password.encode(), salt=salt.encode(), n=n, r=r, p=p,
+            maxmem=scrypt_maxmem(n, r, p), dklen=64,
+        )
+        hash_ = base64.b64encode(hash_).decode('ascii').strip()
+        return '%s$%d$%s$%d$%d$%s' % (self.algorithm, n, salt, r, p, hash_)
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 hasher whose iteration count comes from PASSWORD_HASHER_PARAMS."""
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASHER_PARAMS['PBKDF2_ITERATIONS']
+
@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class BulkCommand(BaseCommand):
+    """Base class for commands that process users in batches and report throughput."""
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true', help='Only count the matching users.')
+
+    def run_batches(self, batches, verb: str) -> int:
+        """Consume per-batch counts, printing progress and the overall rate."""
+        start = time.monotonic()
+        total = 0
+        for count in batches:
+            total += count
+            self.stdout.write(f'{verb} {total} users ({self._rate(total, start)})')
+        self.stdout.write(self.style.SUCCESS(f'{verb} {total} users in {time.monotonic() - start:.1f}s ({self._rate(total, start)}).'))
+        return total
+
+    def _rate(self, total: int, start: float) -> str:
+        return f'{total / max(time.monotonic() - start, 1e-6):.0f}/s'
@@ -0,0 +1,62 @@
+import math
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+# Cost parameter scaled to reach --target-ms, per hasher.
+PRIMARY_COST = {
+    'argon2': 'ARGON2_TIME_COST',
+    'scrypt': 'SCRYPT_WORK_FACTOR',
+    'pbkdf2': 'PBKDF2_ITERATIONS',
+}
+
+
+class Command(BaseCommand):
+    help = 'Measure the time to hash one password with each configured hasher on this machine.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rounds', type=int, default=5)
+        parser.add_argument(
+            '--target-ms', type=float, default=None,
+            help='Suggest cost parameters that make one hash take about this long.'
+        )
+
+    def handle(self, *args, **options):
+        for name, path in settings.PASSWORD_HASHER_CLASSES.items():
+            hasher = import_string(path)()
+            try:
+                duration_ms = self._measure(hasher, options['rounds'])
+            except ValueError as e:
+                self.stdout.write(self.style.WARNING(f'{name}: skipped ({e})'))
+                continue
+
+            params = ', '.join(
+                f'{key}={value}' for key, value in settings.PASSWORD_HASHER_PARAMS.items()
+                if key.startswith(name.upper())
+            )
+            preferred = ' (preferred)' if name == settings.PASSWORD_HASHER else ''
+            self.stdout.write(f'{name}{preferred}: {duration_ms:.1f} ms [{params}]')
+
+            if options['target_ms']:
+                key, value = self._suggest(name, duration_ms, options['target_ms'])
+                self.stdout.write(f'  suggested for {options["target_ms"]:.0f} ms: {key}={value}')
+
+    def _measure(self, hasher, rounds: int) -> float:
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            hasher.encode('benchmark-password', hasher.salt())
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def _suggest(self, name: str, duration_ms: float, target_ms: float):
+        key = PRIMARY_COST[name]
+        scaled = settings.PASSWORD_HASHER_PARAMS[key] * target_ms / duration_ms
+        if name == 'scrypt':
+            return key, 2 ** max(1, round(math.log2(scaled)))
+        if name == 'pbkdf2':
+            return key, max(1000, int(round(scaled, -3)))
+        return key, max(1, round(scaled))
@@ -0,0 +1,33 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import CommandError
+from django.db.models import Q
+
+from user_auth_app.api.bulk import deactivate_users
+from user_auth_app.management.bulk import BulkCommand
+
+User = get_user_model()
+
+
+class Command(BulkCommand):
+    help = 'Deactivate non-staff users by email domain or pattern, e.g. spam sign-ups.'
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--domain', action='append', default=[], help='Email domain, may be repeated.')
+        parser.add_argument('--email-regex', help='Case-insensitive regular expression matched against the email.')
+
+    def handle(self, *args, **options):
+        if not options['domain'] and not options['email_regex']:
+            raise CommandError('Pass at least one --domain or --email-regex.')
+
+        match = Q()
+        for domain in options['domain']:
+            match |= Q(email__iendswith=f'@{domain}')
+        if options['email_regex']:
+            match |= Q(email__iregex=options['email_regex'])
+        users = User.objects.filter(match, is_active=True, is_staff=False, is_superuser=False)
+
+        if options['dry_run']:
+            self.stdout.write(f'{users.count()} users would be deactivated.')
+            return
+        self.run_batches(deactivate_users(users, options['batch_size']), 'Deactivated')
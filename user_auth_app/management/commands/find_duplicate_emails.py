@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import F
+
+from user_auth_app.api.bulk import duplicate_emails
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'List accounts whose e-mail addresses differ only in case, optionally deleting the unused ones.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--delete-unused',
+            action='store_true',
+            help='Delete duplicates that were never activated and never logged in.',
+        )
+
+    def handle(self, *args, **options):
+        emails = duplicate_emails()
+        if not emails:
+            self.stdout.write(self.style.SUCCESS('No duplicate e-mail addresses.'))
+            return
+
+        remaining = 0
+        for email in emails:
+            users = list(
+                User.objects
+                .filter(email__iexact=email)
+                .only('pk', 'email', 'is_active', 'last_login', 'date_joined')
+                .order_by('-is_active', F('last_login').desc(nulls_last=True), 'date_joined')
+            )
+            if options['delete_unused']:
+                users = self._delete_unused(users)
+            if len(users) > 1:
+                remaining += 1
+                self.stdout.write(f'{email}: ' + ', '.join(self._describe(user) for user in users))
+
+        if remaining:
+            self.stdout.write(self.style.WARNING(
+                f'{remaining} e-mail addresses still belong to several accounts; '
+                'change or delete them before running migrate.'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS('No duplicate e-mail addresses left.'))
+
+    def _delete_unused(self, users):
+        """Delete every account but the first that was never used, returning the rest."""
+        kept = users[:1]
+        for user in users[1:]:
+            if user.is_active or user.last_login:
+                kept.append(user)
+            else:
+                self.stdout.write(f'Deleted #{user.pk} {user.email}')
+                user.delete()
+        return kept
+
+    def _describe(self, user) -> str:
+        state = 'active' if user.is_active else 'inactive'
+        login = f'last login {user.last_login:%Y-%m-%d}' if user.last_login else 'never logged in'
+        return f'#{user.pk} {user.email} ({state}, {login})'
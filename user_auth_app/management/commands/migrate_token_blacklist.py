@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from user_auth_app.api.tokens import blacklist_jti
+
+
+class Command(BaseCommand):
+    help = 'Copy unexpired entries of the token_blacklist tables into the Redis blacklist.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        entries = (
+            BlacklistedToken.objects
+            .filter(token__expires_at__gt=timezone.now())
+            .values_list('token__jti', 'token__expires_at')
+            .iterator(chunk_size=options['chunk_size'])
+        )
+
+        migrated = 0
+        for jti, expires_at in entries:
+            if blacklist_jti(jti, expires_at.timestamp()):
+                migrated += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Migrated {migrated} blacklisted tokens to Redis.'))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from user_auth_app.api.bulk import delete_in_batches
+
+
+class Command(BaseCommand):
+    help = 'Delete expired outstanding tokens and their blacklist entries in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now())
+        purged = sum(delete_in_batches(expired, options['batch_size']))
+
+        self.stdout.write(self.style.SUCCESS(f'Purged {purged} expired tokens.'))
@@ -0,0 +1,26 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from user_auth_app.api.bulk import delete_in_batches
+from user_auth_app.management.bulk import BulkCommand
+
+User = get_user_model()
+
+
+class Command(BulkCommand):
+    help = 'Delete accounts that were never activated and are older than --days days.'
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--days', type=int, default=30)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        users = User.objects.filter(is_active=False, last_login__isnull=True, date_joined__lt=cutoff)
+
+        if options['dry_run']:
+            self.stdout.write(f'{users.count()} users would be deleted.')
+            return
+        self.run_batches(delete_in_batches(users, options['batch_size']), 'Deleted')
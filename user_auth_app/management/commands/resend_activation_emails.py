@@ -0,0 +1,54 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from user_auth_app.api.bulk import iter_batches
+from user_auth_app.api.emails import build_verification_email, send_emails
+from user_auth_app.api.tasks import send_email_batch_job
+from user_auth_app.api.tokens import activation_token_generator
+from user_auth_app.management.bulk import BulkCommand
+
+User = get_user_model()
+
+
+class Command(BulkCommand):
+    help = 'Send a new activation email to accounts registered in the last --days days that are not active yet.'
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--days', type=int, default=7)
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(days=options['days'])
+        users = User.objects.filter(
+            is_active=False, last_login__isnull=True, date_joined__gte=since
+        ).only('pk', 'email', 'password', 'is_active')
+
+        if options['dry_run']:
+            self.stdout.write(f'{users.count()} users would receive an activation email.')
+            return
+        self.run_batches(self._send(users, options['batch_size']), 'Queued' if settings.EMAIL_QUEUE_ASYNC else 'Emailed')
+
+    def _send(self, users, batch_size: int):
+        # A retried job sends all of its messages again, so each queued job
+        # carries a single SMTP batch instead of a whole --batch-size batch.
+        job_size = settings.EMAIL_BATCH_SIZE
+        for batch in iter_batches(users, batch_size):
+            messages = [
+                build_verification_email(
+                    user.email,
+                    urlsafe_base64_encode(force_bytes(user.pk)),
+                    activation_token_generator.make_token(user),
+                )
+                for user in batch
+            ]
+            if settings.EMAIL_QUEUE_ASYNC:
+                for start in range(0, len(messages), job_size):
+                    send_email_batch_job.delay(messages[start:start + job_size])
+            else:
+                send_emails(messages)
+            yield len(messages)
@@ -0,0 +1,24 @@
+import django_rq
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+from rq.cron import CronScheduler
+
+
+class Command(BaseCommand):
+    help = 'Run the RQ cron scheduler that enqueues the jobs listed in RQ_CRON_JOBS.'
+
+    def handle(self, *args, **options):
+        scheduler = self.get_scheduler()
+        scheduler.start()
+
+    def get_scheduler(self) -> CronScheduler:
+        scheduler = CronScheduler(connection=django_rq.get_connection('default'))
+        for entry in settings.RQ_CRON_JOBS:
+            scheduler.register(
+                import_string(entry['func']),
+                queue_name=entry.get('queue', 'default'),
+                cron=entry.get('cron'),
+                interval=entry.get('interval'),
+            )
+        return scheduler
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 
 class CustomUserManager(BaseUserManager):
@@ -26,6 +27,10 @@ class CustomUserManager(BaseUserManager):
             raise ValueError('A superuser must have is_superuser')
         return self.create_user(email, password, **extra_fields)
 
+    def get_by_natural_key(self, email):
+        """Look up users case-insensitively through the Lower(email) index."""
+        return self.annotate(email_lower=Lower('email')).get(email_lower=email.lower())
+
 class User(AbstractUser):
     """Custom user model with email as username field."""
     
@@ -45,5 +50,13 @@ class User(AbstractUser):
 
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='user_email_lower_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['date_joined'], condition=models.Q(is_active=False), name='user_unactivated_joined_idx'),
+        ]
+
     def __str__(self):
         return self.email
@@ -0,0 +1,41 @@
+from django.core.management.base import CommandError
+from django.db import connections
+from django.db.models.signals import post_save, post_delete, pre_migrate
+from django.dispatch import receiver
+from .models import User
+from .api.bulk import duplicate_emails
+from .api.cache import invalidate_user
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop the user from the authentication cache after changes."""
+    
+    invalidate_user(instance.pk)
+
+
+@receiver(pre_migrate)
+def check_duplicate_emails(sender, using, **kwargs):
+    """
+    Refuse to migrate while e-mail addresses differ only in case.
+
+    Creating the Lower(email) unique constraint on such a table would fail
+    with an IntegrityError half-way through the migrations, so the check
+    runs once, before the constraint exists.
+    """
+    
+    if sender.name != 'user_auth_app':
+        return
+    connection = connections[using]
+    table = User._meta.db_table
+    with connection.cursor() as cursor:
+        if table not in connection.introspection.table_names(cursor):
+            return
+        if 'user_email_lower_unique' in connection.introspection.get_constraints(cursor, table):
+            return
+    emails = duplicate_emails(using)
+    if emails:
+        raise CommandError(
+            f'{len(emails)} e-mail addresses belong to several accounts that differ only in case '
+            f'(e.g. {emails[0]}). Resolve them with `python manage.py find_duplicate_emails` before migrating.'
+        )
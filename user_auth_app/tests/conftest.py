@@ -0,0 +1,21 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from user_auth_app.models import User
+
+
+@pytest.fixture
+def make_user(db):
+    """Provide a factory for users with the test password, optionally joined `days_ago`."""
+    def make_user(email, is_active=True, days_ago=0, **extra_fields):
+        user = User.objects.create_user(
+            email=email,
+            password='TestPassword123!',
+            username=email,
+            is_active=is_active,
+            **extra_fields
+        )
+        if days_ago:
+            User.objects.filter(pk=user.pk).update(date_joined=timezone.now() - timedelta(days=days_ago))
+        return user
+    return make_user
@@ -1,8 +1,11 @@
 import pytest
+from datetime import timedelta
+from django.test import override_settings
 from django.urls import reverse
 from django.utils.http import urlsafe_base64_encode
 from django.utils.encoding import force_bytes
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from user_auth_app.api.tokens import activation_token_generator
 from user_auth_app.models import User
 
 @pytest.mark.django_db
@@ -15,8 +18,7 @@ def test_activate_user_success(client):
         is_active=False
     )
     
-    refresh = RefreshToken.for_user(user)
-    token = str(refresh.access_token)
+    token = activation_token_generator.make_token(user)
     uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
     
     url = reverse('activate', kwargs={'uidb64': uidb64, 'token': token})
@@ -37,8 +39,7 @@ def test_activate_user_already_active(client):
         is_active=True
     )
     
-    refresh = RefreshToken.for_user(user)
-    token = str(refresh.access_token)
+    token = activation_token_generator.make_token(user)
     uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
     
     url = reverse('activate', kwargs={'uidb64': uidb64, 'token': token})
@@ -78,8 +79,7 @@ def test_activate_user_invalid_uid(client):
         is_active=False
     )
     
-    refresh = RefreshToken.for_user(user)
-    token = str(refresh.access_token)
+    token = activation_token_generator.make_token(user)
     invalid_uidb64 = urlsafe_base64_encode(force_bytes(99999))
     
     url = reverse('activate', kwargs={'uidb64': invalid_uidb64, 'token': token})
@@ -104,8 +104,7 @@ def test_activate_user_token_for_different_user(client):
         is_active=False
     )
     
-    refresh = RefreshToken.for_user(user2)
-    token = str(refresh.access_token)
+    token = activation_token_generator.make_token(user2)
     uidb64 = urlsafe_base64_encode(force_bytes(user1.pk))
     
     url = reverse('activate', kwargs={'uidb64': uidb64, 'token': token})
@@ -115,3 +114,40 @@ def test_activate_user_token_for_different_user(client):
     assert response.status_code == 400
     assert response.data['message'] == 'Account activation failed.'
     assert user1.is_active is False
+
+@pytest.mark.django_db
+def test_activate_user_expired_token(client):
+    """Test activation with an expired token."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=False
+    )
+    
+    with override_settings(ACTIVATION_TOKEN_LIFETIME=timedelta(seconds=-1)):
+        token = activation_token_generator.make_token(user)
+    uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
+    
+    url = reverse('activate', kwargs={'uidb64': uidb64, 'token': token})
+    response = client.get(url)
+    
+    user.refresh_from_db()
+    assert response.status_code == 400
+    assert user.is_active is False
+
+@pytest.mark.django_db
+def test_register_issues_activation_token_without_db_writes(client):
+    """Test that registration does not store tokens and its token activates the account."""
+    data = {
+        'email': 'testuser@test.com',
+        'password': 'TestPassword123!',
+        'confirmed_password': 'TestPassword123!'
+    }
+    
+    response = client.post(reverse('register'), data, content_type='application/json')
+    user = User.objects.get(email='testuser@test.com')
+    uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
+    
+    assert not OutstandingToken.objects.exists()
+    assert client.get(reverse('activate', kwargs={'uidb64': uidb64, 'token': response.data['token']})).status_code == 200
@@ -0,0 +1,147 @@
+import pytest
+import time
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import RequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
+from user_auth_app.models import User
+from user_auth_app.api.authentication import CookieJWTAuthentication
+from user_auth_app.api.cache import LocalTTLCache, local_user_cache, cache_token, get_cached_token
+
+
+def _cookie_request(user):
+    request = RequestFactory().get('/api/video/')
+    request.COOKIES['access_token'] = str(RefreshToken.for_user(user).access_token)
+    return request
+
+
+@pytest.mark.django_db
+def test_cached_user_skips_database(django_assert_num_queries):
+    """Test that repeated requests with the same token do not query the users table."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    request = _cookie_request(user)
+    authentication = CookieJWTAuthentication()
+
+    with django_assert_num_queries(1):
+        first_user, _ = authentication.authenticate(request)
+    with django_assert_num_queries(0):
+        second_user, _ = authentication.authenticate(request)
+
+    assert first_user.pk == second_user.pk == user.pk
+
+
+@pytest.mark.django_db
+def test_shared_cache_used_after_local_expiry(django_assert_num_queries):
+    """Test that the Redis level serves users missing from the local LRU."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    request = _cookie_request(user)
+    authentication = CookieJWTAuthentication()
+    authentication.authenticate(request)
+    local_user_cache.clear()
+
+    with django_assert_num_queries(0):
+        cached_user, _ = authentication.authenticate(request)
+
+    assert cached_user.email == 'testuser@test.com'
+
+
+@pytest.mark.django_db
+def test_deactivated_user_invalidates_cache():
+    """Test that saving a user drops it from the cache."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    request = _cookie_request(user)
+    authentication = CookieJWTAuthentication()
+    authentication.authenticate(request)
+
+    user.is_active = False
+    user.save()
+
+    with pytest.raises(AuthenticationFailed):
+        authentication.authenticate(request)
+
+
+@pytest.mark.django_db
+def test_cached_user_is_not_shared_between_requests(django_assert_num_queries):
+    """Test that every hit gets its own user and Redis holds no password hash."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    request = _cookie_request(user)
+    authentication = CookieJWTAuthentication()
+    first_user, _ = authentication.authenticate(request)
+    first_user.first_name = 'Changed'
+    local_user_cache.clear()
+
+    with django_assert_num_queries(0):
+        second_user, _ = authentication.authenticate(request)
+        third_user, _ = authentication.authenticate(request)
+
+    assert second_user is not third_user
+    assert second_user.first_name == ''
+    assert 'password' not in cache.get(f'auth_user_fields:{user.pk}')
+    assert second_user.check_password('TestPassword123!')
+
+
+def test_local_cache_is_bounded_and_expires():
+    """Test LRU eviction and TTL expiry of the process-local cache."""
+    local_cache = LocalTTLCache(maxsize=2)
+    local_cache.set('a', 1, ttl=60)
+    local_cache.set('b', 2, ttl=60)
+    local_cache.get('a')
+    local_cache.set('c', 3, ttl=60)
+
+    assert local_cache.get('b') is None
+    assert local_cache.get('a') == 1
+
+    local_cache.set('d', 4, ttl=-1)
+    assert local_cache.get('d') is None
+    assert len(local_cache) == 1
+
+
+@pytest.mark.django_db
+def test_validated_token_cached():
+    """Test that a repeated cookie is verified only once."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    request = _cookie_request(user)
+    authentication = CookieJWTAuthentication()
+
+    _, first_token = authentication.authenticate(request)
+    with patch('rest_framework_simplejwt.authentication.JWTAuthentication.get_validated_token') as mock_verify:
+        _, second_token = authentication.authenticate(request)
+
+    mock_verify.assert_not_called()
+    assert second_token is first_token
+
+
+def test_expired_token_not_cached():
+    """Test that tokens are only kept until their exp claim."""
+    token = AccessToken()
+    token['exp'] = int(time.time()) - 1
+
+    cache_token('raw-token', token)
+
+    assert get_cached_token('raw-token') is None
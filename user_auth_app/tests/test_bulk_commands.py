@@ -0,0 +1,125 @@
+import pytest
+from io import StringIO
+from unittest.mock import patch
+from django.core import mail
+from django.core.management import call_command
+from django.apps import apps
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import override_settings
+from django.utils import timezone
+from user_auth_app.api.bulk import duplicate_emails
+from user_auth_app.models import User
+from user_auth_app.signals import check_duplicate_emails
+
+
+@pytest.mark.django_db
+def test_deactivate_users_by_domain_in_batches(make_user):
+    """Test that matching users are deactivated in batches and throughput is reported."""
+    for i in range(5):
+        make_user(f'spam{i}@spam.test')
+    make_user('user@test.com')
+    make_user('admin@spam.test', is_staff=True)
+    out = StringIO()
+
+    call_command('deactivate_users', domain=['spam.test'], batch_size=2, stdout=out)
+
+    assert User.objects.filter(email__endswith='@spam.test', is_active=True).count() == 1
+    assert User.objects.get(email='user@test.com').is_active
+    assert 'Deactivated 2 users' in out.getvalue()
+    assert 'Deactivated 5 users in' in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_deactivate_users_dry_run(make_user):
+    """Test that a dry run only counts the matching users."""
+    make_user('spam@spam.test')
+    out = StringIO()
+
+    call_command('deactivate_users', email_regex=r'^spam', dry_run=True, stdout=out)
+
+    assert User.objects.get(email='spam@spam.test').is_active
+    assert '1 users would be deactivated.' in out.getvalue()
+
+
+def test_deactivate_users_requires_filter():
+    """Test that the command refuses to deactivate everybody."""
+    with pytest.raises(CommandError):
+        call_command('deactivate_users')
+
+
+@pytest.mark.django_db
+def test_purge_inactive_users(make_user):
+    """Test that only old, never activated accounts are deleted."""
+    for i in range(3):
+        make_user(f'old{i}@test.com', is_active=False, days_ago=40)
+    make_user('recent@test.com', is_active=False, days_ago=5)
+    make_user('active@test.com', days_ago=40)
+
+    call_command('purge_inactive_users', days=30, batch_size=2, stdout=StringIO())
+
+    assert set(User.objects.values_list('email', flat=True)) == {'recent@test.com', 'active@test.com'}
+
+
+@pytest.mark.django_db
+@override_settings(EMAIL_QUEUE_ASYNC=False, EMAIL_BATCH_SIZE=2)
+def test_resend_activation_emails(make_user):
+    """Test that recent inactive accounts get a new activation email."""
+    for i in range(3):
+        make_user(f'pending{i}@test.com', is_active=False, days_ago=1)
+    make_user('old@test.com', is_active=False, days_ago=30)
+    make_user('active@test.com')
+
+    call_command('resend_activation_emails', days=7, stdout=StringIO())
+
+    assert sorted(message.to[0] for message in mail.outbox) == [f'pending{i}@test.com' for i in range(3)]
+
+
+@pytest.mark.django_db
+@override_settings(EMAIL_BATCH_SIZE=2)
+def test_resend_activation_emails_queues_batches(make_user):
+    """Test that emails are queued as one job per SMTP batch, independent of --batch-size."""
+    for i in range(5):
+        make_user(f'pending{i}@test.com', is_active=False)
+
+    with patch('user_auth_app.management.commands.resend_activation_emails.send_email_batch_job.delay') as mock_delay:
+        call_command('resend_activation_emails', batch_size=3, stdout=StringIO())
+
+    assert [len(c.args[0]) for c in mock_delay.call_args_list] == [2, 1, 2]
+
+
+@pytest.fixture
+def without_email_constraint(transactional_db):
+    """Drop the Lower(email) unique constraint, as on a database created before it existed."""
+    constraint = next(c for c in User._meta.constraints if c.name == 'user_email_lower_unique')
+    with connection.schema_editor() as editor:
+        editor.remove_constraint(User, constraint)
+    yield
+    User.objects.all().delete()
+    with connection.schema_editor() as editor:
+        editor.add_constraint(User, constraint)
+
+
+def test_migrate_refuses_case_insensitive_duplicates(without_email_constraint, make_user):
+    """Test that migrating stops with a clear error while e-mails differ only in case."""
+    make_user('dup@test.com')
+    make_user('Dup@test.com')
+
+    with pytest.raises(CommandError, match='find_duplicate_emails'):
+        check_duplicate_emails(apps.get_app_config('user_auth_app'), using='default')
+
+
+def test_find_duplicate_emails_deletes_unused_accounts(without_email_constraint, make_user):
+    """Test that unused duplicates are deleted and the rest are reported."""
+    make_user('dup@test.com')
+    make_user('DUP@test.com', is_active=False)
+    make_user('other@test.com', last_login=timezone.now())
+    make_user('Other@test.com')
+    out = StringIO()
+
+    call_command('find_duplicate_emails', delete_unused=True, stdout=out)
+
+    assert not User.objects.filter(email='DUP@test.com').exists()
+    assert 'other@test.com: ' in out.getvalue()
+    assert '1 e-mail addresses still belong to several accounts' in out.getvalue()
+    assert duplicate_emails() == ['other@test.com']
@@ -0,0 +1,55 @@
+import pytest
+from datetime import timedelta
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from user_auth_app.api.tasks import cleanup_auth_data
+from user_auth_app.management.commands.rqcron import Command as RQCronCommand
+from user_auth_app.models import User
+
+CLEANUP = {'INACTIVE_USER_DAYS': 30, 'BATCH_SIZE': 2, 'MAX_BATCHES': 1}
+
+
+@pytest.mark.django_db
+@override_settings(AUTH_CLEANUP={**CLEANUP, 'MAX_BATCHES': None})
+def test_cleanup_deletes_unactivated_users_and_expired_tokens(make_user):
+    """Test that old unactivated users and expired tokens are removed."""
+    make_user('old@test.com', is_active=False, days_ago=40)
+    make_user('recent@test.com', is_active=False, days_ago=5)
+    active = make_user('active@test.com', days_ago=40)
+    expired = RefreshToken.for_user(active)
+    valid = RefreshToken.for_user(active)
+    OutstandingToken.objects.filter(jti=expired['jti']).update(expires_at=timezone.now() - timedelta(hours=1))
+
+    deleted = cleanup_auth_data()
+
+    assert deleted == {'users': 1, 'tokens': 1}
+    assert set(User.objects.values_list('email', flat=True)) == {'recent@test.com', 'active@test.com'}
+    assert list(OutstandingToken.objects.values_list('jti', flat=True)) == [valid['jti']]
+
+
+@pytest.mark.django_db
+@override_settings(AUTH_CLEANUP=CLEANUP)
+def test_cleanup_is_bounded_per_run(make_user):
+    """Test that a run deletes at most MAX_BATCHES batches and the next run continues."""
+    for i in range(3):
+        make_user(f'old{i}@test.com', is_active=False, days_ago=40)
+
+    assert cleanup_auth_data()['users'] == 2
+    assert User.objects.count() == 1
+    assert cleanup_auth_data()['users'] == 1
+    assert not User.objects.exists()
+
+
+def test_rqcron_registers_configured_jobs(redis_connection):
+    """Test that the cron scheduler registers every job from RQ_CRON_JOBS."""
+    with override_settings(RQ_CRON_JOBS=[
+        {'func': 'user_auth_app.api.tasks.cleanup_auth_data', 'queue': 'default', 'cron': '15 3 * * *'},
+    ]):
+        scheduler = RQCronCommand().get_scheduler()
+
+    jobs = scheduler.get_jobs()
+    assert len(jobs) == 1
+    assert jobs[0].func is cleanup_auth_data
+    assert jobs[0].queue_name == 'default'
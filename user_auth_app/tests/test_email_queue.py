@@ -0,0 +1,104 @@
+import pytest
+import smtplib
+from unittest.mock import Mock, patch
+from django.core import mail
+from django.test import override_settings
+from django.urls import reverse
+from user_auth_app.api.emails import get_pooled_connection, send_emails
+from user_auth_app.api.tasks import send_verification_email_job
+from user_auth_app.models import User
+
+REGISTER_DATA = {
+    'email': 'testuser@test.com',
+    'password': 'TestPassword123!',
+    'confirmed_password': 'TestPassword123!'
+}
+
+
+@pytest.mark.django_db
+def test_register_queues_verification_email(client, django_capture_on_commit_callbacks):
+    """Test that registration queues the verification email instead of sending it."""
+    with patch('user_auth_app.api.tasks.send_verification_email_job.delay') as mock_delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(reverse('register'), REGISTER_DATA, content_type='application/json')
+
+    assert response.status_code == 201
+    assert len(mail.outbox) == 0
+    mock_delay.assert_called_once()
+    assert mock_delay.call_args.args[0] == 'testuser@test.com'
+    assert mock_delay.call_args.args[2] == response.data['token']
+
+
+@pytest.mark.django_db
+def test_password_reset_queues_email(client, django_capture_on_commit_callbacks):
+    """Test that password reset requests queue the reset email."""
+    User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+
+    with patch('user_auth_app.api.tasks.send_password_reset_email_job.delay') as mock_delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(reverse('password_reset'), {'email': 'testuser@test.com'}, content_type='application/json')
+
+    assert response.status_code == 200
+    mock_delay.assert_called_once()
+    assert mock_delay.call_args.args[0] == 'testuser@test.com'
+
+
+@pytest.mark.django_db
+def test_email_not_queued_when_transaction_rolls_back(client, django_capture_on_commit_callbacks):
+    """Test that no job is queued before the transaction commits."""
+    with patch('user_auth_app.api.tasks.send_verification_email_job.delay') as mock_delay:
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            client.post(reverse('register'), REGISTER_DATA, content_type='application/json')
+
+    assert len(callbacks) == 1
+    mock_delay.assert_not_called()
+
+
+@pytest.mark.django_db
+@override_settings(EMAIL_QUEUE_ASYNC=False)
+def test_register_sends_email_inline_without_queue(client):
+    """Test that emails are delivered to the locmem backend when the queue is disabled."""
+    response = client.post(reverse('register'), REGISTER_DATA, content_type='application/json')
+
+    assert response.status_code == 201
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].to == ['testuser@test.com']
+    assert response.data['token'] in mail.outbox[0].body
+
+
+@override_settings(EMAIL_BATCH_SIZE=2)
+def test_send_emails_batches_over_one_connection():
+    """Test that messages are sent in batches over a single open connection."""
+    messages = [mail.EmailMessage(subject=f'Mail {i}', to=[f'user{i}@test.com']) for i in range(5)]
+    connection = Mock()
+    connection.send_messages.side_effect = len
+
+    sent = send_emails(messages, connection=connection)
+
+    assert sent == 5
+    assert [len(c.args[0]) for c in connection.send_messages.call_args_list] == [2, 2, 1]
+    connection.close.assert_not_called()
+
+
+def test_send_emails_reconnects_after_disconnect():
+    """Test that a connection dropped by the server is reopened once."""
+    message = mail.EmailMessage(subject='Mail', to=['user@test.com'])
+    connection = Mock()
+    connection.send_messages.side_effect = [smtplib.SMTPServerDisconnected(), 1]
+
+    assert send_emails([message], connection=connection) == 1
+    connection.close.assert_called_once()
+
+
+def test_verification_email_job_uses_pooled_connection():
+    """Test that the email job delivers through the pooled connection."""
+    send_verification_email_job('testuser@test.com', 'uid', 'token')
+    send_verification_email_job('other@test.com', 'uid', 'token')
+
+    assert [message.to for message in mail.outbox] == [['testuser@test.com'], ['other@test.com']]
+    assert get_pooled_connection() is get_pooled_connection()
@@ -0,0 +1,40 @@
+from unittest.mock import patch
+from django.template.loader import render_to_string
+from user_auth_app.api import emails
+from user_auth_app.api.emails import (
+    build_password_reset_email, build_verification_email, get_logo_image,
+    get_template_skeleton, render_email_template
+)
+
+
+def test_render_email_template_matches_django_rendering():
+    """Test that skeleton substitution produces the same HTML as rendering the template."""
+    context = {'link': 'https://frontend.test/activate?uid=MQ&token=abc', 'user_email': 'o\'neil<x>@test.com'}
+
+    for template_name in ('email/activation.html', 'email/password_reset.html'):
+        assert render_email_template(template_name, **context) == render_to_string(template_name, context)
+
+
+def test_email_template_rendered_once():
+    """Test that each template is rendered only once per process."""
+    get_template_skeleton.cache_clear()
+
+    with patch('user_auth_app.api.emails.render_to_string', wraps=render_to_string) as mock_render:
+        build_verification_email('first@test.com', 'uid', 'token-1')
+        build_verification_email('second@test.com', 'uid', 'token-2')
+
+    assert mock_render.call_count == 1
+
+
+def test_logo_image_built_once():
+    """Test that the logo is looked up and encoded only once and attached to every email."""
+    get_logo_image.cache_clear()
+
+    with patch('user_auth_app.api.emails.finders.find', wraps=emails.finders.find) as mock_find:
+        first = build_verification_email('first@test.com', 'uid', 'token')
+        second = build_password_reset_email('second@test.com', 'uid', 'token')
+
+    assert mock_find.call_count == 1
+    assert first.attachments == [get_logo_image()]
+    assert second.attachments == [get_logo_image()]
+    assert get_logo_image()['Content-ID'] == '<videoflix_logo>'
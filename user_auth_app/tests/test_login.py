@@ -116,3 +116,23 @@ def test_login_invalid_email_format(client):
     
     response = client.post(url, data, content_type='application/json')
     assert response.status_code == 400
+
+@pytest.mark.django_db
+def test_login_email_case_insensitive(client):
+    """Test that login finds the user regardless of email case."""
+    User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    
+    url = reverse('login')
+    data = {
+        'email': 'TestUser@Test.com',
+        'password': 'TestPassword123!'
+    }
+    
+    response = client.post(url, data, content_type='application/json')
+    
+    assert response.status_code == 200
@@ -2,7 +2,7 @@ import pytest
 from django.urls import reverse
 from django.utils.http import urlsafe_base64_encode
 from django.utils.encoding import force_bytes
-from rest_framework_simplejwt.tokens import RefreshToken
+from user_auth_app.api.tokens import activation_token_generator, password_reset_token_generator
 from user_auth_app.models import User
 
 @pytest.mark.django_db
@@ -15,8 +15,7 @@ def test_password_confirm_success(client):
         is_active=True
     )
     
-    refresh = RefreshToken.for_user(user)
-    token = str(refresh.access_token)
+    token = password_reset_token_generator.make_token(user)
     uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
     
     url = reverse('password_confirm', kwargs={'uidb64': uidb64, 'token': token})
@@ -43,8 +42,7 @@ def test_password_confirm_passwords_dont_match(client):
         is_active=True
     )
     
-    refresh = RefreshToken.for_user(user)
-    token = str(refresh.access_token)
+    token = password_reset_token_generator.make_token(user)
     uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
     
     url = reverse('password_confirm', kwargs={'uidb64': uidb64, 'token': token})
@@ -92,8 +90,7 @@ def test_password_confirm_invalid_uid(client):
         is_active=True
     )
     
-    refresh = RefreshToken.for_user(user)
-    token = str(refresh.access_token)
+    token = password_reset_token_generator.make_token(user)
     invalid_uidb64 = urlsafe_base64_encode(force_bytes(99999))
     
     url = reverse('password_confirm', kwargs={'uidb64': invalid_uidb64, 'token': token})
@@ -117,8 +114,7 @@ def test_password_confirm_weak_password(client):
         is_active=True
     )
     
-    refresh = RefreshToken.for_user(user)
-    token = str(refresh.access_token)
+    token = password_reset_token_generator.make_token(user)
     uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
     
     url = reverse('password_confirm', kwargs={'uidb64': uidb64, 'token': token})
@@ -131,3 +127,55 @@ def test_password_confirm_weak_password(client):
     
     assert response.status_code == 400
     assert response.data['detail'] == 'Passwords do not match'
+
+@pytest.mark.django_db
+def test_password_confirm_token_single_use(client):
+    """Test that a reset token stops working once the password has changed."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='OldPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    
+    token = password_reset_token_generator.make_token(user)
+    uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
+    url = reverse('password_confirm', kwargs={'uidb64': uidb64, 'token': token})
+    data = {
+        'new_password': 'NewPassword123!',
+        'confirm_password': 'NewPassword123!'
+    }
+    
+    assert client.post(url, data, content_type='application/json').status_code == 200
+    data = {
+        'new_password': 'OtherPassword123!',
+        'confirm_password': 'OtherPassword123!'
+    }
+    response = client.post(url, data, content_type='application/json')
+    
+    assert response.status_code == 400
+    assert response.data['detail'] == 'Invalid token or user'
+    user.refresh_from_db()
+    assert user.check_password('NewPassword123!')
+
+@pytest.mark.django_db
+def test_password_confirm_rejects_activation_token(client):
+    """Test that tokens issued for another purpose are rejected."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='OldPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    
+    token = activation_token_generator.make_token(user)
+    uidb64 = urlsafe_base64_encode(force_bytes(user.pk))
+    url = reverse('password_confirm', kwargs={'uidb64': uidb64, 'token': token})
+    data = {
+        'new_password': 'NewPassword123!',
+        'confirm_password': 'NewPassword123!'
+    }
+    
+    response = client.post(url, data, content_type='application/json')
+    
+    assert response.status_code == 400
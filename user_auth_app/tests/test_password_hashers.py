@@ -0,0 +1,99 @@
+import pytest
+from io import StringIO
+from django.contrib.auth.hashers import identify_hasher
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from user_auth_app.models import User
+
+HASHERS = [
+    'user_auth_app.hashers.ConfigurableScryptPasswordHasher',
+    'user_auth_app.hashers.ConfigurableArgon2PasswordHasher',
+    'user_auth_app.hashers.ConfigurablePBKDF2PasswordHasher',
+]
+
+CHEAP_PARAMS = {
+    'ARGON2_TIME_COST': 1,
+    'ARGON2_MEMORY_COST': 1024,
+    'ARGON2_PARALLELISM': 1,
+    'SCRYPT_WORK_FACTOR': 2 ** 10,
+    'SCRYPT_BLOCK_SIZE': 8,
+    'SCRYPT_PARALLELISM': 1,
+    'PBKDF2_ITERATIONS': 1000,
+}
+
+
+def _login(client):
+    data = {'email': 'testuser@test.com', 'password': 'TestPassword123!'}
+    return client.post(reverse('login'), data, content_type='application/json')
+
+
+@pytest.mark.django_db
+def test_login_rehashes_with_preferred_hasher(client):
+    """Test that a hash of another algorithm is upgraded when the user logs in."""
+    with override_settings(PASSWORD_HASHERS=HASHERS[2:], PASSWORD_HASHER_PARAMS=CHEAP_PARAMS):
+        user = User.objects.create_user(
+            email='testuser@test.com',
+            password='TestPassword123!',
+            username='testuser@test.com',
+            is_active=True
+        )
+    assert user.password.startswith('pbkdf2_sha256$1000$')
+
+    with override_settings(PASSWORD_HASHERS=HASHERS, PASSWORD_HASHER_PARAMS=CHEAP_PARAMS):
+        assert _login(client).status_code == 200
+
+    user.refresh_from_db()
+    assert identify_hasher(user.password).algorithm == 'scrypt'
+    assert '$1024$' in user.password
+
+
+@pytest.mark.django_db
+def test_login_rehashes_when_cost_changes(client):
+    """Test that raising the configured cost upgrades hashes on login."""
+    with override_settings(PASSWORD_HASHERS=HASHERS[1:], PASSWORD_HASHER_PARAMS=CHEAP_PARAMS):
+        user = User.objects.create_user(
+            email='testuser@test.com',
+            password='TestPassword123!',
+            username='testuser@test.com',
+            is_active=True
+        )
+    assert 't=1' in user.password
+
+    with override_settings(PASSWORD_HASHERS=HASHERS[1:], PASSWORD_HASHER_PARAMS={**CHEAP_PARAMS, 'ARGON2_TIME_COST': 2}):
+        assert _login(client).status_code == 200
+
+    user.refresh_from_db()
+    assert 't=2' in user.password
+
+
+@pytest.mark.django_db
+def test_login_verifies_scrypt_hash_after_cost_was_lowered(client):
+    """Test that an scrypt hash above OpenSSL's default memory limit still verifies after lowering the cost."""
+    with override_settings(PASSWORD_HASHERS=HASHERS, PASSWORD_HASHER_PARAMS={**CHEAP_PARAMS, 'SCRYPT_WORK_FACTOR': 2 ** 15}):
+        user = User.objects.create_user(
+            email='testuser@test.com',
+            password='TestPassword123!',
+            username='testuser@test.com',
+            is_active=True
+        )
+    assert user.password.startswith('scrypt$32768$')
+
+    with override_settings(PASSWORD_HASHERS=HASHERS, PASSWORD_HASHER_PARAMS=CHEAP_PARAMS):
+        assert _login(client).status_code == 200
+
+    user.refresh_from_db()
+    assert user.password.startswith('scrypt$1024$')
+
+
+@override_settings(PASSWORD_HASHER_PARAMS=CHEAP_PARAMS)
+def test_benchmark_password_hashers_command():
+    """Test that the benchmark reports every hasher and suggests cost parameters."""
+    out = StringIO()
+
+    call_command('benchmark_password_hashers', rounds=1, target_ms=100, stdout=out)
+
+    output = out.getvalue()
+    for name in ('argon2', 'scrypt', 'pbkdf2'):
+        assert f'{name}' in output
+    assert 'suggested for 100 ms: PBKDF2_ITERATIONS=' in output
@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from user_auth_app.models import User
 
@@ -93,3 +95,41 @@ def test_register_user_missing_fields(client):
 
     response = client.post(url, data, content_type='application/json')
     assert response.status_code == 400
+
+@pytest.mark.django_db
+def test_register_user_with_existing_email_different_case(client):
+    """Test that emails differing only in case are rejected as duplicates."""
+    User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com'
+    )
+    
+    url = reverse('register')
+    data = {
+        'email': 'TestUser@test.com',
+        'password': 'TestPassword123!',
+        'confirmed_password': 'TestPassword123!'
+    }
+
+    response = client.post(url, data, content_type='application/json')
+    assert response.status_code == 400
+    assert response.data['detail'] == 'Please check your entries and try again.'
+    assert User.objects.count() == 1
+
+@pytest.mark.django_db
+def test_register_user_without_lookup_query(client):
+    """Test that registration inserts the user without checking for duplicates first."""
+    url = reverse('register')
+    data = {
+        'email': 'testuser@test.com',
+        'password': 'TestPassword123!',
+        'confirmed_password': 'TestPassword123!'
+    }
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(url, data, content_type='application/json')
+
+    assert response.status_code == 201
+    user_selects = [q['sql'] for q in queries if q['sql'].startswith('SELECT') and 'user_auth_app_user' in q['sql']]
+    assert user_selects == []
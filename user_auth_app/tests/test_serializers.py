@@ -42,23 +42,25 @@ class TestUserCreateSerializer:
         assert 'Passwords do not match' in str(serializer.errors)
     
     def test_email_already_exists(self):
-        """Test validation when email already exists."""
+        """Test that saving fails when email already exists, ignoring case."""
         User.objects.create_user(
             email='existing@test.com',
             password='Password123!'
         )
         
         data = {
-            'email': 'existing@test.com',
+            'email': 'Existing@test.com',
             'password': 'TestPassword123!',
             'confirmed_password': 'TestPassword123!'
         }
         
         serializer = UserCreateSerializer(data=data)
-        assert not serializer.is_valid()
-        assert 'email' in serializer.errors
-        error_text = str(serializer.errors['email'][0])
+        assert serializer.is_valid()
+        with pytest.raises(ValidationError) as exc_info:
+            serializer.save()
+        error_text = str(exc_info.value.detail['email'][0])
         assert 'already exists' in error_text.lower()
+        assert User.objects.count() == 1
     
     def test_invalid_email_format(self):
         """Test validation with invalid email format."""
@@ -0,0 +1,79 @@
+import pytest
+from unittest.mock import patch
+from django.urls import reverse
+from user_auth_app.api.throttling import SlidingWindowThrottle, sliding_window_hit
+
+RATES = {'login_ip': '3/min', 'login_email': '2/min', 'password_reset_email': '1/hour'}
+
+
+@pytest.fixture
+def throttle_rates():
+    """Use small throttle rates."""
+    with patch.object(SlidingWindowThrottle, 'THROTTLE_RATES', RATES):
+        yield
+
+
+def _login(client, email):
+    data = {'email': email, 'password': 'WrongPassword123!'}
+    return client.post(reverse('login'), data, content_type='application/json')
+
+
+@pytest.mark.django_db
+def test_login_throttled_per_email(client, throttle_rates):
+    """Test that repeated logins for one email are throttled with Retry-After."""
+    assert _login(client, 'victim@test.com').status_code == 400
+    assert _login(client, 'Victim@test.com').status_code == 400
+
+    response = _login(client, 'victim@test.com')
+
+    assert response.status_code == 429
+    assert 0 < int(response['Retry-After']) <= 60
+
+
+@pytest.mark.django_db
+def test_login_throttled_per_ip(client, throttle_rates):
+    """Test that one IP cannot cycle through email addresses."""
+    for i in range(3):
+        assert _login(client, f'user{i}@test.com').status_code == 400
+
+    response = _login(client, 'user3@test.com')
+
+    assert response.status_code == 429
+    assert 'Retry-After' in response
+
+
+@pytest.mark.django_db
+def test_spoofed_forwarded_for_does_not_reset_ip_window(client, throttle_rates):
+    """Test that a client cannot get a fresh IP window by sending its own X-Forwarded-For."""
+    for i in range(3):
+        response = client.post(
+            reverse('login'), {'email': f'user{i}@test.com', 'password': 'WrongPassword123!'},
+            content_type='application/json', HTTP_X_FORWARDED_FOR=f'10.0.0.{i}')
+        assert response.status_code == 400
+
+    response = client.post(
+        reverse('login'), {'email': 'user3@test.com', 'password': 'WrongPassword123!'},
+        content_type='application/json', HTTP_X_FORWARDED_FOR='10.0.0.3')
+
+    assert response.status_code == 429
+
+
+@pytest.mark.django_db
+def test_throttle_scopes_are_independent(client, throttle_rates):
+    """Test that each endpoint has its own limits."""
+    url = reverse('password_reset')
+    data = {'email': 'victim@test.com'}
+
+    assert client.post(url, data, content_type='application/json').status_code == 200
+    assert client.post(url, data, content_type='application/json').status_code == 429
+    assert _login(client, 'victim@test.com').status_code == 400
+
+
+def test_sliding_window_releases_old_hits(redis_connection):
+    """Test that hits leave the window once it has passed."""
+    with patch('user_auth_app.api.throttling.time.time', return_value=1000.0):
+        assert sliding_window_hit('throttle:test', 1, 60) == 0
+    with patch('user_auth_app.api.throttling.time.time', return_value=1030.0):
+        assert sliding_window_hit('throttle:test', 1, 60) == 30
+    with patch('user_auth_app.api.throttling.time.time', return_value=1060.5):
+        assert sliding_window_hit('throttle:test', 1, 60) == 0
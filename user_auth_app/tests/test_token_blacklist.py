@@ -0,0 +1,75 @@
+import pytest
+from datetime import timedelta
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken as DatabaseRefreshToken, TokenError
+from user_auth_app.api.tokens import RefreshToken, is_blacklisted
+from user_auth_app.models import User
+
+
+@pytest.fixture
+def user():
+    """Create an active user."""
+    return User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+
+
+@pytest.mark.django_db
+def test_blacklist_without_database_writes(user):
+    """Test that issuing and blacklisting tokens does not use the token_blacklist tables."""
+    refresh = RefreshToken.for_user(user)
+    refresh.blacklist()
+
+    assert is_blacklisted(refresh['jti'])
+    assert not OutstandingToken.objects.exists()
+    assert not BlacklistedToken.objects.exists()
+    with pytest.raises(TokenError):
+        RefreshToken(str(refresh))
+
+
+@pytest.mark.django_db
+def test_logout_blacklists_refresh_token(client, user):
+    """Test that a refresh token cannot be used after logout."""
+    refresh = RefreshToken.for_user(user)
+    client.cookies['refresh_token'] = str(refresh)
+
+    client.post(reverse('logout'))
+    client.cookies['refresh_token'] = str(refresh)
+    response = client.post(reverse('token_refresh'))
+
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_migrate_token_blacklist_command(user):
+    """Test that unexpired database blacklist entries are copied to Redis."""
+    refresh = DatabaseRefreshToken.for_user(user)
+    refresh.blacklist()
+
+    call_command('migrate_token_blacklist')
+
+    assert is_blacklisted(refresh['jti'])
+    with pytest.raises(TokenError):
+        RefreshToken(str(refresh))
+
+
+@pytest.mark.django_db
+def test_purge_expired_tokens_command(user):
+    """Test that only expired outstanding tokens are purged."""
+    expired = DatabaseRefreshToken.for_user(user)
+    expired.blacklist()
+    OutstandingToken.objects.filter(jti=expired['jti']).update(
+        expires_at=timezone.now() - timedelta(minutes=1)
+    )
+    valid = DatabaseRefreshToken.for_user(user)
+
+    call_command('purge_expired_tokens', batch_size=1)
+
+    assert list(OutstandingToken.objects.values_list('jti', flat=True)) == [valid['jti']]
+    assert not BlacklistedToken.objects.exists()
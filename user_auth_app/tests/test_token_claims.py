@@ -0,0 +1,195 @@
+import pytest
+from unittest.mock import patch
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.tokens import AccessToken
+from user_auth_app.api.tokens import RefreshToken
+from user_auth_app.models import User
+from user_auth_app.api.authentication import CookieJWTAuthentication
+from user_auth_app.api.utils import get_tokens_for_user
+
+
+def _login(email, password):
+    api_client = APIClient()
+    response = api_client.post(reverse('login'), {'email': email, 'password': password}, format='json')
+    assert response.status_code == 200
+    return api_client, response.cookies['access_token'].value
+
+
+@pytest.mark.django_db
+@override_settings(AUTH_TOKEN_USER_CLAIMS=True)
+def test_login_embeds_user_claims():
+    """Test that access tokens carry the claims needed for permission checks and refresh tokens do not."""
+    User.objects.create_superuser(
+        email='admin@test.com',
+        password='AdminPassword123!',
+        username='admin@test.com'
+    )
+
+    api_client, access_token = _login('admin@test.com', 'AdminPassword123!')
+    token = AccessToken(access_token)
+    refresh = RefreshToken(api_client.cookies['refresh_token'].value)
+
+    assert token['is_staff'] is True
+    assert token['is_active'] is True
+    assert 'is_staff' not in refresh.payload
+    assert 'is_active' not in refresh.payload
+
+
+@pytest.mark.django_db
+@override_settings(AUTH_TOKEN_USER_CLAIMS=True)
+def test_claims_authentication_without_queries(django_assert_num_queries):
+    """Test that tokens with claims authenticate without a database lookup."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    request = RequestFactory().get('/api/video/')
+    request.COOKIES['access_token'] = str(get_tokens_for_user(user)[1])
+
+    with django_assert_num_queries(0):
+        token_user, _ = CookieJWTAuthentication().authenticate(request)
+
+    assert isinstance(token_user, TokenUser)
+    assert token_user.id == user.id
+    assert token_user.is_staff is False
+
+
+@pytest.mark.django_db
+@override_settings(AUTH_TOKEN_USER_CLAIMS=True)
+def test_claims_admin_permission_enforced():
+    """Test that IsAdminUser works with claim-based users."""
+    User.objects.create_superuser(
+        email='admin@test.com',
+        password='AdminPassword123!',
+        username='admin@test.com'
+    )
+    User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    data = {
+        'title': 'Test Video',
+        'description': 'Test Description',
+        'genre': 'action',
+        'filename': 'movie.mp4',
+        'total_size': 10,
+    }
+
+    admin_client, _ = _login('admin@test.com', 'AdminPassword123!')
+    user_client, _ = _login('testuser@test.com', 'TestPassword123!')
+
+    assert admin_client.post(reverse('chunked-upload'), data, format='json').status_code == 201
+    assert user_client.post(reverse('chunked-upload'), data, format='json').status_code == 403
+
+
+@pytest.mark.django_db
+@override_settings(AUTH_TOKEN_USER_CLAIMS=True)
+def test_claims_admin_can_upload_video(settings, tmp_path):
+    """Test that VideoUploadView accepts a cookie-authenticated admin and rejects other users."""
+    settings.MEDIA_ROOT = str(tmp_path)
+    User.objects.create_superuser(
+        email='admin@test.com',
+        password='AdminPassword123!',
+        username='admin@test.com'
+    )
+    User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+
+    def data():
+        return {
+            'title': 'Test Video',
+            'description': 'Test Description',
+            'genre': 'action',
+            'original_file': SimpleUploadedFile('movie.mp4', b'fake video content', content_type='video/mp4'),
+        }
+
+    admin_client, _ = _login('admin@test.com', 'AdminPassword123!')
+    user_client, _ = _login('testuser@test.com', 'TestPassword123!')
+
+    with patch('content.api.upload_handlers.probe_video', return_value={'duration': 1.0}):
+        assert admin_client.post(reverse('video-upload'), data(), format='multipart').status_code == 201
+        assert user_client.post(reverse('video-upload'), data(), format='multipart').status_code == 403
+
+
+@pytest.mark.django_db
+@override_settings(AUTH_TOKEN_USER_CLAIMS=True)
+def test_refresh_reads_current_user_claims():
+    """Test that a demoted admin loses admin claims at the next refresh."""
+    admin = User.objects.create_superuser(
+        email='admin@test.com',
+        password='AdminPassword123!',
+        username='admin@test.com'
+    )
+    admin_client, _ = _login('admin@test.com', 'AdminPassword123!')
+    User.objects.filter(pk=admin.pk).update(is_staff=False, is_superuser=False)
+
+    response = admin_client.post(reverse('token_refresh'))
+
+    assert response.status_code == 200
+    assert AccessToken(response.data['access'])['is_staff'] is False
+    assert admin_client.post(reverse('chunked-upload'), {}, format='json').status_code == 403
+
+
+@pytest.mark.django_db
+@override_settings(AUTH_TOKEN_USER_CLAIMS=True)
+def test_refresh_rejected_for_deactivated_user():
+    """Test that a deactivated user cannot refresh tokens."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    api_client, _ = _login('testuser@test.com', 'TestPassword123!')
+    User.objects.filter(pk=user.pk).update(is_active=False)
+
+    response = api_client.post(reverse('token_refresh'))
+
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+@override_settings(AUTH_TOKEN_USER_CLAIMS=True)
+def test_claims_inactive_user_rejected():
+    """Test that a token claiming an inactive user is rejected."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=False
+    )
+    request = RequestFactory().get('/api/video/')
+    request.COOKIES['access_token'] = str(get_tokens_for_user(user)[1])
+
+    with pytest.raises(AuthenticationFailed):
+        CookieJWTAuthentication().authenticate(request)
+
+
+@pytest.mark.django_db
+def test_claims_ignored_when_disabled():
+    """Test that the database-backed user is returned by default."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    request = RequestFactory().get('/api/video/')
+    request.COOKIES['access_token'] = str(get_tokens_for_user(user)[1])
+
+    authenticated_user, _ = CookieJWTAuthentication().authenticate(request)
+
+    assert isinstance(authenticated_user, User)
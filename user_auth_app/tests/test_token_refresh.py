@@ -1,6 +1,7 @@
 import pytest
+from django.test import override_settings
 from django.urls import reverse
-from rest_framework_simplejwt.tokens import RefreshToken
+from user_auth_app.api.tokens import RefreshToken, is_blacklisted
 from user_auth_app.models import User
 
 @pytest.mark.django_db
@@ -65,3 +66,67 @@ def test_token_refresh_blacklisted_token(client):
     
     assert response.status_code == 401
     assert response.data['detail'] == 'Invalid refresh token'
+
+@pytest.mark.django_db
+def test_token_refresh_rotates_refresh_token(client):
+    """Test that refreshing issues a new refresh cookie and blacklists the old token."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    
+    refresh = RefreshToken.for_user(user)
+    client.cookies['refresh_token'] = str(refresh)
+    
+    response = client.post(reverse('token_refresh'))
+    
+    assert response.status_code == 200
+    new_refresh = RefreshToken(response.cookies['refresh_token'].value)
+    assert new_refresh['jti'] != refresh['jti']
+    assert new_refresh['user_id'] == refresh['user_id']
+    assert is_blacklisted(refresh['jti'])
+
+@pytest.mark.django_db
+def test_token_refresh_concurrent_reuse_returns_same_token(client):
+    """Test that concurrent refreshes with the same token share one rotation."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    
+    refresh = str(RefreshToken.for_user(user))
+    url = reverse('token_refresh')
+    
+    client.cookies['refresh_token'] = refresh
+    first_refresh = client.post(url).cookies['refresh_token'].value
+    client.cookies['refresh_token'] = refresh
+    second_response = client.post(url)
+    
+    assert second_response.status_code == 200
+    assert second_response.cookies['refresh_token'].value == first_refresh
+
+@pytest.mark.django_db
+@override_settings(AUTH_REFRESH_REUSE_GRACE=0)
+def test_token_refresh_reuse_after_grace_rejected(client):
+    """Test that a rotated refresh token cannot be reused after the grace period."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    
+    refresh = str(RefreshToken.for_user(user))
+    url = reverse('token_refresh')
+    
+    client.cookies['refresh_token'] = refresh
+    assert client.post(url).status_code == 200
+    client.cookies['refresh_token'] = refresh
+    response = client.post(url)
+    
+    assert response.status_code == 401
+    assert response.data['detail'] == 'Invalid refresh token'
@@ -22,12 +22,11 @@ def test_user_profile_get_authenticated(client):
     api_client = APIClient()
     api_client.cookies['access_token'] = access_token
     
-    url = reverse('user-profile-list')
+    url = reverse('user-profile')
     response = api_client.get(url)
     
     assert response.status_code == 200
-    assert len(response.data) == 1
-    profile = response.data[0]
+    profile = response.data
     assert profile['email'] == 'testuser@test.com'
     assert profile['username'] == 'testuser@test.com'
     assert profile['first_name'] == 'Test'
@@ -39,7 +38,7 @@ def test_user_profile_get_authenticated(client):
 def test_user_profile_get_unauthenticated(client):
     """Test retrieving user profile without authentication."""
     api_client = APIClient()
-    url = reverse('user-profile-list')
+    url = reverse('user-profile')
     response = api_client.get(url)
     
     assert response.status_code == 401
@@ -62,7 +61,7 @@ def test_user_profile_update_patch(client):
     api_client = APIClient()
     api_client.cookies['access_token'] = access_token
     
-    url = reverse('user-profile-detail', kwargs={'pk': user.id})
+    url = reverse('user-profile')
     data = {
         'first_name': 'New',
         'last_name': 'Name'
@@ -97,7 +96,7 @@ def test_user_profile_update_put(client):
     api_client = APIClient()
     api_client.cookies['access_token'] = access_token
     
-    url = reverse('user-profile-detail', kwargs={'pk': user.id})
+    url = reverse('user-profile')
     data = {
         'email': 'testuser@test.com',
         'first_name': 'Completely',
@@ -130,7 +129,7 @@ def test_user_profile_readonly_fields(client):
     api_client = APIClient()
     api_client.cookies['access_token'] = access_token
     
-    url = reverse('user-profile-detail', kwargs={'pk': user.id})
+    url = reverse('user-profile')
     data = {
         'username': 'newerusername@test.com',
         'date_joined': '2020-01-01T00:00:00Z',
@@ -170,10 +169,11 @@ def test_user_profile_only_own_profile(client):
     api_client = APIClient()
     api_client.cookies['access_token'] = access_token
     
-    url = reverse('user-profile-detail', kwargs={'pk': user2.id})
-    response = api_client.get(url)
+    response = api_client.get(reverse('user-profile'))
     
-    assert response.status_code == 404
+    assert response.status_code == 200
+    assert response.data['id'] == user1.id
+    assert api_client.get(f"{reverse('user-profile')}{user2.id}/").status_code == 404
 
 @pytest.mark.django_db
 def test_user_profile_invalid_methods():
@@ -205,3 +205,72 @@ def test_user_profile_invalid_methods():
             return
     
     pytest.skip("User profile endpoints not found or not implemented")
+
+@pytest.mark.django_db
+def test_user_profile_get_without_extra_queries(django_assert_num_queries):
+    """Test that the profile is served from the user loaded by authentication."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    
+    api_client = APIClient()
+    api_client.cookies['access_token'] = str(RefreshToken.for_user(user).access_token)
+    url = reverse('user-profile')
+    api_client.get(url)
+    
+    with django_assert_num_queries(0):
+        response = api_client.get(url)
+    
+    assert response.status_code == 200
+    assert response.data['email'] == 'testuser@test.com'
+
+@pytest.mark.django_db
+def test_user_profile_patch_keeps_other_columns(client):
+    """Test that a partial update does not overwrite columns changed meanwhile."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    User.objects.filter(pk=user.pk).update(last_name='Changed')
+    
+    response = api_client.patch(reverse('user-profile'), {'first_name': 'New'}, format='json')
+    
+    assert response.status_code == 200
+    user.refresh_from_db()
+    assert user.first_name == 'New'
+    assert user.last_name == 'Changed'
+
+
+@pytest.mark.django_db
+def test_user_profile_email_taken_in_other_case(client):
+    """Test that changing the email to another user's address in a different case is rejected."""
+    user = User.objects.create_user(
+        email='testuser@test.com',
+        password='TestPassword123!',
+        username='testuser@test.com',
+        is_active=True
+    )
+    User.objects.create_user(
+        email='other@test.com',
+        password='TestPassword123!',
+        username='other@test.com',
+        is_active=True
+    )
+    
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    
+    response = api_client.patch(reverse('user-profile'), {'email': 'OTHER@test.com'}, format='json')
+    
+    assert response.status_code == 400
+    assert response.data == {'email': ['Email already exists']}
+    user.refresh_from_db()
+    assert user.email == 'testuser@test.com'